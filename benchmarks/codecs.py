@@ -0,0 +1,43 @@
+"""
+## This module's purpose is to compare the JSON codecs of `silbot.codec`
+
+Run it with `python benchmarks/codecs.py`, for every codec installed it prints how many getUpdates responses
+are decoded every second, from `bytes` and from `str` like before, and how many sendMessage requests with an
+inline keyboard are encoded every second
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import samples  # noqa: E402
+from silbot import codec, helper  # noqa: E402
+
+
+def perSecond(function, number):
+    """Returns how many times `function` runs every second, the best of 5 runs"""
+    return number / min(timeit.repeat(function, number=number, repeat=5))
+
+
+def main():
+    response = codec.StdlibCodec.dumpBytes({"ok": True, "result": samples.updates(100)})
+    keyboard = helper.InlineKBMarkup(
+        [helper.inlineKBData("Option " + str(i), "vote:" + str(i)) for i in range(3)],
+        [helper.inlineKBUrl("Website", "https://example.com")],
+    )
+    request = {"chat_id": -1001234567890, "text": "Which one do you prefer? 🗳", "parse_mode": "HTML",
+               "reply_markup": helper.toDict(keyboard)}
+    print("getUpdates response: " + str(len(response)) + " bytes, 100 updates")
+    for name in reversed(codec.available()):
+        backend = codec.CODECS[name]
+        from_bytes = perSecond(lambda: backend.loads(response), 200)
+        from_str = perSecond(lambda: backend.loads(response.decode()), 200)
+        encode = perSecond(lambda: backend.dumpBytes(helper.toBody(request)), 20000)
+        print("  %-7s decode from bytes %6.0f/s, from str %6.0f/s, encode sendMessage %7.0f/s"
+              % (name, from_bytes, from_str, encode))
+
+
+if __name__ == "__main__":
+    main()
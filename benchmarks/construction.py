@@ -0,0 +1,80 @@
+"""
+## This module's purpose is to measure how fast updates are parsed
+
+Run it with `python benchmarks/construction.py`, it prints how many `types.Update` are created every second
+from the sample updates, parsed eagerly and lazily, and lazily reading only the fields used by most handlers.
+The construction is compared with the constructors used before `_known`, that called `hasattr` for every field
+of the dictionary to find the unknown ones: they are rebuilt from the source of `silbot.types`
+"""
+
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import samples  # noqa: E402
+from silbot import types  # noqa: E402
+
+FALLBACK = """        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
+"""
+"""Loop of the constructors that sends the unknown fields to `helper.setExtra`"""
+
+LEGACY_FALLBACK = """        for index, value in self.dict.items():
+            if not hasattr(self, index):
+                helper.setExtra(self, index, helper.setBvar(value))
+"""
+"""The same loop before `_known`"""
+
+LEGACY_LAZY_FALLBACK = """        for index, value in self.dict.items():
+            if not (lazy and index in self._nested) and not hasattr(self, index):
+                helper.setExtra(self, index, helper.setBvar(value))
+"""
+"""The same loop before `_known`, in the classes with nested objects"""
+
+
+def handle(update):
+    """Reads what a typical handler reads"""
+    message = update.message if update.message is not None else update.callback_query.message
+    return message.text, message.chat.id, message.user.id
+
+
+def legacyTypes():
+    """Returns a namespace with the classes of `silbot.types` built with the constructors used before `_known`"""
+    classes = inspect.getsource(types).split("\nclass ")
+    for index, source in enumerate(classes[1:], 1):
+        if FALLBACK not in source:
+            raise RuntimeError("the constructors of silbot.types changed, update FALLBACK")
+        legacy = LEGACY_LAZY_FALLBACK if "    _nested = " in source else LEGACY_FALLBACK
+        classes[index] = source.replace(FALLBACK, legacy)
+    namespace = {"__name__": "legacy_types"}
+    exec(compile("\nclass ".join(classes), "legacy_types", "exec"), namespace)
+    return namespace
+
+
+def throughput(function, raw, repeat=5):
+    """Returns the updates processed every second by `function`, the best of `repeat` runs"""
+    best = min(timeit.repeat(lambda: [function(update) for update in raw], number=1, repeat=repeat))
+    return len(raw) / best
+
+
+def main():
+    raw = samples.updates(3000)
+    legacy = legacyTypes()["Update"]
+    print("updates per second (" + str(len(raw)) + " updates)")
+    for name, lazy in (("eager", False), ("lazy", True)):
+        # The two versions are measured in turns, so a change of the CPU speed affects both
+        before = after = 0
+        for _ in range(3):
+            before = max(before, throughput(lambda update: legacy(update, lazy), raw))
+            after = max(after, throughput(lambda update: types.Update(update, lazy), raw))
+        print("  %-18s %.0f, %.0f before _known (%.2fx)" % (name + ":", after, before, after / before))
+    print("  eager and handler: %.0f" % throughput(lambda update: handle(types.Update(update, False)), raw))
+    print("  lazy and handler:  %.0f" % throughput(lambda update: handle(types.Update(update, True)), raw))
+
+
+if __name__ == "__main__":
+    main()
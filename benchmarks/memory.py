@@ -0,0 +1,40 @@
+"""
+## This module's purpose is to measure the memory used by parsed updates
+
+Run it with `python benchmarks/memory.py`, it prints the bytes allocated for every `types.Update`,
+parsed eagerly and lazily, without counting the decoded dictionaries
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import samples  # noqa: E402
+from silbot import types  # noqa: E402
+
+
+def measure(count, lazy):
+    """Returns the bytes allocated for every update parsed and kept in memory"""
+    raw = samples.updates(count)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = [types.Update(update, lazy) for update in raw]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del parsed
+    return size / count
+
+
+def main():
+    count = 3000
+    print("bytes per Update (" + str(count) + " updates)")
+    print("  eager: %.0f" % measure(count, False))
+    print("  lazy:  %.0f" % measure(count, True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+## This module's purpose is to give realistic updates to the benchmarks
+
+The updates are shaped like the ones sent by botAPI: a text message in a group replying to a photo,
+a callback query from an inline keyboard and a private command
+"""
+
+import copy
+
+USER = {"id": 123456789, "is_bot": False, "first_name": "Mario", "last_name": "Rossi", "username": "mariorossi",
+        "language_code": "it"}
+GROUP = {"id": -1001234567890, "title": "Silbot Group", "username": "silbotgroup", "type": "supergroup"}
+PRIVATE = {"id": 123456789, "first_name": "Mario", "last_name": "Rossi", "username": "mariorossi", "type": "private"}
+PHOTO = [
+    {"file_id": "AgACAgQAAxkBAAIBY2N" + str(size), "file_unique_id": "AQADq7kxG" + str(size), "file_size": size * 40,
+     "width": size, "height": size * 3 // 4}
+    for size in (90, 320, 800, 1280)
+]
+KEYBOARD = {"inline_keyboard": [[{"text": "Yes", "callback_data": "vote:yes"}, {"text": "No", "callback_data": "vote:no"}],
+                                [{"text": "Website", "url": "https://example.com"}]]}
+
+GROUP_REPLY = {
+    "update_id": 100000001,
+    "message": {
+        "message_id": 4512, "from": USER, "chat": GROUP, "date": 1672531200, "text": "Nice photo @silbot_bot!",
+        "entities": [{"offset": 11, "length": 11, "type": "mention"}],
+        "reply_to_message": {
+            "message_id": 4511, "from": dict(USER, id=987654321, first_name="Luigi", username="luigi"), "chat": GROUP,
+            "date": 1672531100, "photo": PHOTO, "caption": "Holidays", "reply_markup": KEYBOARD,
+        },
+    },
+}
+CALLBACK = {
+    "update_id": 100000002,
+    "callback_query": {
+        "id": "4382bfdwdsb323b2d9", "from": USER, "chat_instance": "-7341293482745",  "data": "vote:yes",
+        "message": {"message_id": 4513, "from": dict(USER, id=5000000000, is_bot=True, first_name="Silbot"),
+                    "chat": GROUP, "date": 1672531300, "text": "Do you like it?", "reply_markup": KEYBOARD},
+    },
+}
+COMMAND = {
+    "update_id": 100000003,
+    "message": {"message_id": 77, "from": USER, "chat": PRIVATE, "date": 1672531400, "text": "/start ref_42",
+                "entities": [{"offset": 0, "length": 6, "type": "bot_command"}]},
+}
+
+UPDATES = [GROUP_REPLY, CALLBACK, COMMAND]
+"""One update of every kind"""
+
+
+def updates(count):
+    """Returns `count` independent copies of the sample updates, like they were decoded from different responses"""
+    return [copy.deepcopy(UPDATES[i % len(UPDATES)]) for i in range(count)]
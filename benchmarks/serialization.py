@@ -0,0 +1,54 @@
+"""
+## This module's purpose is to measure how fast silbot.types objects are turned into request parameters
+
+Run it with `python benchmarks/serialization.py`, it prints how many objects are converted every second by
+`helper.toDict` for the objects sent most often: inline keyboards, media of albums and inline query results
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from silbot import helper, types  # noqa: E402
+
+
+def keyboard():
+    """Returns an inline keyboard with 3 rows of 2 buttons"""
+    return helper.InlineKBMarkup(*[
+        [helper.inlineKBData("Option " + str(row * 2 + column), "vote:" + str(row * 2 + column)) for column in range(2)]
+        for row in range(3)
+    ])
+
+
+def media():
+    """Returns the media of an album of 4 photos"""
+    return [types.InputMediaPhoto({"type": "photo", "media": "AgACAgQAAxkBAAIBY2N" + str(i), "caption": "Photo " + str(i),
+                                   "parse_mode": "HTML"}) for i in range(4)]
+
+
+def article():
+    """Returns an inline query result with a message and a keyboard"""
+    result = types.InlineQueryResultArticle({"type": "article", "id": "42", "title": "Silbot",
+                                             "description": "Send a message", "thumb_url": "https://example.com/t.jpg"})
+    result.input_message_content = types.InputTextMessageContent({"message_text": "<b>Hi</b>", "parse_mode": "HTML"})
+    result.reply_markup = keyboard()
+    return result
+
+
+def perSecond(function, number=20000):
+    """Returns how many times `function` runs every second, the best of 5 runs"""
+    return number / min(timeit.repeat(function, number=number, repeat=5))
+
+
+def main():
+    markup, album, result = keyboard(), media(), article()
+    print("conversions per second")
+    print("  inline keyboard (6 buttons): %7.0f" % perSecond(lambda: helper.toDict(markup)))
+    print("  album (4 InputMediaPhoto):   %7.0f" % perSecond(lambda: helper.dictList(album)))
+    print("  InlineQueryResultArticle:    %7.0f" % perSecond(lambda: helper.toDict(result)))
+
+
+if __name__ == "__main__":
+    main()
@@ -105,6 +105,29 @@ class RedisDBManager(database.DatabaseManager):
         """
         self.db.hset(chat.id, column, value)
 
+    def getFileId(self, key):
+        """Returns a file_id cached by silbot.filecache.DatabaseStorage
+
+        Args:
+
+        - key (str): key of the file
+        """
+        file_id = self.db.hget("file_ids", key)
+        return file_id.decode("utf8") if file_id is not None else None
+
+    def setFileId(self, key, file_id):
+        """Stores a file_id cached by silbot.filecache.DatabaseStorage, all the file_ids are in the file_ids hash
+
+        Args:
+
+        - key (str): key of the file
+        - file_id (str): file_id to store, None to remove it
+        """
+        if file_id is None:
+            self.db.hdel("file_ids", key)
+        else:
+            self.db.hset("file_ids", key, file_id)
+
     def fromUpdate(self, update: types.Update):
         """This function is optional: given the update it saves all the important information
 
@@ -30,4 +30,5 @@ def HandleUpdate(update: silbot.types.Update, bot: silbot.botapi.BotApi):
                 chat.setColumn("count", messages)
 
 
-silbot.GetUpdatesLoop(bot, HandleUpdate)
+# Updates of the same chat are elaborated in order, so the count read-modify-write does not race
+silbot.GetUpdatesLoop(bot, HandleUpdate, dispatcher=silbot.dispatcher.UpdateDispatcher(ordered=True))
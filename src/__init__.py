@@ -9,10 +9,14 @@ This is a simple framework for [telegram bot API](https://core.telegram.org/bots
 - [__Download__](https://github.com/SilverOS/Silbot-Py/archive/1.4.2.zip)
 
 """
-from silbot import botapi, update
+import asyncio
 
+from silbot import botapi, update, asyncbotapi, dispatcher, polling, webhook, filecache, download, flood, ratelimit, broadcast, retry, codec
 
-def GetUpdatesLoop(bot: botapi.BotApi, handlefunc, onUpdate=None, on_getUpdates=None):
+
+def GetUpdatesLoop(bot: botapi.BotApi, handlefunc, onUpdate=None, on_getUpdates=None,
+                   dispatcher: dispatcher.UpdateDispatcher = None, timeout: int = 30, limit: int = None,
+                   allowed_updates: list = None, prefetch: int = 1, backoff: polling.Backoff = None, on_error=None):
     """ This is a builtin function to handle updates with getUpdates
 
     **Args:**
@@ -23,21 +27,92 @@ def GetUpdatesLoop(bot: botapi.BotApi, handlefunc, onUpdate=None, on_getUpdates=
         - `bot` (`silbot.botapi.BotApi`) : The botApi object for that bot,
     - onUpdate (`function`, optional): a function that is called every update (non async)
     - on_getUpdates (`function`, optional): a function that is called everytime a getUpdates call is done (non async)
+    - dispatcher (`silbot.dispatcher.UpdateDispatcher`, optional): if given, updates are elaborated by its pool of workers instead of starting a thread for every update,
+    and the connection pool of the bot is enlarged to the number of workers
+    - timeout (`int`, optional): long polling timeout in seconds, botAPI keeps the request open until an update arrives or the timeout expires. Use `0` for short polling. Defaults to `30`
+    - limit (`int`, optional): maximum number of updates received by every getUpdates call, 1-100. Defaults to `None` (100)
+    - allowed_updates (`list`, optional): list of the update types you want your bot to receive. Defaults to `None` (the previous setting)
+    - prefetch (`int`, optional): number of batches that can be received while the previous ones are being dispatched,
+    the next getUpdates is done by another thread as soon as a batch is received. Use `0` to poll only after a batch is dispatched. Defaults to `1`
+    - backoff (`silbot.polling.Backoff`, optional): exponential backoff used when getUpdates fails. Defaults to `Backoff()`
+    - on_error (`function`, optional): a function that is called when getUpdates fails with the error state (ex. `connection_error`, `flood`, `conflict`), the `BotAPIResponse` and the seconds that will be waited
     If this is not clear, check the examples
+
+    **Raises:**
+
+    - `silbot.response.BotAPIError`: if the token is not valid
+    """
+    if dispatcher is not None:
+        # Every worker and the poller can have a request in flight
+        bot.growPool(dispatcher.workers + 1)
+    if prefetch > 0:
+        poller = polling.UpdatePoller(bot, timeout, limit, allowed_updates, on_getUpdates, prefetch, backoff, on_error)
+        poller.start()
+        batches = iter(poller.get, None)
+    else:
+        batches = polling.pollUpdates(bot, timeout, limit, allowed_updates, on_getUpdates, backoff, on_error)
+    for batch in batches:
+        for up in batch:
+            if onUpdate is not None:
+                onUpdate()
+            if dispatcher is not None:
+                dispatcher.submit(up, bot, handlefunc)
+            else:
+                thread = update.update(up, bot, handlefunc)
+                thread.start()
+
+
+async def AsyncGetUpdatesLoop(bot: asyncbotapi.AsyncBotApi, handlefunc, onUpdate=None, on_getUpdates=None,
+                              max_concurrency: int = 100, timeout: int = 30, limit: int = None,
+                              allowed_updates: list = None, backoff: polling.Backoff = None, on_error=None):
+    """ This is a builtin coroutine to handle updates with getUpdates using asyncio
+
+    Every update is handled in its own task, but at most `max_concurrency` handlers run at the same time:
+    when the limit is reached no new updates are requested until a handler finishes.
+    Run it with `asyncio.run(silbot.AsyncGetUpdatesLoop(bot, handlefunc))`
+
+    **Args:**
+
+    - bot (`AsyncBotApi`): AsyncBotApi object
+    - handlefunc (`coroutine function`): coroutine function **defined by the user**, that function has to accept there arguments:
+        - `update` (`silbot.types.update`) : The object that rapresents the update
+        - `bot` (`silbot.asyncbotapi.AsyncBotApi`) : The AsyncBotApi object for that bot,
+    - onUpdate (`function`, optional): a function that is called every update (non async)
+    - on_getUpdates (`function`, optional): a function that is called everytime a getUpdates call is done (non async)
+    - max_concurrency (`int`, optional): maximum number of handlers running at the same time. Defaults to `100`
+    - timeout (`int`, optional): long polling timeout in seconds, botAPI keeps the request open until an update arrives or the timeout expires. Use `0` for short polling. Defaults to `30`
+    - limit (`int`, optional): maximum number of updates received by every getUpdates call, 1-100. Defaults to `None` (100)
+    - allowed_updates (`list`, optional): list of the update types you want your bot to receive. Defaults to `None` (the previous setting)
+    - backoff (`silbot.polling.Backoff`, optional): exponential backoff used when getUpdates fails. Defaults to `Backoff()`
+    - on_error (`function`, optional): a function that is called when getUpdates fails with the error state (ex. `connection_error`, `flood`, `conflict`), the `BotAPIResponse` and the seconds that will be waited
+
+    **Raises:**
+
+    - `silbot.response.BotAPIError`: if the token is not valid
     """
+    if backoff is None:
+        backoff = polling.Backoff()
+    bot.growPool(max_concurrency + 1)
     offset = -1
+    tasks = set()
     while True:
-        response = bot.getUpdates(offset)[1]
+        while len(tasks) >= max_concurrency:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        free = min(limit or 100, max_concurrency - len(tasks))
+        try:
+            response = (await bot.getUpdates(offset, free, timeout, allowed_updates))[1]
+        except (ValueError, KeyError):
+            response = polling.invalidResponse()
         if on_getUpdates is not None:
             on_getUpdates()
-        js = response.decoded
-        if js["ok"]:
-            if len(js["result"]) > 0:
-                for up in js["result"]:
-                    if onUpdate is not None:
-                        onUpdate()
-                    offset = up["update_id"] + 1
-                    thread = update.update(up, bot, handlefunc)
-                    thread.start()
-        else:
+        if not response.ok:
+            await asyncio.sleep(polling.errorDelay(response, backoff, on_error))
             continue
+        backoff.reset()
+        for up in response.decoded["result"]:
+            if onUpdate is not None:
+                onUpdate()
+            offset = up["update_id"] + 1
+            task = asyncio.ensure_future(update.asyncUpdate(up, bot, handlefunc))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
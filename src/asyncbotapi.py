@@ -0,0 +1,342 @@
+"""
+## In this module there is the AsyncBotApi class, the asyncio version of [botapi](botapi.m.html)
+
+Every botApi method of `BotApi` is available as a coroutine, so a single process can keep many requests in flight.
+It requires [aiohttp](https://pypi.org/project/aiohttp/), install it with `pip install aiohttp`
+"""
+
+import asyncio
+import os
+
+from silbot import types, helper, codec, upload, filecache, download, flood, ratelimit, retry
+from silbot.botapi import BotApi, webhook_reply
+from silbot.response import BotAPIError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncBotApi(BotApi):
+    """
+    Class to send requests to botAPI with asyncio
+
+    Every method works like in `BotApi` but has to be awaited, ex. `r, response = await bot.sendMessage(chat_id, text)`
+    """
+
+    def __init__(self, token, default_parse_mode: str = None, default_disable_web_preview: bool = None,
+                 default_disable_notifications: bool = None, timeout: float = 10, request_method: str = "POST",
+                 chunk_size: int = 65536, connection_limit: int = 100, file_cache: filecache.FileIdCache = None,
+                 flood_control: flood.FloodControl = None, rate_limiter: ratelimit.RateLimiter = None,
+                 connection_limit_per_host: int = 0, keep_alive: bool = True, keepalive_timeout: float = 15,
+                 retry_policy: retry.RetryPolicy = None, base_url: str = None, unix_socket: str = None,
+                 local_files: bool = False):
+        """Creates an asyncio botApi by the given token
+
+        The HTTP session is created on the first request, so the object can be created outside of the event loop
+        - - - - -
+        **Args**:
+
+        - `token` (`str`): bot's API Token given by [@botfather](https://t.me/botfather)
+        - `default_parse_mode` (`str`, *optional*): Can be None, Markdown or HTML, it is used in functions if parse_mode is not specified. Defaults to `None`.
+        - `default_disable_web_preview` (`bool`, *optional*): It is used in functions if disable_web_page_preview is not specified. Defaults to `None`.
+        - `default_disable_notifications` (`bool`, *optional*): It is used in functions if disable_notifications is not specified. Defaults to `None`.
+        - `timeout` (`float`, *optional*): Seconds to wait for botAPI to answer a request, the long polling timeout of getUpdates is added to it. Defaults to `10`.
+        - `request_method` (`str`, *optional*): `POST` sends the arguments as a JSON body, `GET` sends them in the query string. Defaults to `POST`.
+        - `chunk_size` (`int`, *optional*): Size in bytes of the chunks read from files while they are uploaded. Defaults to `65536`.
+        - `connection_limit` (`int`, *optional*): Maximum number of simultaneous connections kept in the pool. Defaults to `100`.
+        - `file_cache` (`silbot.filecache.FileIdCache`, *optional*): If given, files already uploaded are sent again with their `file_id`. Files are hashed in a thread. Defaults to `None`.
+        - `flood_control` (`silbot.flood.FloodControl`, *optional*): Holds and repeats the requests after flood errors. Defaults to `FloodControl()`.
+        - `rate_limiter` (`silbot.ratelimit.RateLimiter`, *optional*): If given, messages wait until they can be sent without exceeding the limits of botAPI. Defaults to `None`.
+        - `connection_limit_per_host` (`int`, *optional*): Maximum number of simultaneous connections to the same host, `0` for no limit. Defaults to `0`.
+        - `keep_alive` (`bool`, *optional*): If `True` connections are reused by the next requests, saving the TCP and TLS handshakes. Defaults to `True`.
+        - `keepalive_timeout` (`float`, *optional*): Seconds an unused connection is kept open. Defaults to `15`.
+        - `retry_policy` (`silbot.retry.RetryPolicy`, *optional*): Decides which requests are repeated after network errors. Defaults to `RetryPolicy()`.
+        - `base_url` (`str`, *optional*): Address of botAPI, change it to use a local Bot API server. Defaults to `https://api.telegram.org`, or `http://localhost` with `unix_socket`.
+        - `unix_socket` (`str`, *optional*): Path of a Unix socket where every request is sent. Defaults to `None`.
+        - `local_files` (`bool`, *optional*): If `True` files given by path are sent as `file://` URIs to a local Bot API server. Defaults to `False`.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncBotApi requires aiohttp, install it with pip install aiohttp")
+        BotApi.__init__(self, token, default_parse_mode, default_disable_web_preview, default_disable_notifications,
+                        timeout, request_method, chunk_size, file_cache, flood_control, rate_limiter,
+                        keep_alive=keep_alive, retry_policy=retry_policy, base_url=base_url, unix_socket=unix_socket,
+                        local_files=local_files)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.connections = 0
+        """Number of connections opened, every one is a pool miss"""
+        self.reused = 0
+        """Number of requests sent on a connection already open, the pool hits"""
+        self.session = None
+
+    def getSession(self):
+        """Returns the `aiohttp.ClientSession` used by this bot, creating it if needed
+
+        **Returns**
+        - `aiohttp.ClientSession` shared by every request of this bot
+        """
+        if self.session is None or self.session.closed:
+            if self.keep_alive:
+                options = {"keepalive_timeout": self.keepalive_timeout}
+            else:
+                options = {"force_close": True}
+            if self.unix_socket is not None:
+                connector = aiohttp.UnixConnector(self.unix_socket, limit=self.connection_limit,
+                                                  limit_per_host=self.connection_limit_per_host, **options)
+            else:
+                connector = aiohttp.TCPConnector(limit=self.connection_limit,
+                                                 limit_per_host=self.connection_limit_per_host, **options)
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self.onConnectionCreate)
+            trace.on_connection_reuseconn.append(self.onConnectionReuse)
+            self.session = aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+        return self.session
+
+    async def onConnectionCreate(self, session, context, params):
+        """Counts the connections opened, the main utility of this function is internal"""
+        self.connections += 1
+
+    async def onConnectionReuse(self, session, context, params):
+        """Counts the requests sent on a pooled connection, the main utility of this function is internal"""
+        self.reused += 1
+
+    def growPool(self, concurrency: int):
+        """Makes the pool big enough for `concurrency` requests at the same time, it is called by `AsyncGetUpdatesLoop`
+
+        The new limit is used by the next session, so call it before sending requests
+        - - - - -
+        **Args**:
+        - `concurrency` (`int`): number of tasks that send requests at the same time
+        """
+        if self.connection_limit and concurrency > self.connection_limit:
+            self.connection_limit = concurrency
+
+    def poolStats(self):
+        """Returns the statistics of the connection pool
+        - - - - -
+        **Returns**
+        - `dict` with `maxsize`, `connections` (connections opened, every one is a pool miss), `requests` and `reused` (requests sent on a connection already open, the pool hits)
+        """
+        return {"maxsize": self.connection_limit, "connections": self.connections,
+                "requests": self.connections + self.reused, "reused": self.reused}
+
+    async def closeSession(self):
+        """Closes the HTTP session and its pooled connections, call this before the event loop is closed"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.closeSession()
+
+    async def sendRequest(self, method, arguments=None):
+        """Sends a request to botAPI, with a JSON body or a query string according to `request_method`
+        If there is a `types.InputFile` in the arguments the request is sent as a streamed multipart/form-data body
+        Requests to a chat that received a flood error wait its `retry_after`, and requests refused for flood are sent again, see `flood_control`
+        Messages wait until they can be sent without exceeding the limits of botAPI if there is a `rate_limiter`
+        Using this coroutine you can send custom requests to botAPI
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`, *optional*): A `dict` whose keys are request's parameters and the values are parameters values. Defaults to `{}`.
+        **Returns**
+        - `bytes` botAPI's JSON response
+        """
+        if arguments is None:
+            arguments = {}
+        key = flood.chatKey(arguments)
+        attempt = 0
+        while True:
+            delay = self.flood_control.delay(key)
+            if delay > self.flood_control.max_wait:
+                return self.flood_control.refusal(key)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                self.flood_control.throttled(delay)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.asyncWait(method, arguments)
+            raw_json = await self.cachedRequest(method, arguments)
+            retry_after = flood.retryAfter(raw_json)
+            if retry_after is None or not flood.replayable(arguments) or \
+                    not self.flood_control.park(key, retry_after, attempt, raw_json):
+                return raw_json
+            attempt += 1
+
+    async def cachedRequest(self, method, arguments):
+        """Sends a request using the `file_id`s of `file_cache`, see `BotApi.cachedRequest`"""
+        if self.file_cache is None:
+            return await self.httpRequest(method, arguments)
+        loop = asyncio.get_running_loop()
+        cached, hits, misses = await loop.run_in_executor(None, self.file_cache.lookup, arguments,
+                                                          self.token.split(":")[0])
+        if hits:
+            raw_json = await self.httpRequest(method, cached)
+            if not self.file_cache.rejected(raw_json):
+                await loop.run_in_executor(None, self.file_cache.store, misses, raw_json)
+                return raw_json
+            # The cached file_ids are no longer valid, the files are uploaded again
+            await loop.run_in_executor(None, self.file_cache.forget, hits)
+            misses += hits
+        raw_json = await self.httpRequest(method, arguments)
+        await loop.run_in_executor(None, self.file_cache.store, misses, raw_json)
+        return raw_json
+
+    async def httpRequest(self, method, arguments):
+        """Sends the HTTP request of `sendRequest`, repeating it after network errors according to `retry_policy`, see `BotApi.httpRequest`"""
+        attempt = 0
+        while True:
+            try:
+                status, raw_json = await self.rawRequest(method, arguments)
+            except Exception as e:
+                kind = retry.classifyException(e)
+                raw_json = codec.dumpBytes({"ok": False, "connection_error": True})
+            else:
+                if status < 500:
+                    return raw_json
+                kind = retry.SERVER
+                raw_json = retry.serverError(status, raw_json)
+            if not self.retry_policy.shouldRetry(method, kind, attempt) or not flood.replayable(arguments):
+                return raw_json
+            await self.retry_policy.asyncWait(attempt)
+            attempt += 1
+
+    async def rawRequest(self, method, arguments):
+        """Sends a single HTTP request to botAPI, see `BotApi.rawRequest`
+        - - - - -
+        **Raises**
+        - `aiohttp.ClientError` or `asyncio.TimeoutError`: if there is a network error
+        """
+        url = self.apiUrl(method)
+        timeout = aiohttp.ClientTimeout(total=self.requestTimeout(method, arguments), sock_connect=self.timeout)
+        if self.local_files:
+            arguments = upload.localFiles(arguments)
+        stream = upload.multipart(arguments, self.chunk_size)
+        if stream is not None:
+            # An upload can last longer than `timeout`, like in BotApi only the connection and the answer are limited
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout,
+                                            sock_read=self.requestTimeout(method, arguments))
+            request = self.getSession().post(url, data=stream.aiter(), timeout=timeout, headers=stream.headers())
+        elif self.request_method == "GET":
+            request = self.getSession().get(url, params=helper.toParams(arguments), timeout=timeout)
+        else:
+            request = self.getSession().post(url, data=codec.dumpBytes(helper.toBody(arguments)), timeout=timeout,
+                                             headers={"Content-Type": "application/json"})
+        async with request as r:
+            return r.status, await r.read()
+
+    def inline(self):
+        """Returns an AsyncBotApi whose next request is sent in the response of the current webhook request, see `BotApi.inline`
+
+        The methods still have to be awaited, ex. `await bot.inline().sendMessage(chat_id, "Hi")`
+        - - - - -
+        **Returns**
+        - `AsyncInlineReply` that shares the settings of this bot
+        """
+        return AsyncInlineReply(self)
+
+    async def fileInfo(self, file):
+        """Returns the `types.File` to download, calling getFile if needed, see `BotApi.fileInfo`"""
+        if isinstance(file, types.File) and file.file_path is not None:
+            return file
+        file_id = file if type(file) == str else file.file_id
+        result, response = await self.getFile(file_id)
+        if not response.ok:
+            raise BotAPIError(response)
+        if result.file_path is None:
+            raise download.missingPathError(result)
+        return result
+
+    async def fileChunks(self, file: types.File, chunk_size: int, offset: int = 0):
+        """Starts the download of a file, see `BotApi.fileChunks`
+        - - - - -
+        **Returns**
+        - `async generator` of `bytes` from `offset`
+        """
+        if download.isComplete(file, offset):
+            return download.aempty()
+        path = download.localPath(file)
+        if path is not None:
+            return download.areadChunks(path, chunk_size, offset)
+        # The download can last longer than `timeout`, which is only used between two chunks
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        r = await self.getSession().get(download.fileUrl(self.base_url, self.token, file.file_path),
+                                        headers=download.rangeHeaders(offset), timeout=timeout)
+        if r.status not in (200, 206):
+            text = await r.text()
+            r.release()
+            raise download.downloadError(r.status, text)
+        skip = offset if r.status == 200 else 0
+        return download.askipChunks(r.content.iter_chunked(chunk_size), skip, r.release)
+
+    async def downloadFile(self, file, destination=None, chunk_size: int = None, offset: int = 0,
+                           resume: bool = False, cache_dir: str = None):
+        """Downloads a file sent to the bot, streaming it in chunks, see `BotApi.downloadFile`
+
+        If `destination` is `None` an async generator is returned, ex. `async for chunk in await bot.downloadFile(file)`
+        - - - - -
+        **Returns**
+        - `destination`, or an `async generator` of `bytes` if `destination` is `None`
+        **Raises**
+        - `BotAPIError`: if getFile fails or botAPI refuses the download
+        - `aiohttp.ClientError`: if there is a connection error
+        """
+        file = await self.fileInfo(file)
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+        if resume and isinstance(destination, (str, os.PathLike)) and os.path.exists(destination):
+            offset = os.path.getsize(destination)
+        if cache_dir is None:
+            return await download.asave(await self.fileChunks(file, chunk_size, offset), destination, offset)
+        path = download.cachePath(cache_dir, file)
+        if not os.path.exists(path):
+            temp = download.tempPath(path)
+            try:
+                await download.asave(await self.fileChunks(file, chunk_size), temp)
+                os.replace(temp, path)
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+        return await download.asave(download.areadChunks(path, chunk_size, offset), destination, offset)
+
+    async def response(self, raw_json, func):
+        """Awaits a request and creates a botAPIResponse object for its JSON
+        - - - - -
+        **Args**:
+        - `raw_json` (`coroutine`): `sendRequest` coroutine that returns the result from botAPI
+        - `func` (`silbot.types` class or builtin data value): Expected result from botAPI
+        **Returns**
+        - `tuple` containing the expected result as object as first argument and the `BotAPIResponse` object as second
+        """
+        return BotApi.response(await raw_json, func)
+
+
+class AsyncInlineReply(AsyncBotApi):
+    """
+    AsyncBotApi whose request is sent in the response of the current webhook request, see `AsyncBotApi.inline`
+    """
+
+    def __init__(self, bot: AsyncBotApi):
+        self.__dict__.update(bot.__dict__)
+        self.bot = bot
+
+    async def sendRequest(self, method, arguments=None):
+        """Stores the request as the answer of the current webhook request, or sends it with the bot if that is not possible
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`, *optional*): A `dict` whose keys are request's parameters and the values are parameters values. Defaults to `{}`.
+        **Returns**
+        - `bytes` botAPI's JSON response, `{"ok": true, "result": true}` if the request was stored
+        """
+        if arguments is None:
+            arguments = {}
+        reply = webhook_reply.get()
+        if reply is not None and reply.take(method, arguments):
+            return codec.dumpBytes({"ok": True, "result": True})
+        return await self.bot.sendRequest(method, arguments)
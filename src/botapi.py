@@ -2,19 +2,31 @@
 ## In this module there is the botApi class, whose purpose is to send requests
 """
 
+import contextvars
+import os
+import time
 import requests
-import json
-from silbot import types, helper
-from silbot.response import BotAPIResponse
+import requests.adapters
+from silbot import types, helper, codec, upload, filecache, download, flood, ratelimit, retry, transport
+from silbot.response import BotAPIResponse, BotAPIError
 from typing import Union
 
+webhook_reply = contextvars.ContextVar("webhook_reply", default=None)
+"""`WebhookReply` of the webhook request that is being elaborated, it is set by `silbot.webhook.WebhookServer`"""
+
+
 class BotApi:
     """
     Class to send requests to botAPI
     """
 
     def __init__(self, token, default_parse_mode: str = None, default_disable_web_preview: bool = None,
-                 default_disable_notifications: bool = None):
+                 default_disable_notifications: bool = None, timeout: float = 10, request_method: str = "POST",
+                 chunk_size: int = 65536, file_cache: filecache.FileIdCache = None,
+                 flood_control: flood.FloodControl = None, rate_limiter: ratelimit.RateLimiter = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True,
+                 retry_policy: retry.RetryPolicy = None, base_url: str = None, unix_socket: str = None,
+                 local_files: bool = False):
         """Creates a botApi by the given token
 
         Using this class you can easily send requests to botApi and use the response
@@ -25,39 +37,350 @@ class BotApi:
         - `default_parse_mode` (`str`, *optional*): Can be None, Markdown or HTML, it is used in functions if parse_mode is not specified. Defaults to `None`.
         - `default_disable_web_preview` (`bool`, *optional*): It is used in functions if disable_web_page_preview is not specified. Defaults to `None`.
         - `default_disable_notifications` (`bool`, *optional*): It is used in functions if disable_notifications is not specified. Defaults to `None`.
+        - `timeout` (`float`, *optional*): Seconds to wait for botAPI to answer a request, the long polling timeout of getUpdates is added to it. Defaults to `10`.
+        - `request_method` (`str`, *optional*): `POST` sends the arguments as a JSON body, `GET` sends them in the query string. Defaults to `POST`.
+        - `chunk_size` (`int`, *optional*): Size in bytes of the chunks read from files while they are uploaded. Defaults to `65536`.
+        - `file_cache` (`silbot.filecache.FileIdCache`, *optional*): If given, files already uploaded are sent again with their `file_id`. Defaults to `None`.
+        - `flood_control` (`silbot.flood.FloodControl`, *optional*): Holds and repeats the requests after flood errors. Defaults to `FloodControl()`.
+        - `rate_limiter` (`silbot.ratelimit.RateLimiter`, *optional*): If given, messages wait until they can be sent without exceeding the limits of botAPI. Defaults to `None`.
+        - `pool_connections` (`int`, *optional*): Number of hosts whose connections are kept in the pool. Defaults to `10`.
+        - `pool_maxsize` (`int`, *optional*): Maximum number of connections kept open to the same host, it should be at least the number of threads that send requests at the same time. Defaults to `10`.
+        - `pool_block` (`bool`, *optional*): If `True`, when `pool_maxsize` connections are in use the next requests wait for a free one instead of opening a connection that is discarded afterwards. Defaults to `False`.
+        - `keep_alive` (`bool`, *optional*): If `True` connections are reused by the next requests, saving the TCP and TLS handshakes. Defaults to `True`.
+        - `retry_policy` (`silbot.retry.RetryPolicy`, *optional*): Decides which requests are repeated after network errors, idempotent methods are always repeated while the others only if they weren't sent. Defaults to `RetryPolicy()`.
+        - `base_url` (`str`, *optional*): Address of botAPI, change it to use a [local Bot API server](https://github.com/tdlib/telegram-bot-api), ex. `http://localhost:8081`. Defaults to `https://api.telegram.org`, or `http://localhost` with `unix_socket`.
+        - `unix_socket` (`str`, *optional*): Path of a Unix socket where every request is sent, the host of `base_url` is only used in the Host header. Defaults to `None`.
+        - `local_files` (`bool`, *optional*): If `True` files given by path are not uploaded but sent as `file://` URIs, a local Bot API server started with `--local` reads them from the disk. Defaults to `False`.
         """
         self.default_parse_mode = default_parse_mode
         self.default_disable_web_preview = default_disable_web_preview
         self.default_disable_notifications = default_disable_notifications
 
         self.token = token
+        self.timeout = timeout
+        self.request_method = request_method.upper()
+        self.chunk_size = chunk_size
+        self.file_cache = file_cache
+        self.flood_control = flood_control if flood_control is not None else flood.FloodControl()
+        self.rate_limiter = rate_limiter
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy if retry_policy is not None else retry.RetryPolicy()
+        self.unix_socket = unix_socket
+        if base_url is None:
+            base_url = "http://localhost" if unix_socket is not None else "https://api.telegram.org"
+        self.base_url = base_url.rstrip("/")
+        self.local_files = local_files
         self.session = requests.Session()
+        self.configurePool(pool_maxsize)
+
+    def configurePool(self, pool_maxsize: int, pool_connections: int = None, pool_block: bool = None):
+        """Replaces the connection pool of `session`, call it before sending requests because open connections are closed
+        - - - - -
+        **Args**:
+        - `pool_maxsize` (`int`): Maximum number of connections kept open to the same host
+        - `pool_connections` (`int`, *optional*): Number of hosts whose connections are kept. Defaults to the current value.
+        - `pool_block` (`bool`, *optional*): If `True` requests wait for a free connection. Defaults to the current value.
+        """
+        self.pool_maxsize = pool_maxsize
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_block is not None:
+            self.pool_block = pool_block
+        for adapter in set(self.session.adapters.values()):
+            adapter.close()
+        if self.unix_socket is not None:
+            adapter = transport.UnixAdapter(self.unix_socket, pool_connections=self.pool_connections,
+                                            pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        else:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_connections,
+                                                    pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if self.keep_alive:
+            self.session.headers["Connection"] = "keep-alive"
+        else:
+            self.session.headers["Connection"] = "close"
+
+    def growPool(self, concurrency: int):
+        """Makes the pool big enough for `concurrency` requests at the same time, it is called by the update loops with the number of workers
+        - - - - -
+        **Args**:
+        - `concurrency` (`int`): number of threads or tasks that send requests at the same time
+        """
+        if concurrency > self.pool_maxsize:
+            self.configurePool(concurrency)
+
+    def poolStats(self):
+        """Returns the statistics of the connection pool
+        - - - - -
+        **Returns**
+        - `dict` with `maxsize`, `connections` (connections opened, every one is a pool miss), `requests`, `reused` (requests sent on a connection already open, the pool hits) and `idle` (open connections waiting for a request)
+        """
+        stats = {"maxsize": self.pool_maxsize, "connections": 0, "requests": 0, "reused": 0, "idle": 0}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats["connections"] += pool.num_connections
+                stats["requests"] += pool.num_requests
+                if pool.pool is not None:
+                    # The free slots of the pool are filled with None
+                    stats["idle"] += len([conn for conn in list(pool.pool.queue) if conn is not None])
+        stats["reused"] = max(0, stats["requests"] - stats["connections"])
+        return stats
 
     def sendRequest(self, method, arguments=None):
-        """Sends a GET request to botAPI
+        """Sends a request to botAPI, with a JSON body or a query string according to `request_method`
+        If there is a `types.InputFile` in the arguments the request is sent as a streamed multipart/form-data body
+        Requests to a chat that received a flood error wait its `retry_after`, and requests refused for flood are sent again, see `flood_control`
+        Messages wait until they can be sent without exceeding the limits of botAPI if there is a `rate_limiter`
         Using this function you can send custom requests to botAPI
         - - - - -
         **Args**:
         - `method` (`str`): request method, like sendMessage
         - `arguments` (`dict`, *optional*): A `dict` whose keys are request's parameters and the values are parameters values. Defaults to `{}`.
         **Returns**
-        - `str` botAPI's string response
+        - `bytes` botAPI's JSON response
         """
         if arguments is None:
             arguments = {}
-        try:
-            r = self.session.get("https://api.telegram.org/bot" + self.token + "/" + method, params=arguments, timeout=10)
-        except Exception:
-            return json.dumps({"ok": False, "connection_error": True})
+        key = flood.chatKey(arguments)
+        attempt = 0
+        while True:
+            delay = self.flood_control.delay(key)
+            if delay > self.flood_control.max_wait:
+                return self.flood_control.refusal(key)
+            if delay > 0:
+                time.sleep(delay)
+                self.flood_control.throttled(delay)
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait(method, arguments)
+            raw_json = self.cachedRequest(method, arguments)
+            retry_after = flood.retryAfter(raw_json)
+            if retry_after is None or not flood.replayable(arguments) or \
+                    not self.flood_control.park(key, retry_after, attempt, raw_json):
+                return raw_json
+            attempt += 1
+
+    def cachedRequest(self, method, arguments):
+        """Sends a request using the `file_id`s of `file_cache` instead of the files already uploaded, the main utility of this function is internal
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`): request's parameters
+        **Returns**
+        - `bytes` botAPI's JSON response
+        """
+        if self.file_cache is None:
+            return self.httpRequest(method, arguments)
+        cached, hits, misses = self.file_cache.lookup(arguments, self.token.split(":")[0])
+        if hits:
+            raw_json = self.httpRequest(method, cached)
+            if not self.file_cache.rejected(raw_json):
+                self.file_cache.store(misses, raw_json)
+                return raw_json
+            # The cached file_ids are no longer valid, the files are uploaded again
+            self.file_cache.forget(hits)
+            misses += hits
+        raw_json = self.httpRequest(method, arguments)
+        self.file_cache.store(misses, raw_json)
+        return raw_json
+
+    def httpRequest(self, method, arguments):
+        """Sends the HTTP request of `sendRequest`, repeating it after network errors according to `retry_policy`, the main utility of this function is internal
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`): request's parameters
+        **Returns**
+        - `bytes` botAPI's JSON response, `{"ok": false, "connection_error": true}` if botAPI couldn't be reached
+        """
+        attempt = 0
+        while True:
+            try:
+                status, raw_json = self.rawRequest(method, arguments)
+            except Exception as e:
+                kind = retry.classifyException(e)
+                raw_json = codec.dumpBytes({"ok": False, "connection_error": True})
+            else:
+                if status < 500:
+                    return raw_json
+                kind = retry.SERVER
+                raw_json = retry.serverError(status, raw_json)
+            if not self.retry_policy.shouldRetry(method, kind, attempt) or not flood.replayable(arguments):
+                return raw_json
+            self.retry_policy.wait(attempt)
+            attempt += 1
+
+    def rawRequest(self, method, arguments):
+        """Sends a single HTTP request to botAPI, the main utility of this function is internal
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`): request's parameters
+        **Returns**
+        - `tuple` with the HTTP status as first member and botAPI's JSON response, as `bytes`, as second member
+        **Raises**
+        - `requests.RequestException`: if there is a network error
+        """
+        url = self.apiUrl(method)
+        timeout = self.requestTimeout(method, arguments)
+        if self.local_files:
+            arguments = upload.localFiles(arguments)
+        stream = upload.multipart(arguments, self.chunk_size)
+        if stream is not None:
+            r = self.session.post(url, data=stream, timeout=timeout, headers=stream.headers())
+        elif self.request_method == "GET":
+            r = self.session.get(url, params=helper.toParams(arguments), timeout=timeout)
         else:
-            return r.text
+            r = self.session.post(url, data=codec.dumpBytes(helper.toBody(arguments)), timeout=timeout,
+                                  headers={"Content-Type": "application/json"})
+        return r.status_code, r.content
+
+    def apiUrl(self, method):
+        """Returns the URL of a botAPI method
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        **Returns**
+        - `str` URL made of `base_url`, the token and the method
+        """
+        return self.base_url + "/bot" + self.token + "/" + method
+
+    def requestTimeout(self, method, arguments):
+        """Returns how many seconds to wait for the answer of a request
+
+        For getUpdates the long polling `timeout` is added to `self.timeout`, so the HTTP request doesn't expire before botAPI answers
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`): request's parameters
+        **Returns**
+        - `float` timeout of the HTTP request
+        """
+        if method == "getUpdates" and arguments.get("timeout"):
+            return self.timeout + arguments["timeout"]
+        return self.timeout
+
+    def inline(self):
+        """Returns a botApi whose next request is sent in the response of the current webhook request
+
+        When an update is received by `silbot.webhook.WebhookServer`, one method can be sent to botAPI as the body
+        of the webhook response instead of with a new request, ex. `bot.inline().sendMessage(chat_id, "Hi")`.
+        The method returns `True` instead of the sent object, because botAPI doesn't give a result.
+        If there is no webhook request or a method has already been answered, the request is sent normally
+        - - - - -
+        **Returns**
+        - `InlineReply` that shares the settings of this bot
+        """
+        return InlineReply(self)
+
+    def priority(self, name: str):
+        """Returns a context manager that sets the priority of the requests sent inside it, see `silbot.ratelimit`
+
+        ex. `with bot.priority(ratelimit.BULK): bot.sendMessage(chat_id, text)`, bulk requests only use the rate
+        budget left free by interactive requests. It has effect only if the bot has a `rate_limiter`
+        - - - - -
+        **Args**:
+        - `name` (`str`): `ratelimit.INTERACTIVE` or `ratelimit.BULK`
+        **Returns**
+        - context manager
+        """
+        return ratelimit.priority(name)
+
+    def fileInfo(self, file):
+        """Returns the `types.File` to download, calling getFile if needed, the main utility of this function is internal
+        - - - - -
+        **Args**:
+        - `file` (`types.File`, `str` file_id or an object with a `file_id`, like `types.Document`): file to download
+        **Returns**
+        - `types.File` with a `file_path`
+        **Raises**
+        - `BotAPIError`: if getFile fails or the file has no `file_path`, because it is too big or not available
+        """
+        if isinstance(file, types.File) and file.file_path is not None:
+            return file
+        file_id = file if type(file) == str else file.file_id
+        result, response = self.getFile(file_id)
+        if not response.ok:
+            raise BotAPIError(response)
+        if result.file_path is None:
+            raise download.missingPathError(result)
+        return result
+
+    def fileChunks(self, file: types.File, chunk_size: int, offset: int = 0):
+        """Starts the download of a file, the main utility of this function is internal
+        - - - - -
+        **Args**:
+        - `file` (`types.File`): file returned by getFile
+        - `chunk_size` (`int`): maximum size in bytes of the chunks
+        - `offset` (`int`, *optional*): first byte to download. Defaults to `0`.
+        **Returns**
+        - `generator` of `bytes` from `offset`
+        **Raises**
+        - `BotAPIError`: if botAPI refuses the download
+        """
+        if download.isComplete(file, offset):
+            return iter(())
+        path = download.localPath(file)
+        if path is not None:
+            return download.readChunks(path, chunk_size, offset)
+        r = self.session.get(download.fileUrl(self.base_url, self.token, file.file_path),
+                             headers=download.rangeHeaders(offset), timeout=self.timeout, stream=True)
+        if r.status_code not in (200, 206):
+            text = r.text
+            r.close()
+            raise download.downloadError(r.status_code, text)
+        # If the Range header is ignored the whole file is sent
+        skip = offset if r.status_code == 200 else 0
+        return download.skipChunks(r.iter_content(chunk_size), skip, r.close)
+
+    def downloadFile(self, file, destination=None, chunk_size: int = None, offset: int = 0, resume: bool = False,
+                     cache_dir: str = None):
+        """Downloads a file sent to the bot, streaming it in chunks
+        - - - - -
+        **Args**:
+        - `file` (`types.File`, `str` file_id or an object with a `file_id`, like `types.PhotoSize`): file to download, getFile is called if there is no `file_path`
+        - `destination` (`str`, `os.PathLike`, binary file object or `None`, *optional*): where the file is written, if `None` a generator of chunks is returned. Defaults to `None`.
+        - `chunk_size` (`int`, *optional*): maximum size in bytes of the chunks. Defaults to the `chunk_size` of the bot.
+        - `offset` (`int`, *optional*): first byte to download, the bytes of `destination` after it are replaced. Defaults to `0`.
+        - `resume` (`bool`, *optional*): if `destination` is a path that already exists, only the missing bytes are downloaded. Defaults to `False`.
+        - `cache_dir` (`str`, *optional*): directory where the downloaded files are kept by `file_unique_id`, files found there are not downloaded again. Defaults to `None`.
+        **Returns**
+        - `destination`, or a `generator` of `bytes` if `destination` is `None`
+        **Raises**
+        - `BotAPIError`: if getFile fails, the file is too big or not available, or botAPI refuses the download
+        - `requests.RequestException`: if there is a connection error
+        """
+        file = self.fileInfo(file)
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+        if resume and isinstance(destination, (str, os.PathLike)) and os.path.exists(destination):
+            offset = os.path.getsize(destination)
+        if cache_dir is None:
+            return download.save(self.fileChunks(file, chunk_size, offset), destination, offset)
+        path = download.cachePath(cache_dir, file)
+        if not os.path.exists(path):
+            temp = download.tempPath(path)
+            try:
+                download.save(self.fileChunks(file, chunk_size), temp)
+                os.replace(temp, path)
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+        return download.save(download.readChunks(path, chunk_size, offset), destination, offset)
 
     @staticmethod
     def response(raw_json, func):
         """Creates a botAPIResponse object for the given JSON
         - - - - -
         **Args**:
-        - `raw_json` (`str`): Result from botAPI
+        - `raw_json` (`bytes` or `str`): Result from botAPI
         - `func` (`silbot.types` class or builtin data value): Expected result from botAPI
         **Returns**
         - `tuple` containing the expected result as object as first argument and the `BotAPIResponse` object as second
@@ -109,7 +432,7 @@ class BotApi:
         """
         data = {
             "url": url,
-            "certificate": helper.toDict(certificate, True),
+            "certificate": helper.toDict(certificate),
             "ip_address": ip_address,
             "max_connections": max_connections,
             "allowed_updates": allowed_updates,
@@ -237,7 +560,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendMessage", data), types.Message)
 
@@ -312,7 +635,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("copyMessage", data), types.MessageId)
 
@@ -347,7 +670,7 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "photo": helper.toDict(photo, True),
+            "photo": helper.toDict(photo),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
@@ -355,7 +678,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendPhoto", data), types.Message)
 
@@ -395,19 +718,19 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "audio": helper.toDict(audio, True),
+            "audio": helper.toDict(audio),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
             "duration": duration,
             "performer": performer,
             "title": title,
-            "thumb": helper.toDict(thumb, True),
+            "thumb": helper.toDict(thumb),
             "disable_notification": disable_notification,
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendAudio", data), types.Message)
 
@@ -444,8 +767,8 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "document": helper.toDict(document, True),
-            "thumb": helper.toDict(thumb, True),
+            "document": helper.toDict(document),
+            "thumb": helper.toDict(thumb),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
@@ -454,7 +777,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendDocument", data), types.Message)
 
@@ -494,11 +817,11 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "video": helper.toDict(video, True),
+            "video": helper.toDict(video),
             "duration": duration,
             "width": width,
             "height": height,
-            "thumb": helper.toDict(thumb, True),
+            "thumb": helper.toDict(thumb),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
@@ -507,7 +830,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendVideo", data), types.Message)
 
@@ -546,11 +869,11 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "animation": helper.toDict(animation, True),
+            "animation": helper.toDict(animation),
             "duration": duration,
             "width": width,
             "height": height,
-            "thumb": helper.toDict(thumb, True),
+            "thumb": helper.toDict(thumb),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
@@ -558,7 +881,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendAnimation", data), types.Message)
 
@@ -594,7 +917,7 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "voice": helper.toDict(voice, True),
+            "voice": helper.toDict(voice),
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
@@ -603,7 +926,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendVoice", data), types.Message)
 
@@ -635,15 +958,15 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "video_note": helper.toDict(video_note, True),
+            "video_note": helper.toDict(video_note),
             "duration": duration,
             "length": length,
-            "thumb": helper.toDict(thumb, True),
+            "thumb": helper.toDict(thumb),
             "disable_notification": disable_notification,
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendVideoNote", data), types.Message)
 
@@ -719,7 +1042,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendLocation", data), types.Message)
 
@@ -752,7 +1075,7 @@ class BotApi:
             "horizontal_accuracy": horizontal_accuracy,
             "heading": heading,
             "proximity_alert_radius": proximity_alert_radius,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("editMessageLiveLocation", data), None)
 
@@ -775,7 +1098,7 @@ class BotApi:
             "chat_id": chat_id,
             "message_id": message_id,
             "inline_message_id": inline_message_id,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("stopMessageLiveLocation", data), None)
 
@@ -823,7 +1146,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendVenue", data), types.Message)
 
@@ -863,7 +1186,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendContact", data), types.Message)
 
@@ -919,7 +1242,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendPoll", data), types.Message)
 
@@ -953,7 +1276,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendDice", data), types.Message)
 
@@ -1077,7 +1400,7 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "user_id": user_id,
-            "permissions": helper.toDict(permissions, True),
+            "permissions": helper.toDict(permissions),
             "until_date": until_date,
         }
         return self.response(self.sendRequest("restrictChatMember", data), bool)
@@ -1199,7 +1522,7 @@ class BotApi:
         """
         data = {
             "chat_id": chat_id,
-            "permissions": helper.toDict(permissions, True),
+            "permissions": helper.toDict(permissions),
         }
         return self.response(self.sendRequest("setChatPermissions", data), bool)
 
@@ -1344,7 +1667,7 @@ class BotApi:
         """
         data = {
             "chat_id": chat_id,
-            "photo": helper.toDict(photo, True),
+            "photo": helper.toDict(photo),
         }
         return self.response(self.sendRequest("setChatPhoto", data), bool)
 
@@ -1764,7 +2087,7 @@ class BotApi:
         """
         data = {
             "commands": commands,
-            "scope": helper.toDict(scope, True),
+            "scope": helper.toDict(scope),
             "language_code": language_code,
         }
         return self.response(self.sendRequest("setMyCommands", data), bool)
@@ -1783,7 +2106,7 @@ class BotApi:
         - A `tuple`, on success a `bool` as first member and a botApiResponse object as second member
         """
         data = {
-            "scope": helper.toDict(scope, True),
+            "scope": helper.toDict(scope),
             "language_code": language_code,
         }
         return self.response(self.sendRequest("deleteMyCommands", data), bool)
@@ -1802,7 +2125,7 @@ class BotApi:
         - A `tuple`, on success a `list` as first member and a botApiResponse object as second member
         """
         data = {
-            "scope": helper.toDict(scope, True),
+            "scope": helper.toDict(scope),
             "language_code": language_code,
         }
         return self.response(self.sendRequest("getMyCommands", data), list)
@@ -1822,7 +2145,7 @@ class BotApi:
         """
         data = {
             "chat_id": chat_id,
-            "menu_button": helper.toDict(menu_button, True),
+            "menu_button": helper.toDict(menu_button),
         }
         return self.response(self.sendRequest("setChatMenuButton", data), bool)
 
@@ -1857,7 +2180,7 @@ class BotApi:
         - A `tuple`, on success a `bool` as first member and a botApiResponse object as second member
         """
         data = {
-            "rights": helper.toDict(rights, True),
+            "rights": helper.toDict(rights),
             "for_channels": for_channels,
         }
         return self.response(self.sendRequest("setMyDefaultAdministratorRights", data), bool)
@@ -1912,7 +2235,7 @@ class BotApi:
             "parse_mode": parse_mode,
             "entities": entities,
             "disable_web_page_preview": disable_web_page_preview,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("editMessageText", data), None)
 
@@ -1944,7 +2267,7 @@ class BotApi:
             "caption": caption,
             "parse_mode": parse_mode,
             "caption_entities": caption_entities,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("editMessageCaption", data), None)
 
@@ -1968,8 +2291,8 @@ class BotApi:
             "chat_id": chat_id,
             "message_id": message_id,
             "inline_message_id": inline_message_id,
-            "media": helper.toDict(media, True),
-            "reply_markup": helper.toDict(reply_markup, True),
+            "media": helper.toDict(media),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("editMessageMedia", data), None)
 
@@ -1992,7 +2315,7 @@ class BotApi:
             "chat_id": chat_id,
             "message_id": message_id,
             "inline_message_id": inline_message_id,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("editMessageReplyMarkup", data), None)
 
@@ -2013,7 +2336,7 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("stopPoll", data), types.Poll)
 
@@ -2061,12 +2384,12 @@ class BotApi:
         data = {
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "sticker": helper.toDict(sticker, True),
+            "sticker": helper.toDict(sticker),
             "disable_notification": disable_notification,
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendSticker", data), types.Message)
 
@@ -2119,7 +2442,7 @@ class BotApi:
         """
         data = {
             "user_id": user_id,
-            "png_sticker": helper.toDict(png_sticker, True),
+            "png_sticker": helper.toDict(png_sticker),
         }
         return self.response(self.sendRequest("uploadStickerFile", data), types.File)
 
@@ -2147,12 +2470,12 @@ class BotApi:
             "user_id": user_id,
             "name": name,
             "title": title,
-            "png_sticker": helper.toDict(png_sticker, True),
-            "tgs_sticker": helper.toDict(tgs_sticker, True),
-            "webm_sticker": helper.toDict(webm_sticker, True),
+            "png_sticker": helper.toDict(png_sticker),
+            "tgs_sticker": helper.toDict(tgs_sticker),
+            "webm_sticker": helper.toDict(webm_sticker),
             "sticker_type": sticker_type,
             "emojis": emojis,
-            "mask_position": helper.toDict(mask_position, True),
+            "mask_position": helper.toDict(mask_position),
         }
         return self.response(self.sendRequest("createNewStickerSet", data), bool)
 
@@ -2177,11 +2500,11 @@ class BotApi:
         data = {
             "user_id": user_id,
             "name": name,
-            "png_sticker": helper.toDict(png_sticker, True),
-            "tgs_sticker": helper.toDict(tgs_sticker, True),
-            "webm_sticker": helper.toDict(webm_sticker, True),
+            "png_sticker": helper.toDict(png_sticker),
+            "tgs_sticker": helper.toDict(tgs_sticker),
+            "webm_sticker": helper.toDict(webm_sticker),
             "emojis": emojis,
-            "mask_position": helper.toDict(mask_position, True),
+            "mask_position": helper.toDict(mask_position),
         }
         return self.response(self.sendRequest("addStickerToSet", data), bool)
 
@@ -2238,7 +2561,7 @@ class BotApi:
         data = {
             "name": name,
             "user_id": user_id,
-            "thumb": helper.toDict(thumb, True),
+            "thumb": helper.toDict(thumb),
         }
         return self.response(self.sendRequest("setStickerSetThumb", data), bool)
 
@@ -2286,7 +2609,7 @@ class BotApi:
         """
         data = {
             "web_app_query_id": web_app_query_id,
-            "result": helper.toDict(result, True),
+            "result": helper.toDict(result),
         }
         return self.response(self.sendRequest("answerWebAppQuery", data), types.SentWebAppMessage)
 
@@ -2360,7 +2683,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendInvoice", data), types.Message)
 
@@ -2513,7 +2836,7 @@ class BotApi:
             "protect_content": protect_content,
             "reply_to_message_id": reply_to_message_id,
             "allow_sending_without_reply": allow_sending_without_reply,
-            "reply_markup": helper.toDict(reply_markup, True),
+            "reply_markup": helper.toDict(reply_markup),
         }
         return self.response(self.sendRequest("sendGame", data), types.Message)
 
@@ -2568,3 +2891,61 @@ class BotApi:
             "inline_message_id": inline_message_id,
         }
         return self.response(self.sendRequest("getGameHighScores", data), list)
+
+
+class WebhookReply:
+    """
+    Holds the method sent in the response of a webhook request
+    """
+
+    def __init__(self):
+        self.answer = None
+        """`dict` with the `method` key and its parameters, `None` if no method has been answered"""
+        self.closed = False
+        """`True` when the webhook response has already been sent"""
+
+    def take(self, method, arguments):
+        """Stores a method as the answer, if the response hasn't been sent and there isn't already an answer
+
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`): request's parameters
+        **Returns**
+        - `bool` True if the method will be sent in the webhook response, requests that upload files are never taken
+        """
+        if self.closed or self.answer is not None:
+            return False
+        body = helper.toBody(arguments)
+        # The webhook response is JSON, files can only be uploaded with multipart/form-data
+        if upload.extractFiles(body)[1]:
+            return False
+        self.answer = body
+        self.answer["method"] = method
+        return True
+
+
+class InlineReply(BotApi):
+    """
+    BotApi whose request is sent in the response of the current webhook request, see `BotApi.inline`
+    """
+
+    def __init__(self, bot: BotApi):
+        self.__dict__.update(bot.__dict__)
+        self.bot = bot
+
+    def sendRequest(self, method, arguments=None):
+        """Stores the request as the answer of the current webhook request, or sends it with the bot if that is not possible
+        - - - - -
+        **Args**:
+        - `method` (`str`): request method, like sendMessage
+        - `arguments` (`dict`, *optional*): A `dict` whose keys are request's parameters and the values are parameters values. Defaults to `{}`.
+        **Returns**
+        - `bytes` botAPI's JSON response, `{"ok": true, "result": true}` if the request was stored
+        """
+        if arguments is None:
+            arguments = {}
+        reply = webhook_reply.get()
+        if reply is not None and reply.take(method, arguments):
+            return codec.dumpBytes({"ok": True, "result": True})
+        return self.bot.sendRequest(method, arguments)
@@ -0,0 +1,256 @@
+"""
+## This module's purpose is to send a message to many chats
+
+`Broadcast` sends the same message to every chat of an iterable or a generator of chat ids, with many requests
+in flight at the same time. The requests have the `BULK` priority of `silbot.ratelimit`, so if the bot has a
+`rate_limiter` they respect the limits of botAPI and never delay the replies to the users.
+Chats that blocked the bot (403) are counted apart and given to `on_blocked`, so they can be removed from the database.
+
+The progress is saved in a JSON checkpoint: if the broadcast is stopped or the process crashes, running it again
+with the same checkpoint and the same chat ids, in the same order, skips the chats already done.
+Some of the chats sent just before a crash may receive the message twice.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+import traceback
+
+from silbot import ratelimit
+from silbot.botapi import BotApi
+
+
+class Broadcast:
+    """
+    Sends a message to many chats, with resumable progress
+    """
+
+    def __init__(self, bot: BotApi, chat_ids, message, method: str = "sendMessage", workers: int = 8,
+                 checkpoint: str = None, checkpoint_every: int = 100, on_result=None, on_blocked=None):
+        """Creates the broadcast, call `run` or `runAsync` to start it
+
+        **Args:**
+
+        - bot (`BotApi` or `AsyncBotApi`): bot that sends the messages, `AsyncBotApi` is needed by `runAsync`
+        - chat_ids (`iterable`): chat ids, it can be a generator so they are never all in memory
+        - message (`dict` or `function`): arguments of `method` without `chat_id`, ex. `{"text": "Hi", "parse_mode": "HTML"}`,
+        or a function called with the bot and the chat id that sends the message and returns the result of the bot method, ex. `lambda bot, chat_id: bot.sendPhoto(chat_id, photo)`.
+        With `runAsync` it has to be a coroutine function
+        - method (`str`, optional): botApi method used when `message` is a `dict`. Defaults to `sendMessage`
+        - workers (`int`, optional): maximum number of messages sent at the same time. Defaults to `8`
+        - checkpoint (`str`, optional): path of the JSON file where the progress is saved. Defaults to `None`
+        - checkpoint_every (`int`, optional): number of chats after which the progress is saved. Defaults to `100`
+        - on_result (`function`, optional): a function that is called with the chat id and the `BotAPIResponse` of every chat
+        - on_blocked (`function`, optional): a function that is called with the chat id of the chats that blocked the bot or can't be reached (403)
+        """
+        self.bot = bot
+        self.chat_ids = chat_ids
+        self.message = message
+        self.method = method
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.on_result = on_result
+        self.on_blocked = on_blocked
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.position = 0
+        """Number of chats, from the start of `chat_ids`, that are done"""
+        self.done = set()
+        self.sent = 0
+        """Number of messages sent"""
+        self.blocked = 0
+        """Number of chats that blocked the bot (403)"""
+        self.failed = 0
+        """Number of messages that couldn't be sent for other errors"""
+        self.started = None
+        self.finished = None
+        self.saved = 0
+        self.resumed_sent = 0
+
+    def loadCheckpoint(self):
+        """Reads the progress from the checkpoint, the main utility of this function is internal"""
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint, "r") as f:
+            saved = json.load(f)
+        self.position = saved["position"]
+        self.sent = saved["sent"]
+        self.blocked = saved["blocked"]
+        self.failed = saved["failed"]
+        self.saved = self.position
+
+    def saveCheckpoint(self):
+        """Writes the progress in the checkpoint, the file is replaced atomically"""
+        if self.checkpoint is None:
+            return
+        with self.save_lock:
+            with self.lock:
+                saved = {"position": self.position, "sent": self.sent, "blocked": self.blocked, "failed": self.failed}
+                self.saved = self.position
+            temp = self.checkpoint + ".tmp"
+            with open(temp, "w") as f:
+                json.dump(saved, f)
+            os.replace(temp, self.checkpoint)
+
+    def pending(self):
+        """Returns the chats that are not done, with their position in `chat_ids`"""
+        return itertools.islice(enumerate(self.chat_ids), self.position, None)
+
+    def arguments(self, chat_id):
+        """Returns the arguments of the request for a chat"""
+        arguments = dict(self.message)
+        arguments["chat_id"] = chat_id
+        return arguments
+
+    def complete(self, index, chat_id, response):
+        """Registers the response for a chat and moves the checkpoint forward, the main utility of this function is internal
+
+        **Returns:**
+
+        - `bool` `True` if the checkpoint has to be saved
+        """
+        blocked = response is not None and not response.ok and response.error_code == 403
+        with self.lock:
+            if blocked:
+                self.blocked += 1
+            elif response is None or not response.ok:
+                self.failed += 1
+            else:
+                self.sent += 1
+            self.done.add(index)
+            while self.position in self.done:
+                self.done.remove(self.position)
+                self.position += 1
+            save = self.position - self.saved >= self.checkpoint_every
+        if blocked and self.on_blocked is not None:
+            self.on_blocked(chat_id)
+        if self.on_result is not None:
+            self.on_result(chat_id, response)
+        return save
+
+    def sendTo(self, chat_id):
+        """Sends the message to a chat and returns its `BotAPIResponse`"""
+        with ratelimit.priority(ratelimit.BULK):
+            if callable(self.message):
+                return self.message(self.bot, chat_id)[1]
+            return self.bot.response(self.bot.sendRequest(self.method, self.arguments(chat_id)), None)[1]
+
+    def work(self, tasks):
+        """Sends the messages of the queue, it is run by the worker threads"""
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            if self.stopped.is_set():
+                continue
+            index, chat_id = task
+            try:
+                response = self.sendTo(chat_id)
+            except Exception:
+                traceback.print_exc()
+                response = None
+            try:
+                if self.complete(index, chat_id, response):
+                    self.saveCheckpoint()
+            except Exception:
+                traceback.print_exc()
+
+    def run(self):
+        """Sends the message to every chat with `workers` threads and returns when the broadcast is over or stopped
+
+        **Returns:**
+
+        - `dict` the `stats` of the broadcast
+        """
+        self.loadCheckpoint()
+        self.resumed_sent = self.sent
+        self.started = time.monotonic()
+        tasks = queue.Queue(self.workers * 2)
+        threads = [threading.Thread(target=self.work, args=(tasks,), name="silbot-broadcast", daemon=True)
+                   for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for task in self.pending():
+            if self.stopped.is_set():
+                break
+            tasks.put(task)
+        for _ in threads:
+            tasks.put(None)
+        for thread in threads:
+            thread.join()
+        self.finished = time.monotonic()
+        self.saveCheckpoint()
+        return self.stats()
+
+    async def sendToAsync(self, chat_id):
+        """Asynchronous version of `sendTo`"""
+        with ratelimit.priority(ratelimit.BULK):
+            if callable(self.message):
+                return (await self.message(self.bot, chat_id))[1]
+            return (await self.bot.response(self.bot.sendRequest(self.method, self.arguments(chat_id)), None))[1]
+
+    async def workAsync(self, index, chat_id):
+        """Asynchronous version of `work` for a single chat"""
+        try:
+            response = await self.sendToAsync(chat_id)
+        except Exception:
+            traceback.print_exc()
+            response = None
+        if self.complete(index, chat_id, response):
+            await asyncio.get_running_loop().run_in_executor(None, self.saveCheckpoint)
+
+    async def runAsync(self):
+        """Sends the message to every chat with an `AsyncBotApi`, with at most `workers` messages at the same time
+
+        **Returns:**
+
+        - `dict` the `stats` of the broadcast
+        """
+        self.loadCheckpoint()
+        self.resumed_sent = self.sent
+        self.started = time.monotonic()
+        tasks = set()
+        for index, chat_id in self.pending():
+            if self.stopped.is_set():
+                break
+            while len(tasks) >= self.workers:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            task = asyncio.ensure_future(self.workAsync(index, chat_id))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        self.finished = time.monotonic()
+        self.saveCheckpoint()
+        return self.stats()
+
+    def stop(self):
+        """Stops the broadcast, the messages being sent are completed and the progress is saved"""
+        self.stopped.set()
+
+    def stats(self):
+        """Returns the progress of the broadcast
+
+        **Returns:**
+
+        - `dict` with `position`, `sent`, `blocked`, `failed`, `elapsed` seconds and `throughput`, messages sent per second since the broadcast was started or resumed
+        """
+        with self.lock:
+            if self.started is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self.finished if self.finished is not None else time.monotonic()) - self.started
+            return {
+                "position": self.position,
+                "sent": self.sent,
+                "blocked": self.blocked,
+                "failed": self.failed,
+                "elapsed": elapsed,
+                "throughput": (self.sent - self.resumed_sent) / elapsed if elapsed > 0 else 0.0,
+            }
@@ -0,0 +1,174 @@
+"""
+## This module's purpose is to encode and decode JSON with a faster library when it is installed
+
+Every response of botAPI is decoded and every request is encoded with the codec chosen here.
+The default is the `json` module of the standard library, `use` replaces it with
+[orjson](https://pypi.org/project/orjson/) or [ujson](https://pypi.org/project/ujson/),
+ex. `silbot.codec.use("orjson")`, or with the fastest one installed with `silbot.codec.use("auto")`.
+Responses are decoded directly from the `bytes` received, without decoding them into a `str` first
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class StdlibCodec:
+    """
+    Codec of the `json` module of the standard library
+    """
+
+    name = "json"
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+    @staticmethod
+    def dumpBytes(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec:
+    """
+    Codec of [orjson](https://pypi.org/project/orjson/), it encodes directly into `bytes`
+    """
+
+    name = "orjson"
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def dumpBytes(obj):
+        return orjson.dumps(obj)
+
+
+class UjsonCodec:
+    """
+    Codec of [ujson](https://pypi.org/project/ujson/)
+    """
+
+    name = "ujson"
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(data)
+
+    @staticmethod
+    def dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    @staticmethod
+    def dumpBytes(obj):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+
+CODECS = {"json": StdlibCodec, "orjson": OrjsonCodec, "ujson": UjsonCodec}
+"""Codecs that can be given to `use`, with their name"""
+
+current = StdlibCodec
+"""Codec used by silbot, set it with `use`"""
+
+
+def available():
+    """Returns the names of the codecs that can be used, the fastest first
+
+    **Returns:**
+
+    - `list` of `str`
+    """
+    names = []
+    if orjson is not None:
+        names.append("orjson")
+    if ujson is not None:
+        names.append("ujson")
+    names.append("json")
+    return names
+
+
+def use(name: str = "auto"):
+    """Chooses the codec used to decode responses and to encode requests
+
+    **Args:**
+
+    - name (`str`, optional): `json`, `orjson`, `ujson` or `auto` for the fastest one installed. Defaults to `auto`
+
+    **Returns:**
+
+    - the codec class now in use
+
+    **Raises:**
+
+    - `ValueError`: if the codec doesn't exist or its library is not installed
+    """
+    global current
+    if name == "auto":
+        name = available()[0]
+    if name not in CODECS or name not in available():
+        raise ValueError("JSON codec " + str(name) + " is not available, install it or use one of " + ", ".join(available()))
+    current = CODECS[name]
+    return current
+
+
+def loads(data):
+    """Decodes JSON with the current codec
+
+    **Args:**
+
+    - data (`bytes` or `str`): JSON document
+
+    **Returns:**
+
+    - the decoded value
+
+    **Raises:**
+
+    - `ValueError`: if `data` is not valid JSON
+    """
+    return current.loads(data)
+
+
+def dumps(obj):
+    """Encodes `obj` in compact JSON with the current codec
+
+    **Args:**
+
+    - obj (`dict`, `list` or another JSON value): value to encode
+
+    **Returns:**
+
+    - `str`
+    """
+    return current.dumps(obj)
+
+
+def dumpBytes(obj):
+    """Encodes `obj` in compact JSON with the current codec, as UTF-8 `bytes` ready to be sent
+
+    **Args:**
+
+    - obj (`dict`, `list` or another JSON value): value to encode
+
+    **Returns:**
+
+    - `bytes`
+    """
+    return current.dumpBytes(obj)
@@ -75,3 +75,30 @@ class DatabaseManager:
         - `value` (`str`): Value to set
         """
         raise NotImplementedError
+
+    def getFileId(self, key):
+        """Returns a `file_id` stored with `setFileId`, it is used by `silbot.filecache.DatabaseStorage`
+
+        **Args:**
+
+        - `key` (`str`): key of the file, made of the bot id, the method argument and the sha256 of the file
+
+        **Returns:**
+
+        - `str` the `file_id`, `None` if the key is not stored
+        Raises:
+        - NotImplementedError: if you don't override this method
+        """
+        raise NotImplementedError
+
+    def setFileId(self, key, file_id):
+        """Stores the `file_id` of an uploaded file, it is used by `silbot.filecache.DatabaseStorage`
+
+        **Args:**
+
+        - `key` (`str`): key of the file
+        - `file_id` (`str`): `file_id` to store, if it is `None` the key has to be removed
+        Raises:
+        - NotImplementedError: if you don't override this method
+        """
+        raise NotImplementedError
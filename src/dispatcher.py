@@ -0,0 +1,252 @@
+"""
+## This module's purpose is to handle botApi updates with a fixed pool of worker threads
+
+Instead of starting a new thread for every update, updates are put in a bounded queue and elaborated by
+a fixed number of workers. Pass an `UpdateDispatcher` to `silbot.GetUpdatesLoop` to use it.
+
+With `ordered=True` every chat has its own queue and is elaborated by at most one worker at a time, so updates of the
+same chat are elaborated one at a time and in order, while any free worker takes the next chat that is waiting.
+"""
+
+import collections
+import threading
+import time
+import traceback
+
+from silbot import types
+
+
+def updateKey(update):
+    """Returns the id of the chat an update belongs to, the main utility of this function is internal
+
+    - - - - -
+    **Args**:
+
+    - `update` (`dict`): json_decoded update
+
+    **Returns**
+    - `int` id of the chat, or of the user for updates without a chat (ex. inline queries), `None` if there is neither
+    """
+    for value in update.values():
+        if type(value) == dict:
+            if "chat" in value:
+                return value["chat"]["id"]
+            if "message" in value and "chat" in value["message"]:
+                return value["message"]["chat"]["id"]
+            if "from" in value:
+                return value["from"]["id"]
+            if "user" in value:
+                return value["user"]["id"]
+    return None
+
+
+class UpdateDispatcher:
+    """
+    Elaborates updates with a fixed number of worker threads
+    """
+
+    BLOCK = "block"
+    """Overflow behaviour: `submit` waits until there is space in the queue"""
+    DROP_OLDEST = "drop_oldest"
+    """Overflow behaviour: the oldest queued update is discarded to make space"""
+    REJECT = "reject"
+    """Overflow behaviour: the new update is discarded and `submit` returns `False`"""
+
+    def __init__(self, workers: int = 8, queue_size: int = 100, overflow: str = "block", ordered: bool = False):
+        """Creates a dispatcher, workers are started by `start` or by the first `submit`
+
+        **Args:**
+
+        - workers (`int`, optional): number of worker threads. Defaults to `8`
+        - queue_size (`int`, optional): maximum number of updates waiting for a worker. Defaults to `100`
+        - overflow (`str`, optional): what to do when the queue is full, can be `block`, `drop_oldest` or `reject`. Defaults to `block`
+        - ordered (`bool`, optional): if `True` updates of the same chat are elaborated in order, one at a time. Defaults to `False`
+        """
+        if overflow not in (self.BLOCK, self.DROP_OLDEST, self.REJECT):
+            raise ValueError("overflow must be one of block, drop_oldest or reject")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.ordered = ordered
+
+        self.submitted = 0
+        """Number of updates accepted by `submit`"""
+        self.processed = 0
+        """Number of updates elaborated by the workers"""
+        self.errors = 0
+        """Number of updates whose function raised an exception"""
+        self.dropped = 0
+        """Number of queued updates discarded with the `drop_oldest` behaviour"""
+        self.rejected = 0
+        """Number of updates refused with the `reject` behaviour"""
+        self.busy_workers = 0
+        """Number of workers that are elaborating an update right now"""
+        self.busy_time = 0.0
+        """Total seconds spent by the workers elaborating updates"""
+
+        self._lock = threading.Lock()
+        # Updates ready to be taken by a worker, or with `ordered` the keys of the chats whose next update is ready
+        self._ready = collections.deque()
+        # With `ordered`, the updates waiting in every chat and the chats that a worker is elaborating
+        self._chats = {}
+        self._active = set()
+        self._depth = 0
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._threads = []
+        self._running = False
+        self._started_at = None
+
+    def start(self):
+        """Starts the worker threads, does nothing if they are already running"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._started_at = time.monotonic()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name="silbot-worker-" + str(index), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, wait: bool = True):
+        """Stops the workers once the queued updates have been elaborated
+
+        **Args:**
+
+        - wait (`bool`, optional): if `True` waits for the workers to finish. Defaults to `True`
+        """
+        with self._lock:
+            self._running = False
+            self._not_empty.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def submit(self, update, bot, function):
+        """Queues an update to be elaborated by a worker
+
+        **Args:**
+
+        - update (`dict`): json_decoded update
+        - bot (`botApi`): the current bot botApi object
+        - function (`function`): function to call to elaborate the update, it receives the `types.Update` and the bot
+
+        **Returns:**
+
+        - `bool`: `True` if the update was queued, `False` if it was rejected
+        """
+        if not self._running:
+            self.start()
+        key = self._chatKey(update) if self.ordered else None
+        with self._lock:
+            while self._depth >= self.queue_size:
+                if self.overflow == self.REJECT:
+                    self.rejected += 1
+                    return False
+                elif self.overflow == self.DROP_OLDEST:
+                    self._dropOldest(key)
+                    self.dropped += 1
+                else:
+                    self._not_full.wait()
+            if self.ordered:
+                chat = self._chats.get(key)
+                if chat is None:
+                    chat = self._chats[key] = collections.deque()
+                if not chat and key not in self._active:
+                    self._ready.append(key)
+                chat.append((update, bot, function))
+            else:
+                self._ready.append((update, bot, function))
+            self._depth += 1
+            self.submitted += 1
+            self._not_empty.notify()
+        return True
+
+    def queueDepth(self):
+        """Returns the number of updates waiting for a worker"""
+        return self._depth
+
+    def _chatKey(self, update):
+        """Returns the key of the chat whose queue gets the given update"""
+        key = updateKey(update)
+        if key is None:
+            return ("update", update.get("update_id", 0))
+        return key
+
+    def _dropOldest(self, key):
+        """Discards the oldest waiting update, of the chat `key` if it has any, it is called with the lock held"""
+        self._depth -= 1
+        if not self.ordered:
+            self._ready.popleft()
+            return
+        if not self._chats.get(key):
+            key = self._ready[0] if self._ready else next(k for k, chat in self._chats.items() if chat)
+        chat = self._chats[key]
+        chat.popleft()
+        if not chat and key not in self._active:
+            self._ready.remove(key)
+            del self._chats[key]
+
+    def stats(self):
+        """Returns the counters of the dispatcher
+
+        **Returns:**
+
+        - `dict` with `queue_depth`, `queue_size`, `workers`, `busy_workers`, `utilisation` (busy workers / workers),
+        `average_utilisation` (busy time / available worker time since `start`), `submitted`, `processed`, `errors`, `dropped` and `rejected`
+        """
+        with self._lock:
+            uptime = time.monotonic() - self._started_at if self._started_at is not None else 0
+            return {
+                "queue_depth": self._depth,
+                "queue_size": self.queue_size,
+                "workers": self.workers,
+                "busy_workers": self.busy_workers,
+                "utilisation": self.busy_workers / self.workers,
+                "average_utilisation": self.busy_time / (self.workers * uptime) if uptime > 0 else 0.0,
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "errors": self.errors,
+                "dropped": self.dropped,
+                "rejected": self.rejected,
+            }
+
+    def _work(self):
+        """Main loop of a worker thread, with `ordered` it takes only the chats that no other worker is elaborating"""
+        while True:
+            with self._lock:
+                while not self._ready and self._running:
+                    self._not_empty.wait()
+                if not self._ready:
+                    return
+                if self.ordered:
+                    key = self._ready.popleft()
+                    update, bot, function = self._chats[key].popleft()
+                    self._active.add(key)
+                else:
+                    update, bot, function = self._ready.popleft()
+                self._depth -= 1
+                self.busy_workers += 1
+                self._not_full.notify()
+            started = time.monotonic()
+            failed = False
+            try:
+                function(types.Update(update), bot)
+            except Exception:
+                failed = True
+                traceback.print_exc()
+            with self._lock:
+                self.busy_workers -= 1
+                self.busy_time += time.monotonic() - started
+                self.processed += 1
+                if failed:
+                    self.errors += 1
+                if self.ordered:
+                    self._active.discard(key)
+                    if self._chats[key]:
+                        self._ready.append(key)
+                        self._not_empty.notify()
+                    else:
+                        del self._chats[key]
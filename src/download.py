@@ -0,0 +1,237 @@
+"""
+## This module's purpose is to download files from botAPI, it is used by `BotApi.downloadFile`
+
+Files are streamed in chunks, so they are never loaded entirely in memory. Files stored on this machine by a
+local Bot API server are read directly from the disk. A download can start from an offset
+with an HTTP Range request, so an interrupted download can be resumed, and downloaded files can be kept in a
+cache directory where they are named by their `file_unique_id`.
+"""
+
+import asyncio
+import os
+import uuid
+
+from silbot import codec, types
+from silbot.response import BotAPIResponse, BotAPIError
+
+
+def fileUrl(base_url, token, file_path):
+    """Returns the download link of a file
+
+    - - - - -
+    **Args**:
+
+    - `base_url` (`str`): address of botAPI, like `https://api.telegram.org`
+    - `token` (`str`): token of the bot
+    - `file_path` (`str`): `file_path` of a `types.File`
+
+    **Returns**
+    - `str` download link
+    """
+    return base_url + "/file/bot" + token + "/" + file_path
+
+
+def localPath(file: types.File):
+    """Returns the path of a file on this machine, a local Bot API server started with `--local` gives absolute `file_path`s
+
+    - - - - -
+    **Args**:
+
+    - `file` (`types.File`): file returned by getFile
+
+    **Returns**
+    - `str` path of the file, `None` if it has to be downloaded
+    """
+    if os.path.isabs(file.file_path) and os.path.isfile(file.file_path):
+        return file.file_path
+    return None
+
+
+def rangeHeaders(offset):
+    """Returns the headers to download a file from `offset`
+
+    - - - - -
+    **Args**:
+
+    - `offset` (`int`): first byte to download
+
+    **Returns**
+    - `dict` with the `Range` header, empty if `offset` is 0
+    """
+    return {"Range": "bytes=" + str(offset) + "-"} if offset > 0 else {}
+
+
+def downloadError(status, text):
+    """Returns the exception raised when a download fails
+
+    - - - - -
+    **Args**:
+
+    - `status` (`int`): HTTP status of the response
+    - `text` (`str`): body of the response, botAPI answers with a JSON error
+
+    **Returns**
+    - `BotAPIError`
+    """
+    try:
+        response = BotAPIResponse(text)
+    except (ValueError, KeyError):
+        response = BotAPIResponse(codec.dumps({"ok": False, "error_code": status, "description": text[:200]}))
+    return BotAPIError(response)
+
+
+def missingPathError(file: types.File):
+    """Returns the exception raised when getFile returns a file without `file_path`
+
+    botAPI doesn't give a `file_path` for files that can't be downloaded, like the ones bigger than 20 MB
+    - - - - -
+    **Args**:
+
+    - `file` (`types.File`): file returned by getFile
+
+    **Returns**
+    - `BotAPIError`
+    """
+    return BotAPIError(BotAPIResponse(codec.dumps({
+        "ok": False, "error_code": 400,
+        "description": "Bad Request: file " + str(file.file_id) + " can't be downloaded, it is too big or not available",
+    })))
+
+
+def isComplete(file: types.File, offset):
+    """Returns `True` if there is nothing to download after `offset`"""
+    return file.file_size is not None and offset >= file.file_size
+
+
+def cachePath(cache_dir, file: types.File):
+    """Returns the path of a file in the cache directory, creating the directory if needed
+
+    - - - - -
+    **Args**:
+
+    - `cache_dir` (`str`): cache directory
+    - `file` (`types.File`): file returned by getFile
+
+    **Returns**
+    - `str` path named by the `file_unique_id` of the file
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, os.path.basename(file.file_unique_id))
+
+
+def tempPath(path):
+    """Returns a unique temporary path next to `path`, downloads are written there and then moved to `path`"""
+    return path + "." + uuid.uuid4().hex + ".part"
+
+
+def skipChunks(chunks, skip, close=None):
+    """Generator that yields the chunks without their first `skip` bytes, then calls `close`
+
+    It is used when botAPI ignores the Range header and sends the whole file
+    """
+    try:
+        for chunk in chunks:
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            if skip > 0:
+                chunk = chunk[skip:]
+                skip = 0
+            yield chunk
+    finally:
+        if close is not None:
+            close()
+
+
+async def aempty():
+    """Asynchronous generator without chunks, returned when there is nothing to download"""
+    return
+    yield
+
+
+async def askipChunks(chunks, skip, close=None):
+    """Asynchronous version of `skipChunks`"""
+    try:
+        async for chunk in chunks:
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            if skip > 0:
+                chunk = chunk[skip:]
+                skip = 0
+            yield chunk
+    finally:
+        if close is not None:
+            close()
+
+
+def readChunks(path, chunk_size, offset=0):
+    """Generator that reads a file in chunks from `offset`"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        yield from iter(lambda: f.read(chunk_size), b"")
+
+
+async def areadChunks(path, chunk_size, offset=0):
+    """Asynchronous version of `readChunks`, the file is read in a thread"""
+    loop = asyncio.get_running_loop()
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def openDestination(destination, offset):
+    """Opens a path to write a download that starts from `offset`, the bytes after `offset` are removed"""
+    if offset > 0 and os.path.exists(destination):
+        f = open(destination, "r+b")
+        f.seek(offset)
+        f.truncate()
+        return f
+    return open(destination, "wb")
+
+
+def save(chunks, destination, offset=0):
+    """Writes the chunks of a download in the destination
+
+    - - - - -
+    **Args**:
+
+    - `chunks` (`iterable` of `bytes`): content of the file from `offset`
+    - `destination` (`str`, `os.PathLike`, binary file object or `None`): where the file is written
+    - `offset` (`int`): position of the first chunk in the file, it is used for paths
+
+    **Returns**
+    - `chunks` if `destination` is `None`, otherwise `destination`
+    """
+    if destination is None:
+        return chunks
+    if isinstance(destination, (str, os.PathLike)):
+        with openDestination(destination, offset) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return destination
+    for chunk in chunks:
+        destination.write(chunk)
+    return destination
+
+
+async def asave(chunks, destination, offset=0):
+    """Asynchronous version of `save`, files are written in a thread"""
+    if destination is None:
+        return chunks
+    loop = asyncio.get_running_loop()
+    if isinstance(destination, (str, os.PathLike)):
+        f = await loop.run_in_executor(None, openDestination, destination, offset)
+        try:
+            async for chunk in chunks:
+                await loop.run_in_executor(None, f.write, chunk)
+        finally:
+            f.close()
+        return destination
+    async for chunk in chunks:
+        await loop.run_in_executor(None, destination.write, chunk)
+    return destination
@@ -0,0 +1,271 @@
+"""
+## This module's purpose is to avoid uploading the same file more than once
+
+Telegram gives a `file_id` to every file sent by a bot, and the bot can send the file again using only that id.
+A `FileIdCache` given to `BotApi(file_cache=...)` hashes the content of the `types.InputFile` arguments, stores the
+`file_id` found in the `types.Message` returned by botAPI and sends the `file_id` instead of the file the next time
+the same content is sent with the same method argument (ex. `photo` of sendPhoto).
+
+The `file_id`s are kept by a storage: `MemoryStorage` (LRU, lost on restart), `FileStorage` (JSON file) or
+`DatabaseStorage`, which uses the `getFileId` and `setFileId` methods of your `database.DatabaseManager` so the
+cache can be shared by every worker of the bot.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from silbot import codec, types
+from silbot.database import DatabaseManager
+
+CACHEABLE_FIELDS = ("photo", "document", "audio", "video", "animation", "voice", "video_note", "sticker")
+"""Arguments whose file can be replaced by a `file_id`, they have the same name of the field of the returned `types.Message`"""
+
+
+class MemoryStorage:
+    """
+    Keeps the most recently used `file_id`s in memory
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Creates the storage
+
+        **Args:**
+
+        - maxsize (`int`, optional): maximum number of `file_id`s, the least recently used are removed. Defaults to `1024`
+        """
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the `file_id` stored for a key, `None` if there isn't one"""
+        with self.lock:
+            if key not in self.items:
+                return None
+            self.items.move_to_end(key)
+            return self.items[key]
+
+    def set(self, key, file_id):
+        """Stores the `file_id` of a key, `None` removes it"""
+        with self.lock:
+            if file_id is None:
+                self.items.pop(key, None)
+                return
+            self.items[key] = file_id
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+
+class FileStorage:
+    """
+    Keeps the `file_id`s in a JSON file, so they survive restarts
+    """
+
+    def __init__(self, path: str):
+        """Creates the storage, the file is created on the first `set`
+
+        **Args:**
+
+        - path (`str`): path of the JSON file
+        """
+        self.path = path
+        self.items = {}
+        self.mtime = None
+        self.lock = threading.Lock()
+
+    def _reload(self):
+        """Reads the file again if it has been changed, ex. by another process"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self.mtime:
+            return
+        try:
+            with open(self.path, "r") as f:
+                self.items = json.load(f)
+        except ValueError:
+            self.items = {}
+        self.mtime = mtime
+
+    def get(self, key):
+        """Returns the `file_id` stored for a key, `None` if there isn't one"""
+        with self.lock:
+            self._reload()
+            return self.items.get(key)
+
+    def set(self, key, file_id):
+        """Stores the `file_id` of a key, `None` removes it. The file is replaced atomically"""
+        with self.lock:
+            self._reload()
+            if file_id is None:
+                self.items.pop(key, None)
+            else:
+                self.items[key] = file_id
+            temp = self.path + "." + str(os.getpid()) + ".tmp"
+            with open(temp, "w") as f:
+                json.dump(self.items, f, separators=(",", ":"))
+            os.replace(temp, self.path)
+            self.mtime = os.stat(self.path).st_mtime_ns
+
+
+class DatabaseStorage:
+    """
+    Keeps the `file_id`s in the database of the bot
+    """
+
+    def __init__(self, manager: DatabaseManager):
+        """Creates the storage
+
+        **Args:**
+
+        - manager (`database.DatabaseManager`): your DatabaseManager, it has to implement `getFileId` and `setFileId`
+        """
+        self.manager = manager
+
+    def get(self, key):
+        """Returns the `file_id` stored for a key, `None` if there isn't one"""
+        return self.manager.getFileId(key)
+
+    def set(self, key, file_id):
+        """Stores the `file_id` of a key, `None` removes it"""
+        self.manager.setFileId(key, file_id)
+
+
+class FileIdCache:
+    """
+    Replaces the files already uploaded with their `file_id`
+    """
+
+    def __init__(self, storage=None, chunk_size: int = 65536):
+        """Creates the cache
+
+        **Args:**
+
+        - storage (`MemoryStorage`, `FileStorage` or `DatabaseStorage`, optional): where the `file_id`s are kept. Defaults to `MemoryStorage()`
+        - chunk_size (`int`, optional): maximum size in bytes of the chunks read while hashing files. Defaults to `65536`
+        """
+        self.storage = storage if storage is not None else MemoryStorage()
+        self.chunk_size = chunk_size
+        self.digests = MemoryStorage(4096)
+        """Digests of the paths already hashed, by path, size and modification time"""
+        self.hits = 0
+        """Number of files replaced by a `file_id`"""
+        self.misses = 0
+        """Number of files uploaded"""
+
+    def digest(self, file: types.InputFile):
+        """Returns the sha256 of a file, paths are hashed again only if they have been modified
+
+        **Args:**
+
+        - file (`types.InputFile`): file to hash
+
+        **Returns:**
+
+        - `str` hex digest, `None` if the file can't be hashed
+        """
+        path = file.dict.get("file")
+        if not isinstance(path, (str, os.PathLike)):
+            return file.getDigest(self.chunk_size)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        memo = os.path.abspath(path) + ":" + str(stat.st_size) + ":" + str(stat.st_mtime_ns)
+        digest = self.digests.get(memo)
+        if digest is None:
+            digest = file.getDigest(self.chunk_size)
+            self.digests.set(memo, digest)
+        return digest
+
+    def lookup(self, arguments: dict, namespace: str = ""):
+        """Replaces the files of a request with the `file_id`s already known, the main utility of this function is internal
+
+        **Args:**
+
+        - arguments (`dict`): arguments of the request, they are not modified
+        - namespace (`str`, optional): prefix of the keys, `BotApi` uses the id of the bot because `file_id`s can only be used by the bot that received them
+
+        **Returns:**
+
+        - `tuple` with the arguments to send, the `list` of (`field`, `key`) replaced by a `file_id` and the `list` of (`field`, `key`) that will be uploaded
+        """
+        hits = []
+        misses = []
+        cached = arguments
+        for field in CACHEABLE_FIELDS:
+            file = arguments.get(field)
+            if not isinstance(file, types.InputFile):
+                continue
+            digest = self.digest(file)
+            if digest is None:
+                continue
+            key = namespace + ":" + field + ":" + digest
+            file_id = self.storage.get(key)
+            if file_id is None:
+                misses.append((field, key))
+                continue
+            if cached is arguments:
+                cached = dict(arguments)
+            cached[field] = file_id
+            hits.append((field, key))
+        self.hits += len(hits)
+        self.misses += len(misses)
+        return cached, hits, misses
+
+    def store(self, misses: list, raw_json):
+        """Stores the `file_id`s of the uploaded files, found in the message returned by botAPI
+
+        **Args:**
+
+        - misses (`list`): list of (`field`, `key`) returned by `lookup`
+        - raw_json (`bytes` or `str`): response of botAPI
+        """
+        if not misses:
+            return
+        try:
+            response = codec.loads(raw_json)
+        except ValueError:
+            return
+        result = response.get("result")
+        if not response.get("ok") or type(result) != dict:
+            return
+        for field, key in misses:
+            value = result.get(field)
+            if type(value) == list and len(value) > 0:
+                # Photos are returned in every size, the biggest one is the last
+                value = value[-1]
+            if type(value) == dict and "file_id" in value:
+                self.storage.set(key, value["file_id"])
+
+    def rejected(self, raw_json):
+        """Returns `True` if botAPI refused a request because of a file, ex. a `file_id` that is no longer valid
+
+        **Args:**
+
+        - raw_json (`bytes` or `str`): response of botAPI
+
+        **Returns:**
+
+        - `bool`
+        """
+        try:
+            response = codec.loads(raw_json)
+        except ValueError:
+            return False
+        return not response.get("ok") and response.get("error_code") == 400 and \
+            "file" in str(response.get("description", "")).lower()
+
+    def forget(self, keys: list):
+        """Removes `file_id`s from the storage
+
+        **Args:**
+
+        - keys (`list`): list of (`field`, `key`) returned by `lookup`
+        """
+        for field, key in keys:
+            self.storage.set(key, None)
@@ -0,0 +1,210 @@
+"""
+## This module's purpose is to respect the flood limits of botAPI
+
+When botAPI answers a request with a flood error (429) it gives the seconds to wait in `retry_after`.
+`FloodControl` remembers the wait for the chat of the request, or for the whole bot, so the next requests to the
+same chat are held until the wait is over instead of prolonging the flood ban, and the refused request is sent again.
+Every `BotApi` has one in `bot.flood_control`, use `bot.flood_control.stats()` to see how long requests were held.
+"""
+
+import threading
+import time
+
+from silbot import codec, helper, upload
+
+CHAT = "chat"
+"""Scope: a flood error stops only the requests to the same chat, requests without `chat_id` stop the whole bot"""
+GLOBAL = "global"
+"""Scope: a flood error stops every request of the bot"""
+
+
+def chatKey(arguments):
+    """Returns the chat of a request, the main utility of this function is internal
+
+    **Args:**
+
+    - arguments (`dict`): arguments of the request
+
+    **Returns:**
+
+    - `str` chat_id of the request, `None` if there isn't one
+    """
+    chat_id = arguments.get("chat_id")
+    if chat_id is None:
+        return None
+    return str(chat_id)
+
+
+def retryAfter(raw_json):
+    """Returns the `retry_after` of a flood error
+
+    **Args:**
+
+    - raw_json (`bytes` or `str`): response of botAPI
+
+    **Returns:**
+
+    - `float` seconds to wait, `None` if the response is not a flood error
+    """
+    # Most responses are not parsed twice
+    if (b"retry_after" if isinstance(raw_json, bytes) else "retry_after") not in raw_json:
+        return None
+    try:
+        decoded = codec.loads(raw_json)
+    except ValueError:
+        return None
+    if decoded.get("ok") or decoded.get("error_code") != 429:
+        return None
+    parameters = decoded.get("parameters") or {}
+    return parameters.get("retry_after")
+
+
+def replayable(arguments):
+    """Returns `True` if a request can be sent again, file objects can't be read twice
+
+    Files inside other objects, like the `media` of `InputMedia` objects, are checked too
+
+    **Args:**
+
+    - arguments (`dict`): arguments of the request
+
+    **Returns:**
+
+    - `bool`
+    """
+    fields, files = upload.extractFiles(helper.toBody(arguments))
+    for name, file in files:
+        if not file.isReusable():
+            return False
+    return True
+
+
+class FloodControl:
+    """
+    Holds the requests to chats that received a flood error until their `retry_after` is over
+    """
+
+    def __init__(self, scope: str = CHAT, max_retries: int = 3, max_wait: float = 60):
+        """Creates the flood control
+
+        **Args:**
+
+        - scope (`str`, optional): `CHAT` or `GLOBAL`, what is stopped by a flood error. Defaults to `CHAT`
+        - max_retries (`int`, optional): how many times a request refused for flood is sent again, `0` to return the error. Defaults to `3`
+        - max_wait (`float`, optional): maximum `retry_after` waited before sending a request again, with longer waits the error is returned. Defaults to `60`
+        """
+        self.scope = scope
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+        self.parked = {}
+        """`dict` of the chats that can't receive requests, with the time when they can (`None` for the whole bot)"""
+        self.errors = {}
+        """`dict` of the parked chats, with the flood error that parked them"""
+        self.floods = 0
+        """Number of flood errors received"""
+        self.replays = 0
+        """Number of requests sent again after a flood error"""
+        self.throttled_requests = 0
+        """Number of requests held"""
+        self.throttled_time = 0.0
+        """Total seconds the requests were held"""
+
+    def delay(self, key):
+        """Returns how many seconds a request has to wait
+
+        **Args:**
+
+        - key (`str`): chat of the request, see `chatKey`
+
+        **Returns:**
+
+        - `float` seconds, `0` if the request can be sent now
+        """
+        now = time.monotonic()
+        with self.lock:
+            until = max(self.parked.get(None, 0), self.parked.get(key, 0) if key is not None else 0)
+            if until <= now:
+                if key in self.parked and self.parked[key] <= now:
+                    del self.parked[key]
+                    self.errors.pop(key, None)
+                return 0
+        return until - now
+
+    def refusal(self, key):
+        """Returns the flood error given to the requests that would wait more than `max_wait`, instead of sending them
+
+        **Args:**
+
+        - key (`str`): chat of the request, see `chatKey`
+
+        **Returns:**
+
+        - `bytes` or `str` the flood error that parked the chat, or the whole bot
+        """
+        now = time.monotonic()
+        with self.lock:
+            if key is None or self.parked.get(None, 0) > self.parked.get(key, 0):
+                key = None
+            error = self.errors.get(key)
+            until = self.parked.get(key, now)
+        if error is not None:
+            return error
+        retry_after = max(1, int(until - now))
+        return codec.dumpBytes({
+            "ok": False, "error_code": 429, "description": "Too Many Requests: retry after " + str(retry_after),
+            "parameters": {"retry_after": retry_after},
+        })
+
+    def throttled(self, seconds):
+        """Registers that a request was held for `seconds`"""
+        with self.lock:
+            self.throttled_requests += 1
+            self.throttled_time += seconds
+
+    def park(self, key, retry_after, attempt, raw_json=None):
+        """Registers a flood error and returns if the request has to be sent again
+
+        The chat is parked only if the request is sent again: when the error is returned to the caller,
+        the next requests are not held, so a `retry_after` longer than `max_wait` doesn't block them
+
+        **Args:**
+
+        - key (`str`): chat of the request, see `chatKey`
+        - retry_after (`float`): seconds given by botAPI
+        - attempt (`int`): how many times the request was already sent again
+        - raw_json (`bytes` or `str`, optional): the flood error, returned by `refusal`
+
+        **Returns:**
+
+        - `bool` `True` if the request has to be sent again after the wait
+        """
+        if self.scope == GLOBAL:
+            key = None
+        until = time.monotonic() + retry_after
+        with self.lock:
+            self.floods += 1
+            if attempt >= self.max_retries or retry_after > self.max_wait:
+                return False
+            if until >= self.parked.get(key, 0):
+                self.parked[key] = until
+                self.errors[key] = raw_json
+            self.replays += 1
+            return True
+
+    def stats(self):
+        """Returns the metrics of the flood control
+
+        **Returns:**
+
+        - `dict` with `floods`, `replays`, `throttled_requests`, `throttled_time` and `parked_chats`, the number of chats that can't receive requests now
+        """
+        now = time.monotonic()
+        with self.lock:
+            return {
+                "floods": self.floods,
+                "replays": self.replays,
+                "throttled_requests": self.throttled_requests,
+                "throttled_time": self.throttled_time,
+                "parked_chats": len([until for until in self.parked.values() if until > now]),
+            }
@@ -1,9 +1,10 @@
 """
 ## Here there are some functions that can be useful
 """
-import json
+import io
+import os
 
-from silbot import types
+from silbot import codec, types
 
 
 def setBvar(value):
@@ -23,6 +24,54 @@ def setBvar(value):
         return value
 
 
+def getAttribute(obj, name):
+    """Reads the attributes of silbot.types objects that are not in their slots, the main utility of this function is internal
+
+    It is the `__getattr__` of the types, so it is called only for attributes that are not set:
+    it returns the fields that can't be attributes (ex. `from`) and parses the nested objects
+    of a lazy object when they are read for the first time, setting them as attributes.
+    The fields unknown to the class are in the `__dict__` of the object, so they are found without calling it
+    - - - - -
+    **Args**:
+
+    - `obj` (`silbot.types` object): object to read
+    - `name` (`str`): attribute to read
+
+    **Returns**
+    - the value of the unknown field or the nested object, `None` if the nested object is not in the dictionary of the object
+    """
+    if not name.startswith("_"):
+        nested = type(obj)._nested.get(name) if hasattr(type(obj), "_nested") else None
+        if nested is not None:
+            key, class_name = nested
+            if class_name is None:
+                # Fields like `from`, that can't be attributes, are kept in `__dict__` when they are read
+                if key in obj.dict:
+                    return setExtra(obj, name, setBvar(obj.dict[key]))
+            elif obj._lazy:
+                value = getattr(types, class_name)(obj.dict[key], True) if key in obj.dict else None
+                setattr(obj, name, value)
+                return value
+    raise AttributeError("'" + type(obj).__name__ + "' object has no attribute '" + name + "'")
+
+
+def setExtra(obj, key, value):
+    """Keeps a field unknown to the class of a silbot.types object in its `__dict__`, the main utility of this function is internal
+
+    - - - - -
+    **Args**:
+
+    - `obj` (`silbot.types` object): object of the field
+    - `key` (`str`): name of the field
+    - `value` (any type): value of the field
+
+    **Returns**
+    - `value`
+    """
+    obj.__dict__[key] = value
+    return value
+
+
 class Generic_Json:
     """
     Converts a `dict` into an objects where keys are attributes, ex. self.key = value
@@ -49,7 +98,7 @@ class Generic_Json:
 def toDict(obj, dump=False):
     """Converts silbot.types Objects into dictionary, the main utility of this function is internal
 
-    If `obj` is a silbot object, this function turns it into a dict, else returns it
+    If `obj` is a silbot object, this function turns it into a dict with its serializer (see `compileSerializer`), else returns it
     If `dump` is true, it returns the json encoded value if `obj` is an object, a list or a dict
     - - - - -
     **Args**:
@@ -61,36 +110,88 @@ def toDict(obj, dump=False):
     - `obj` if value is not a silbot object or a list or a dict
     - `dict` if the value given was already a dict or it was a silbot.types object
     - `json string` if `dump` is `True`
+    - `types.InputFile` if `obj` is a file to upload: an InputFile, a binary file object, `bytes`, a `memoryview` or an `os.PathLike` path
     """
-    dictionary = {}
-    attributes = dir(obj)
-    if obj.__class__.__module__ == "builtins":
-        if type(obj) == dict or type(obj) == list:
-            if dump:
-                return json.dumps(obj)
-            else:
-                return obj
-        else:
-            return obj
-    for attribute in attributes:
-        if attribute.startswith("__") or attribute == "dict":
-            continue
-        else:
-            value = getattr(obj, attribute, None)
-            if value is None or str(type(value)) == "<class 'method'>":
-                continue
-            if type(value) == list:
-                dictionary[attribute] = dictList(value)
-            elif value.__class__.__module__ == "silbot.types":
-                dictionary[attribute] = toDict(value)
-            else:
-                dictionary[attribute] = value
+    if isinstance(obj, types.InputFile):
+        return obj
+    if isinstance(obj, (io.IOBase, bytes, bytearray, memoryview, os.PathLike)):
+        return inputFile(obj)
+    serializer = getattr(type(obj), "_serialize", None)
+    if serializer is not None:
+        dictionary = serializer(obj)
+    elif type(obj) == Generic_Json:
+        dictionary = obj.d
+    elif type(obj) == dict or type(obj) == list:
+        dictionary = obj
+    else:
+        return obj
     if dump:
-        return json.dumps(dictionary)
+        return codec.dumps(dictionary)
     else:
         return dictionary
 
 
+PLAIN_TYPES = frozenset({str, int, float, bool})
+"""Types of the values that are serialized as they are"""
+
+
+def fieldValue(value):
+    """Converts the value of a field of a silbot.types object into a value that can be json encoded, the main utility of this function is internal
+
+    - - - - -
+    **Args**:
+
+    - `value` (any type): value of the field, not `None`
+
+    **Returns**
+    - `value` if it is a `str`, a number or a `bool`, otherwise the result of `dictList` or `toDict`
+    """
+    if type(value) in PLAIN_TYPES:
+        return value
+    if type(value) == list:
+        return dictList(value)
+    return toDict(value)
+
+
+def compileSerializer(cls):
+    """Generates the function that converts the objects of a silbot.types class into dictionaries, the main utility of this function is internal
+
+    The function reads the fields listed in the `__slots__` of the class, with their name in botAPI
+    (ex. the `user` attribute is sent as `from`), skips the `None` ones and adds the fields kept in `__dict__`, unknown fields and attributes set by the user.
+    It is generated once for every class when `silbot.types` is imported and set as `_serialize`
+    - - - - -
+    **Args**:
+
+    - `cls` (`class`): class of `silbot.types`
+
+    **Returns**
+    - `function` that takes an object of `cls` and returns a `dict`
+    """
+    keys = {}
+    for attribute, (key, class_name) in getattr(cls, "_nested", {}).items():
+        if class_name is not None:
+            keys[attribute] = key
+    lines = ["def serialize(obj):", "    dictionary = {}"]
+    for attribute in cls.__slots__:
+        if attribute.startswith("_") or attribute == "dict":
+            continue
+        lines.append("    value = getattr(obj, %r, None)" % attribute)
+        lines.append("    if value is not None:")
+        lines.append("        dictionary[%r] = value if type(value) in PLAIN_TYPES else fieldValue(value)"
+                     % keys.get(attribute, attribute))
+    lines.append("    extra = obj.__dict__")
+    lines.append("    if extra:")
+    lines.append("        for key, value in extra.items():")
+    lines.append("            if value is not None and key not in dictionary:")
+    lines.append("                dictionary[key] = fieldValue(value)")
+    lines.append("    return dictionary")
+    namespace = {"PLAIN_TYPES": PLAIN_TYPES, "fieldValue": fieldValue}
+    exec("\n".join(lines), namespace)
+    serializer = namespace["serialize"]
+    serializer.__qualname__ = cls.__name__ + "._serialize"
+    return serializer
+
+
 def dictList(oldlist):
     """Converts lists of silbot.types Objects into list of dictionaries, the main utility of this function is internal
 
@@ -106,13 +207,72 @@ def dictList(oldlist):
     for i in oldlist:
         if type(i) == list:
             newlist.append(dictList(i))
-        elif i.__class__.__module__ == "silbot.types":
+        elif hasattr(type(i), "_serialize"):
             newlist.append(toDict(i))
         else:
             newlist.append(i)
     return newlist
 
 
+def toBody(arguments):
+    """Converts the arguments of a request into a dict that can be json encoded, the main utility of this function is internal
+
+    `None` values are removed and silbot.types Objects, also inside lists, are turned into dictionaries
+    - - - - -
+    **Args**:
+
+    - `arguments` (`dict`): arguments of the request
+
+    **Returns**
+    - `dict` with the arguments that are not `None`
+    """
+    body = {}
+    for key, value in arguments.items():
+        if value is None:
+            continue
+        if type(value) == list:
+            body[key] = dictList(value)
+        elif hasattr(type(value), "_serialize"):
+            body[key] = toDict(value)
+        else:
+            body[key] = value
+    return body
+
+
+def toParams(arguments):
+    """Converts the arguments of a request into query string parameters, the main utility of this function is internal
+
+    `None` values are removed, booleans are turned into `true`/`false` and lists or dicts are json encoded
+    - - - - -
+    **Args**:
+
+    - `arguments` (`dict`): arguments of the request
+
+    **Returns**
+    - `dict` of parameters that can be sent in a query string
+    """
+    params = toBody(arguments)
+    for key, value in params.items():
+        if type(value) == bool:
+            params[key] = "true" if value else "false"
+        elif type(value) == dict or type(value) == list:
+            params[key] = codec.dumps(value)
+    return params
+
+
+def inputFile(file, filename=None, content_type=None):
+    """
+    Returns an `InputFile` to upload a file, it can be used for every `InputFile` argument of botApi methods
+
+    Arguments:
+
+    - `file`: path of the file (`str` or `os.PathLike`), binary file object, `bytes` or `memoryview`
+    - `filename` (`string`, optional): name of the file shown in Telegram, defaults to the name of the path or of the file object
+    - `content_type` (`string`, optional): MIME type of the file, defaults to `application/octet-stream`
+    """
+    return types.InputFile({"file": file, "filename": filename, "content_type": content_type})
+
+
 def inlineKBData(text, callback_data=""):
     """
     Returns an `InlineKeyboardButton` with `callback_data` field
@@ -1,11 +1,16 @@
 """
 ## Here there are some extra methods for [types](types.m.html) objects
 """
+import hashlib
+import io
+import os
 
 
 class InlineKeyboardMarkup:
     """types.InlineKeyboardMarkup will inherit this class' methods"""
 
+    __slots__ = ()
+
     def __init__(self, inline_keyboard=None):
         if inline_keyboard is None:
             inline_keyboard = []
@@ -33,6 +38,8 @@ class InlineKeyboardMarkup:
 class ReplyKeyboardMarkup:
     """types.KeyboardMarkup will inherit this class' methods"""
 
+    __slots__ = ()
+
     def __init__(self, keyboard=None):
         if keyboard is None:
             keyboard = []
@@ -59,6 +66,9 @@ class ReplyKeyboardMarkup:
 
 class CallbackQuery:
     """types.CallbackQuery will inherit this class' methods"""
+
+    __slots__ = ()
+
     def __init__(self, id, user_id):
         self.id = id
         self.user_id = user_id
@@ -84,6 +94,9 @@ class CallbackQuery:
 
 class User:
     """types.User will inherit this class' methods"""
+
+    __slots__ = ("db_manager", "db")
+
     def __init__(self, id, type):
         self.id = id
         self.type = type
@@ -188,6 +201,9 @@ class User:
 
 class Chat:
     """types.Chat will inherit this class' methods"""
+
+    __slots__ = ("db_manager", "db")
+
     def __init__(self, id, type):
         self.id = id
         self.type = type
@@ -288,3 +304,116 @@ class Chat:
             if obj.status == "administrator" or obj.status == "creator":
                 return True
         return False
+
+
+class InputFile:
+    """types.InputFile will inherit this class' methods
+
+    The `file` key of the dictionary can be a path (`str` or `os.PathLike`), a binary file object, `bytes` or a `memoryview`,
+    `filename` and `content_type` are optional. Use `helper.inputFile` to create it
+    """
+
+    __slots__ = ()
+
+    def __init__(self, file, filename=None, content_type=None):
+        self.file = file
+        self.filename = filename
+        self.content_type = content_type
+
+    def getName(self):
+        """Returns the name of the file sent to botAPI
+
+        **Returns**
+        - `str` the `filename` key, or the name of the path or of the file object, `file` if there is neither
+        """
+        file = self.dict.get("file")
+        if self.dict.get("filename") is not None:
+            return self.dict["filename"]
+        if isinstance(file, (str, os.PathLike)):
+            return os.path.basename(file)
+        if isinstance(getattr(file, "name", None), str):
+            return os.path.basename(file.name)
+        return "file"
+
+    def getSize(self):
+        """Returns the number of bytes that will be uploaded
+
+        **Returns**
+        - `int` size of the file, `None` if it can't be known without reading it (ex. a pipe)
+        """
+        file = self.dict.get("file")
+        if isinstance(file, (str, os.PathLike)):
+            return os.path.getsize(file)
+        if isinstance(file, (bytes, bytearray)):
+            return len(file)
+        if isinstance(file, memoryview):
+            return file.nbytes
+        try:
+            if file.seekable():
+                position = file.tell()
+                size = file.seek(0, io.SEEK_END) - position
+                file.seek(position)
+                return size
+        except (AttributeError, OSError):
+            pass
+        return None
+
+    def iterChunks(self, chunk_size=65536):
+        """Reads the file in chunks, so that it is never loaded entirely in memory
+
+        Paths are opened and closed by this method, file objects are read from their current position
+
+        **Args**:
+
+        - `chunk_size` (`int`): maximum size of every chunk in bytes
+
+        **Returns**
+        - `generator` of `bytes`
+        """
+        file = self.dict.get("file")
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            view = memoryview(file).cast("B")
+            for start in range(0, view.nbytes, chunk_size):
+                yield bytes(view[start:start + chunk_size])
+            return
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                yield from iter(lambda: f.read(chunk_size), b"")
+            return
+        yield from iter(lambda: file.read(chunk_size), b"")
+
+    def isReusable(self):
+        """Returns `True` if the file can be read more than once, like paths and `bytes`
+
+        **Returns**
+        - `bool`, `False` for file objects
+        """
+        return isinstance(self.dict.get("file"), (str, os.PathLike, bytes, bytearray, memoryview))
+
+    def getDigest(self, chunk_size=65536):
+        """Returns the sha256 of the content of the file, used by `silbot.filecache` to recognize files already uploaded
+
+        File objects are read from their current position, which is restored afterwards
+
+        **Args**:
+
+        - `chunk_size` (`int`): maximum size in bytes of the chunks read from the file
+
+        **Returns**
+        - `str` hex digest, `None` if the file can't be read twice (ex. a pipe)
+        """
+        file = self.dict.get("file")
+        position = None
+        if not isinstance(file, (str, os.PathLike, bytes, bytearray, memoryview)):
+            try:
+                if not file.seekable():
+                    return None
+                position = file.tell()
+            except (AttributeError, OSError):
+                return None
+        digest = hashlib.sha256()
+        for chunk in self.iterChunks(chunk_size):
+            digest.update(chunk)
+        if position is not None:
+            file.seek(position)
+        return digest.hexdigest()
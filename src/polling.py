@@ -0,0 +1,245 @@
+"""
+## This module's purpose is to receive updates from botApi with getUpdates
+
+`pollUpdates` requests a new batch only when the previous one has been elaborated, while `UpdatePoller` keeps
+polling in another thread, so the next long poll is already in flight while the current batch is dispatched.
+
+When getUpdates fails the pollers wait before retrying: flood errors wait the `retry_after` given by botAPI,
+other errors wait an exponential `Backoff` with jitter and authentication errors stop polling with a `BotAPIError`.
+"""
+
+import queue
+import random
+import time
+from threading import Thread
+
+from silbot import botapi, codec
+from silbot.response import BotAPIResponse, BotAPIError
+
+CONNECTION_ERROR = "connection_error"
+"""Error state: botAPI could not be reached"""
+FLOOD = "flood"
+"""Error state: too many requests (429), the poller waits `retry_after` seconds"""
+CONFLICT = "conflict"
+"""Error state: another getUpdates request or a webhook is active for the bot (409)"""
+SERVER_ERROR = "server_error"
+"""Error state: botAPI returned a 5xx error or a response that is not valid JSON"""
+FATAL = "fatal"
+"""Error state: the token is not valid (401, 404), polling is stopped"""
+ERROR = "error"
+"""Error state: any other error, ex. a bad request"""
+
+
+class Backoff:
+    """
+    Exponential backoff with jitter, used to wait between failed requests
+    """
+
+    def __init__(self, base: float = 1, maximum: float = 60, factor: float = 2, jitter: float = 0.5):
+        """Creates a backoff, the n-th consecutive delay is `base * factor ** n`, at most `maximum`
+
+        **Args:**
+
+        - base (`float`, optional): seconds to wait after the first failure. Defaults to `1`
+        - maximum (`float`, optional): maximum seconds to wait. Defaults to `60`
+        - factor (`float`, optional): multiplier applied after every failure. Defaults to `2`
+        - jitter (`float`, optional): fraction of the delay that is randomized, from 0 to 1. Defaults to `0.5`
+        """
+        self.base = base
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.attempts = 0
+        """Number of consecutive failures"""
+
+    def next(self):
+        """Registers a failure and returns how many seconds to wait
+
+        **Returns:**
+
+        - `float` seconds to wait
+        """
+        delay = min(self.maximum, self.base * self.factor ** self.attempts)
+        self.attempts += 1
+        return delay - random.uniform(0, delay * self.jitter)
+
+    def reset(self):
+        """Resets the consecutive failures, call it after a success"""
+        self.attempts = 0
+
+
+def classifyError(response: BotAPIResponse):
+    """Returns the error state of a failed getUpdates response
+
+    **Args:**
+
+    - response (`BotAPIResponse`): the failed response
+
+    **Returns:**
+
+    - `str` one of `CONNECTION_ERROR`, `FLOOD`, `CONFLICT`, `SERVER_ERROR`, `FATAL` or `ERROR`
+    """
+    if response.connection_error:
+        return CONNECTION_ERROR
+    if response.error_code == 429:
+        return FLOOD
+    if response.error_code == 409:
+        return CONFLICT
+    if response.error_code in (401, 404):
+        return FATAL
+    if response.error_code is not None and response.error_code >= 500:
+        return SERVER_ERROR
+    return ERROR
+
+
+def invalidResponse():
+    """Returns the `BotAPIResponse` used when botAPI answers getUpdates with a body that can't be parsed, ex. the HTML page of a proxy
+
+    It is a 502 error, so it's classified as `SERVER_ERROR` and polling waits the backoff
+
+    **Returns:**
+
+    - `BotAPIResponse`
+    """
+    return BotAPIResponse(codec.dumpBytes({
+        "ok": False, "error_code": 502, "description": "Bad Gateway: the response of botAPI is not valid JSON",
+    }))
+
+
+def errorDelay(response: BotAPIResponse, backoff: Backoff, on_error=None):
+    """Returns how many seconds to wait before repeating a failed getUpdates request
+
+    **Args:**
+
+    - response (`BotAPIResponse`): the failed response
+    - backoff (`Backoff`): backoff of the poller
+    - on_error (`function`, optional): a function that is called with the error state, the response and the seconds to wait (`None` for `FATAL`)
+
+    **Returns:**
+
+    - `float` seconds to wait
+
+    **Raises:**
+
+    - `BotAPIError`: if the error is `FATAL`
+    """
+    state = classifyError(response)
+    if state == FATAL:
+        if on_error is not None:
+            on_error(state, response, None)
+        raise BotAPIError(response)
+    if state == FLOOD and response.retry_after is not None:
+        delay = response.retry_after
+    else:
+        delay = backoff.next()
+    if on_error is not None:
+        on_error(state, response, delay)
+    return delay
+
+
+def pollUpdates(bot: botapi.BotApi, timeout: int = 30, limit: int = None, allowed_updates: list = None,
+                on_getUpdates=None, backoff: Backoff = None, on_error=None):
+    """Generator that yields the batches of updates received with getUpdates
+
+    The updates of a batch are confirmed by the next getUpdates call, which is done when the next batch is requested.
+    Failed requests are repeated after the delay given by `errorDelay`
+
+    **Args:**
+
+    - bot (`botApi`): botApi object
+    - timeout (`int`, optional): long polling timeout in seconds. Defaults to `30`
+    - limit (`int`, optional): maximum number of updates for every batch, 1-100. Defaults to `None` (100)
+    - allowed_updates (`list`, optional): list of the update types you want your bot to receive. Defaults to `None`
+    - on_getUpdates (`function`, optional): a function that is called everytime a getUpdates call is done
+    - backoff (`Backoff`, optional): backoff used after errors. Defaults to `Backoff()`
+    - on_error (`function`, optional): a function that is called when getUpdates fails, see `errorDelay`
+
+    **Yields:**
+
+    - `list` of json_decoded updates, never empty
+
+    **Raises:**
+
+    - `BotAPIError`: if the token is not valid
+    """
+    if backoff is None:
+        backoff = Backoff()
+    offset = -1
+    while True:
+        try:
+            response = bot.getUpdates(offset, limit, timeout, allowed_updates)[1]
+        except (ValueError, KeyError):
+            response = invalidResponse()
+        if on_getUpdates is not None:
+            on_getUpdates()
+        if not response.ok:
+            time.sleep(errorDelay(response, backoff, on_error))
+            continue
+        backoff.reset()
+        js = response.decoded
+        if len(js["result"]) > 0:
+            offset = js["result"][-1]["update_id"] + 1
+            yield js["result"]
+
+
+class UpdatePoller(Thread):
+    """
+    Polls updates in another thread and queues the received batches
+    """
+
+    def __init__(self, bot: botapi.BotApi, timeout: int = 30, limit: int = None, allowed_updates: list = None,
+                 on_getUpdates=None, prefetch: int = 1, backoff: Backoff = None, on_error=None):
+        """Creates the poller, call `start` to begin polling
+
+        A batch is confirmed to botAPI only after it has been put in the queue, so every update is given
+        exactly once to `get`. When the queue already holds `prefetch` batches the poller stops requesting updates.
+
+        **Args:**
+
+        - bot (`botApi`): botApi object
+        - timeout (`int`, optional): long polling timeout in seconds. Defaults to `30`
+        - limit (`int`, optional): maximum number of updates for every batch, 1-100. Defaults to `None` (100)
+        - allowed_updates (`list`, optional): list of the update types you want your bot to receive. Defaults to `None`
+        - on_getUpdates (`function`, optional): a function that is called everytime a getUpdates call is done
+        - prefetch (`int`, optional): maximum number of batches received but not yet taken with `get`. Defaults to `1`
+        - backoff (`Backoff`, optional): backoff used after errors. Defaults to `Backoff()`
+        - on_error (`function`, optional): a function that is called when getUpdates fails, see `errorDelay`
+        """
+        Thread.__init__(self, name="silbot-poller", daemon=True)
+        self.bot = bot
+        self.timeout = timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.on_getUpdates = on_getUpdates
+        self.backoff = backoff
+        self.on_error = on_error
+        self.batches = queue.Queue(prefetch)
+
+    def run(self):
+        """
+        This is callen when the thread starts, it puts every batch received in `self.batches`
+
+        If polling stops because of an exception, the exception is put in the queue and raised by `get`
+        """
+        try:
+            for batch in pollUpdates(self.bot, self.timeout, self.limit, self.allowed_updates, self.on_getUpdates,
+                                     self.backoff, self.on_error):
+                self.batches.put(batch)
+        except Exception as e:
+            self.batches.put(e)
+
+    def get(self):
+        """Waits for the next batch of updates
+
+        **Returns:**
+
+        - `list` of json_decoded updates
+
+        **Raises:**
+
+        - `BotAPIError`: if polling was stopped because the token is not valid
+        """
+        batch = self.batches.get()
+        if isinstance(batch, Exception):
+            raise batch
+        return batch
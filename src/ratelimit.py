@@ -0,0 +1,291 @@
+"""
+## This module's purpose is to send messages without exceeding the limits of botAPI
+
+Telegram allows about 30 messages per second to different chats, 1 message per second to the same private chat
+and 20 messages per minute to the same group. A `RateLimiter` given to `BotApi(rate_limiter=...)` has a token bucket
+for the whole bot, one for every chat and one for every group: a message that would exceed a limit waits until it
+can be sent, so messages are spread over time instead of being refused with a flood error.
+The same limiter works with `AsyncBotApi`, where the wait doesn't block the event loop.
+
+Requests have a priority: `INTERACTIVE` requests, like replies to commands, reserve their time in their chat as soon
+as they are sent and take the global budget when they are due, while `BULK` requests, like broadcasts, only take the budget left free by interactive requests, so they never
+delay them. The priority is chosen for every method with `method_priorities` or for a block of calls with
+`BotApi.priority`, ex. `with bot.priority(ratelimit.BULK): bot.sendMessage(chat_id, text)`
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+
+LIMITED_METHODS = frozenset({
+    "sendMessage", "forwardMessage", "copyMessage", "sendPhoto", "sendAudio", "sendDocument", "sendVideo",
+    "sendAnimation", "sendVoice", "sendVideoNote", "sendMediaGroup", "sendLocation", "sendVenue", "sendContact",
+    "sendPoll", "sendDice", "sendSticker", "sendInvoice", "sendGame",
+})
+"""Methods that send a message, the other methods are not limited"""
+
+INTERACTIVE = "interactive"
+"""Priority of requests that are sent as soon as the limits allow it"""
+BULK = "bulk"
+"""Priority of requests that are sent only with the budget left free by `INTERACTIVE` requests"""
+
+current_priority = contextvars.ContextVar("current_priority", default=None)
+"""Priority of the requests sent in the current context, set by `priority`"""
+
+
+@contextlib.contextmanager
+def priority(name):
+    """Context manager that sets the priority of the requests sent inside it, `BotApi.priority` returns it
+
+    The priority is kept by a context variable: it applies to the current thread or asyncio task
+
+    **Args:**
+
+    - name (`str`): `INTERACTIVE` or `BULK`
+    """
+    token = current_priority.set(name)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+def isGroup(chat_id):
+    """Returns `True` if a `chat_id` is a group or a channel, they have negative ids or `@username`
+
+    **Args:**
+
+    - chat_id (`int` or `str`): chat_id of a request
+
+    **Returns:**
+
+    - `bool`
+    """
+    if type(chat_id) == str:
+        return chat_id.startswith("@") or chat_id.startswith("-")
+    return chat_id < 0
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second, with bursts of at most `capacity` requests
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, now: float = None):
+        """Creates a full bucket
+
+        **Args:**
+
+        - rate (`float`): tokens added every second
+        - capacity (`float`, optional): maximum number of tokens. Defaults to `1`
+        - now (`float`, optional): creation time, from `time.monotonic`. Defaults to the current time
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = now if now is not None else time.monotonic()
+
+    def availableAt(self, now):
+        """Returns the first time, from `now`, when a token is available"""
+        start = max(now, self.last)
+        tokens = min(self.capacity, self.tokens + (start - self.last) * self.rate)
+        return start + max(0.0, 1 - tokens) / self.rate
+
+    def consume(self, at):
+        """Takes a token at the time `at`, returned by `availableAt`"""
+        self.tokens = min(self.capacity, self.tokens + (at - self.last) * self.rate) - 1
+        self.last = at
+
+    def tokensAt(self, now):
+        """Returns the tokens of the bucket at the time `now`, negative if they have been reserved"""
+        if now <= self.last:
+            return self.tokens - (self.last - now) * self.rate
+        return min(self.capacity, self.tokens + (now - self.last) * self.rate)
+
+    def isIdle(self, now):
+        """Returns `True` if the bucket is full, so it can be removed"""
+        return now >= self.last and self.tokens + (now - self.last) * self.rate >= self.capacity
+
+
+class RateLimiter:
+    """
+    Token buckets for the whole bot, for private chats and for groups
+    """
+
+    def __init__(self, global_rate: float = 30, private_rate: float = 1, group_rate: float = 20 / 60,
+                 global_burst: float = 5, private_burst: float = 1, group_burst: float = 3,
+                 methods=LIMITED_METHODS, max_chats: int = 10000, method_priorities: dict = None,
+                 bulk_headroom: float = 1):
+        """Creates the rate limiter
+
+        **Args:**
+
+        - global_rate (`float`, optional): messages per second of the whole bot. Defaults to `30`
+        - private_rate (`float`, optional): messages per second to the same private chat. Defaults to `1`
+        - group_rate (`float`, optional): messages per second to the same group or channel. Defaults to `20 / 60`
+        - global_burst (`float`, optional): messages of the whole bot that can be sent together. Defaults to `5`
+        - private_burst (`float`, optional): messages to the same private chat that can be sent together. Defaults to `1`
+        - group_burst (`float`, optional): messages to the same group that can be sent together. Defaults to `3`
+        - methods (`set`, optional): methods that are limited. Defaults to `LIMITED_METHODS`
+        - max_chats (`int`, optional): number of chat buckets after which the full ones are removed. Defaults to `10000`
+        - method_priorities (`dict`, optional): priority of the methods, ex. `{"copyMessage": BULK}`, the others are `INTERACTIVE`. Defaults to `None`
+        - bulk_headroom (`float`, optional): tokens of the global bucket that `BULK` requests leave to `INTERACTIVE` ones. Defaults to `1`
+        """
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.private_rate = private_rate
+        self.private_burst = private_burst
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.methods = methods
+        self.max_chats = max_chats
+        self.method_priorities = method_priorities if method_priorities is not None else {}
+        self.bulk_headroom = bulk_headroom
+        self.chats = {}
+        self.lock = threading.Lock()
+        self.limited_requests = 0
+        """Number of requests that passed through the limiter"""
+        self.delayed_requests = 0
+        """Number of requests that had to wait"""
+        self.delayed_time = 0.0
+        """Total seconds waited by the requests"""
+        self.bulk_requests = 0
+        """Number of `BULK` requests that passed through the limiter"""
+        self.bulk_delayed_time = 0.0
+        """Total seconds waited by the `BULK` requests"""
+
+    def chatBucket(self, chat_id, now):
+        """Returns the bucket of a chat, creating it if needed"""
+        key = str(chat_id)
+        bucket = self.chats.get(key)
+        if bucket is None:
+            if len(self.chats) >= self.max_chats:
+                self.chats = {k: b for k, b in self.chats.items() if not b.isIdle(now)}
+            if isGroup(chat_id):
+                bucket = TokenBucket(self.group_rate, self.group_burst, now)
+            else:
+                bucket = TokenBucket(self.private_rate, self.private_burst, now)
+            self.chats[key] = bucket
+        return bucket
+
+    def priorityOf(self, method):
+        """Returns the priority of a request: the one of the current context, or the one of the method
+
+        **Args:**
+
+        - method (`str`): request method, like sendMessage
+
+        **Returns:**
+
+        - `str` `INTERACTIVE` or `BULK`
+        """
+        name = current_priority.get()
+        if name is not None:
+            return name
+        return self.method_priorities.get(method, INTERACTIVE)
+
+    def reserve(self, method, arguments, priority: str = INTERACTIVE, booked: bool = False):
+        """Reserves the sending time of a request and returns how long it has to wait
+
+        An `INTERACTIVE` request books its time in the bucket of its chat, so the messages to the same chat are sent in order,
+        and takes the token of the global bucket only when it is available, so a chat with many queued messages doesn't delay
+        the other chats. A `BULK` request is accepted only if it can be sent now leaving `bulk_headroom` tokens in the global
+        bucket. When the returned `bool` is `False` the request has to call `reserve` again after the returned delay,
+        with `booked=True` if it is `INTERACTIVE`
+
+        **Args:**
+
+        - method (`str`): request method, like sendMessage
+        - arguments (`dict`): request's parameters
+        - priority (`str`, optional): `INTERACTIVE` or `BULK`. Defaults to `INTERACTIVE`
+        - booked (`bool`, optional): `True` if a previous call already booked the time in the bucket of the chat. Defaults to `False`
+
+        **Returns:**
+
+        - `tuple` with the `float` seconds to wait as first member and a `bool`, `True` if the request can be sent after them, as second member
+        """
+        if method not in self.methods:
+            return 0, True
+        now = time.monotonic()
+        chat_id = arguments.get("chat_id")
+        with self.lock:
+            chat = self.chatBucket(chat_id, now) if chat_id is not None else None
+            if priority == BULK:
+                headroom = min(self.bulk_headroom, self.global_bucket.capacity - 1)
+                needed = 1 + headroom - self.global_bucket.tokensAt(now)
+                at = chat.availableAt(now) if chat is not None else now
+                if needed > 0 or at > now:
+                    return max(at - now, needed / self.global_bucket.rate), False
+                if chat is not None:
+                    chat.consume(now)
+                self.global_bucket.consume(now)
+                self.limited_requests += 1
+                self.bulk_requests += 1
+                return 0, True
+            if chat is not None and not booked:
+                at = chat.availableAt(now)
+                chat.consume(at)
+                if at > now:
+                    return at - now, False
+            at = self.global_bucket.availableAt(now)
+            if at > now:
+                return at - now, False
+            self.global_bucket.consume(now)
+            self.limited_requests += 1
+        return 0, True
+
+    def record(self, priority, waited):
+        """Registers the seconds waited by a request"""
+        if waited <= 0:
+            return
+        with self.lock:
+            self.delayed_requests += 1
+            self.delayed_time += waited
+            if priority == BULK:
+                self.bulk_delayed_time += waited
+
+    def wait(self, method, arguments):
+        """Waits until a request can be sent, it is called by `BotApi.sendRequest`"""
+        priority = self.priorityOf(method)
+        waited = 0
+        booked = False
+        while True:
+            delay, reserved = self.reserve(method, arguments, priority, booked)
+            if delay > 0:
+                time.sleep(delay)
+                waited += delay
+            if reserved:
+                return self.record(priority, waited)
+            booked = True
+
+    async def asyncWait(self, method, arguments):
+        """Waits until a request can be sent without blocking the event loop, it is called by `AsyncBotApi.sendRequest`"""
+        priority = self.priorityOf(method)
+        waited = 0
+        booked = False
+        while True:
+            delay, reserved = self.reserve(method, arguments, priority, booked)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                waited += delay
+            if reserved:
+                return self.record(priority, waited)
+            booked = True
+
+    def stats(self):
+        """Returns the metrics of the limiter
+
+        **Returns:**
+
+        - `dict` with `limited_requests`, `delayed_requests`, `delayed_time`, `bulk_requests`, `bulk_delayed_time` and `chats`, the number of chat buckets
+        """
+        with self.lock:
+            return {
+                "limited_requests": self.limited_requests,
+                "delayed_requests": self.delayed_requests,
+                "delayed_time": self.delayed_time,
+                "bulk_requests": self.bulk_requests,
+                "bulk_delayed_time": self.bulk_delayed_time,
+                "chats": len(self.chats),
+            }
@@ -1,7 +1,7 @@
 """
 ## This module's purpose is to handle botApi responses
 """
-import json
+from silbot import codec
 
 
 class BotAPIResponse:
@@ -16,13 +16,13 @@ class BotAPIResponse:
         - - - - -
         **Args**:
 
-        - `raw_json` (string): JSON string of the response
+        - `raw_json` (`bytes` or `str`): JSON of the response, decoded with `silbot.codec`
         - `expected_object` (any type, optional): Can be any expected result by botApi like types.Message or bool, to generate the object. Defaults to None.
         """
         self.raw = raw_json
-        """JSON String given by APIs"""
-        self.decoded = json.loads(raw_json)
-        """JSON dictionary decoded with `json.loads`"""
+        """JSON given by APIs, `bytes` as received from botAPI"""
+        self.decoded = codec.loads(raw_json)
+        """JSON dictionary decoded with `silbot.codec.loads`"""
         self.ok = self.decoded["ok"]
         """`True` if the request was executed with success, `False` if not"""
         self.error_code = None
@@ -31,17 +31,20 @@ class BotAPIResponse:
         """Error description given by botAPI, if there is no error it is set to `None`"""
         self.connection_error = None
         """bool, True if there was a connection error, False if not"""
-        if (not self.decoded["ok"]) and "result" in self.decoded:
+        self.retry_after = None
+        """Seconds to wait before the request can be repeated after a flood error (429), if there is no flood error it is set to `None`"""
+        self.expected_object = expected_object
+        if not self.decoded["ok"]:
             if "error_code" in self.decoded:
                 self.error_code = self.decoded["error_code"]
             if "description" in self.decoded:
                 self.description = self.decoded["description"]
+            if "parameters" in self.decoded and "retry_after" in self.decoded["parameters"]:
+                self.retry_after = self.decoded["parameters"]["retry_after"]
             if "connection_error" in self.decoded:
                 self.connection_error = self.decoded["connection_error"]
             else:
                 self.connection_error = False
-        else:
-            self.expected_object = expected_object
 
     def getObject(self):
         """Get the best object for the response
@@ -75,3 +78,20 @@ class BotAPIResponse:
             return func(self.decoded["result"])
         else:
             return None
+
+
+class BotAPIError(Exception):
+    """
+    Raised when botAPI returns an error that can't be recovered, like an invalid token
+    """
+
+    def __init__(self, response: BotAPIResponse):
+        """Creates the exception for the given response
+
+        **Args**:
+
+        - `response` (`BotAPIResponse`): response that contains the error
+        """
+        self.response = response
+        """`BotAPIResponse` that contains the error"""
+        Exception.__init__(self, str(response.error_code) + ": " + str(response.description))
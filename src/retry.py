@@ -0,0 +1,194 @@
+"""
+## This module's purpose is to repeat the requests that failed for a network error
+
+A request can fail before it reaches botAPI (`CONNECT`: the connection couldn't be opened) or after it was sent
+(`READ`: the connection was closed or the answer didn't arrive in time, `SERVER`: botAPI answered with a 5xx error).
+Repeating a request of the first kind is always safe, while a request of the other kinds could have been executed:
+repeating a sendMessage could send the message twice. `RetryPolicy` repeats every failure of the idempotent methods,
+like getChat or editMessageText, and only the `CONNECT` failures of the other methods, unless configured otherwise.
+"""
+
+import asyncio
+import http
+import random
+import threading
+import time
+
+import requests
+import urllib3
+
+from silbot import codec
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+CONNECT = "connect"
+"""Failure kind: the request wasn't sent"""
+READ = "read"
+"""Failure kind: the request was sent but the answer wasn't received"""
+SERVER = "server"
+"""Failure kind: botAPI answered with a 5xx error"""
+
+NEVER = "never"
+"""Policy for methods that are not idempotent: they are never repeated"""
+ALWAYS = "always"
+"""Policy for methods that are not idempotent: they are repeated like idempotent methods, they could be executed twice"""
+
+IDEMPOTENT_METHODS = frozenset({
+    "getUpdates", "setWebhook", "deleteWebhook", "getWebhookInfo", "getMe", "editMessageLiveLocation",
+    "stopMessageLiveLocation", "sendChatAction", "getUserProfilePhotos", "getFile", "banChatMember",
+    "unbanChatMember", "restrictChatMember", "promoteChatMember", "setChatAdministratorCustomTitle",
+    "banChatSenderChat", "unbanChatSenderChat", "setChatPermissions", "editChatInviteLink", "approveChatJoinRequest",
+    "declineChatJoinRequest", "setChatPhoto", "deleteChatPhoto", "setChatTitle", "setChatDescription",
+    "pinChatMessage", "unpinAllChatMessages", "leaveChat", "getChat", "getChatAdministrators",
+    "getChatMemberCount", "getChatMember", "setChatStickerSet", "deleteChatStickerSet", "getForumTopicIconStickers",
+    "editForumTopic", "closeForumTopic", "reopenForumTopic", "deleteForumTopic", "unpinAllForumTopicMessages",
+    "answerCallbackQuery", "setMyCommands", "deleteMyCommands", "getMyCommands", "setChatMenuButton",
+    "getChatMenuButton", "setMyDefaultAdministratorRights", "getMyDefaultAdministratorRights", "editMessageText",
+    "editMessageCaption", "editMessageMedia", "editMessageReplyMarkup", "stopPoll", "deleteMessage",
+    "getStickerSet", "getCustomEmojiStickers", "setStickerPositionInSet", "deleteStickerFromSet",
+    "setStickerSetThumb", "answerInlineQuery", "answerShippingQuery", "answerPreCheckoutQuery",
+    "setPassportDataErrors", "setGameScore", "getGameHighScores",
+})
+"""Methods that have the same effect if they are executed more than once.
+`unpinChatMessage` is not one of them: without `message_id` every call unpins the most recent pinned message"""
+
+
+def classifyException(e):
+    """Returns the failure kind of an exception raised by requests or aiohttp
+
+    **Args:**
+
+    - e (`Exception`): exception raised while sending a request
+
+    **Returns:**
+
+    - `str` `CONNECT` or `READ`
+    """
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return CONNECT
+    if isinstance(e, requests.exceptions.ConnectionError):
+        reason = e.args[0] if e.args else None
+        reason = getattr(reason, "reason", reason)
+        if isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError)):
+            return CONNECT
+        return READ
+    if aiohttp is not None and isinstance(e, aiohttp.ClientConnectorError):
+        return CONNECT
+    if aiohttp is not None and hasattr(aiohttp, "ConnectionTimeoutError") and isinstance(e, aiohttp.ConnectionTimeoutError):
+        return CONNECT
+    return READ
+
+
+def serverError(status, raw_json):
+    """Returns the response of a 5xx error as botAPI JSON, the main utility of this function is internal
+
+    Proxies and load balancers in front of botAPI answer 5xx errors with HTML pages, that can't be parsed as responses
+
+    **Args:**
+
+    - status (`int`): HTTP status of the response
+    - raw_json (`bytes` or `str`): body of the response
+
+    **Returns:**
+
+    - `raw_json` if it is a botAPI response, otherwise `bytes` with `ok` false, the status as `error_code` and the reason as `description`
+    """
+    try:
+        decoded = codec.loads(raw_json)
+    except ValueError:
+        decoded = None
+    if type(decoded) == dict and "ok" in decoded:
+        return raw_json
+    try:
+        description = http.HTTPStatus(status).phrase
+    except ValueError:
+        description = "Server error"
+    return codec.dumpBytes({"ok": False, "error_code": status, "description": description})
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are repeated and how long to wait before
+    """
+
+    def __init__(self, retries: int = 2, unsafe: str = CONNECT, base: float = 0.5, maximum: float = 10,
+                 idempotent_methods=IDEMPOTENT_METHODS):
+        """Creates the policy
+
+        **Args:**
+
+        - retries (`int`, optional): maximum number of times a request is repeated, `0` to never repeat. Defaults to `2`
+        - unsafe (`str`, optional): failures repeated for methods that are not idempotent: `CONNECT`, `NEVER` or `ALWAYS`. Defaults to `CONNECT`
+        - base (`float`, optional): seconds waited before the first retry, they are doubled at every retry. Defaults to `0.5`
+        - maximum (`float`, optional): maximum seconds waited before a retry. Defaults to `10`
+        - idempotent_methods (`set`, optional): methods that are repeated after any failure. Defaults to `IDEMPOTENT_METHODS`
+        """
+        self.retries = retries
+        self.unsafe = unsafe
+        self.base = base
+        self.maximum = maximum
+        self.idempotent_methods = idempotent_methods
+        self.lock = threading.Lock()
+        self.retried = {CONNECT: 0, READ: 0, SERVER: 0}
+        """Number of requests repeated for every failure kind"""
+
+    def shouldRetry(self, method, kind, attempt):
+        """Returns `True` if a failed request has to be repeated
+
+        **Args:**
+
+        - method (`str`): request method, like sendMessage
+        - kind (`str`): failure kind, `CONNECT`, `READ` or `SERVER`
+        - attempt (`int`): how many times the request was already repeated
+
+        **Returns:**
+
+        - `bool`
+        """
+        if attempt >= self.retries:
+            return False
+        if method in self.idempotent_methods or self.unsafe == ALWAYS:
+            retry = True
+        elif self.unsafe == CONNECT:
+            retry = kind == CONNECT
+        else:
+            retry = False
+        if retry:
+            with self.lock:
+                self.retried[kind] += 1
+        return retry
+
+    def delay(self, attempt):
+        """Returns the seconds to wait before repeating a request, with jitter
+
+        **Args:**
+
+        - attempt (`int`): how many times the request was already repeated
+
+        **Returns:**
+
+        - `float` seconds
+        """
+        delay = min(self.maximum, self.base * 2 ** attempt)
+        return delay - random.uniform(0, delay / 2)
+
+    def wait(self, attempt):
+        """Waits before repeating a request"""
+        time.sleep(self.delay(attempt))
+
+    async def asyncWait(self, attempt):
+        """Waits before repeating a request without blocking the event loop"""
+        await asyncio.sleep(self.delay(attempt))
+
+    def stats(self):
+        """Returns the number of requests repeated for every failure kind
+
+        **Returns:**
+
+        - `dict` with `connect`, `read` and `server`
+        """
+        with self.lock:
+            return dict(self.retried)
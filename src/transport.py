@@ -0,0 +1,69 @@
+"""
+## This module's purpose is to send HTTP requests over a Unix socket
+
+A [local Bot API server](https://github.com/tdlib/telegram-bot-api) running on the same machine can be reached
+through a Unix socket (ex. behind a reverse proxy listening on one), skipping the TCP stack.
+`BotApi(unix_socket=path)` mounts a `UnixAdapter` on its session, `AsyncBotApi` uses `aiohttp.UnixConnector`.
+"""
+
+import socket
+
+import requests.adapters
+import urllib3
+from urllib3.connection import HTTPConnection
+
+
+class UnixConnection(HTTPConnection):
+    """
+    HTTP connection to a Unix socket
+    """
+
+    def __init__(self, *args, socket_path=None, **kwargs):
+        HTTPConnection.__init__(self, *args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise urllib3.exceptions.NewConnectionError(self, "Failed to connect to " + self.socket_path + ": " + str(e))
+        return sock
+
+
+class UnixConnectionPool(urllib3.HTTPConnectionPool):
+    """
+    Pool of connections to the Unix socket in `socket_path`
+    """
+
+    ConnectionCls = UnixConnection
+    socket_path = None
+
+    def __init__(self, *args, **kwargs):
+        urllib3.HTTPConnectionPool.__init__(self, *args, **kwargs)
+        self.conn_kw["socket_path"] = self.socket_path
+
+
+class UnixAdapter(requests.adapters.HTTPAdapter):
+    """
+    requests adapter that sends every request to a Unix socket, the host of the URL is only used in the Host header
+    """
+
+    def __init__(self, socket_path: str, **kwargs):
+        """Creates the adapter
+
+        **Args:**
+
+        - socket_path (`str`): path of the Unix socket
+        - **kwargs: arguments of `requests.adapters.HTTPAdapter`, like `pool_maxsize`
+        """
+        self.socket_path = socket_path
+        requests.adapters.HTTPAdapter.__init__(self, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        requests.adapters.HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        pool = type("UnixConnectionPool", (UnixConnectionPool,), {"socket_path": self.socket_path})
+        self.poolmanager.pool_classes_by_scheme = {"http": pool, "https": pool}
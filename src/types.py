@@ -1,5 +1,8 @@
 from silbot import helper, objects
 
+lazy_parsing = False
+"""If `True` the nested objects are parsed only when they are read for the first time, it can be overridden with the `lazy` argument of the constructors"""
+
 
 class Update:
     """This object represents an incoming update.At most one of the optional parameters can be present in any given update.[See on Telegram API](https://core.telegram.org/bots/api#update)
@@ -24,29 +27,38 @@ class Update:
     - `chat_join_request`: `ChatJoinRequest` - Optional. A request to join the chat has been sent. The bot must have the can_invite_users administrator right in the chat to receive these updates.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "update_id", "message", "edited_message", "channel_post", "edited_channel_post", "inline_query", "chosen_inline_result", "callback_query", "shipping_query", "pre_checkout_query", "poll", "poll_answer", "my_chat_member", "chat_member", "chat_join_request")
+    _known = frozenset({"update_id", "message", "edited_message", "channel_post", "edited_channel_post", "inline_query", "chosen_inline_result", "callback_query", "shipping_query", "pre_checkout_query", "poll", "poll_answer", "my_chat_member", "chat_member", "chat_join_request"})
+    _nested = {"message": ("message", "Message"), "edited_message": ("edited_message", "Message"), "channel_post": ("channel_post", "Message"), "edited_channel_post": ("edited_channel_post", "Message"), "inline_query": ("inline_query", "InlineQuery"), "chosen_inline_result": ("chosen_inline_result", "ChosenInlineResult"), "callback_query": ("callback_query", "CallbackQuery"), "shipping_query": ("shipping_query", "ShippingQuery"), "pre_checkout_query": ("pre_checkout_query", "PreCheckoutQuery"), "poll": ("poll", "Poll"), "poll_answer": ("poll_answer", "PollAnswer"), "my_chat_member": ("my_chat_member", "ChatMemberUpdated"), "chat_member": ("chat_member", "ChatMemberUpdated"), "chat_join_request": ("chat_join_request", "ChatJoinRequest")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.update_id = dictionary["update_id"] if "update_id" in dictionary else None
-        self.message = Message(dictionary["message"]) if "message" in dictionary else None
-        self.edited_message = Message(dictionary["edited_message"]) if "edited_message" in dictionary else None
-        self.channel_post = Message(dictionary["channel_post"]) if "channel_post" in dictionary else None
-        self.edited_channel_post = Message(dictionary["edited_channel_post"]) if "edited_channel_post" in dictionary else None
-        self.inline_query = InlineQuery(dictionary["inline_query"]) if "inline_query" in dictionary else None
-        self.chosen_inline_result = ChosenInlineResult(dictionary["chosen_inline_result"]) if "chosen_inline_result" in dictionary else None
-        self.callback_query = CallbackQuery(dictionary["callback_query"]) if "callback_query" in dictionary else None
-        self.shipping_query = ShippingQuery(dictionary["shipping_query"]) if "shipping_query" in dictionary else None
-        self.pre_checkout_query = PreCheckoutQuery(dictionary["pre_checkout_query"]) if "pre_checkout_query" in dictionary else None
-        self.poll = Poll(dictionary["poll"]) if "poll" in dictionary else None
-        self.poll_answer = PollAnswer(dictionary["poll_answer"]) if "poll_answer" in dictionary else None
-        self.my_chat_member = ChatMemberUpdated(dictionary["my_chat_member"]) if "my_chat_member" in dictionary else None
-        self.chat_member = ChatMemberUpdated(dictionary["chat_member"]) if "chat_member" in dictionary else None
-        self.chat_join_request = ChatJoinRequest(dictionary["chat_join_request"]) if "chat_join_request" in dictionary else None
-
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not lazy:
+            self.message = Message(dictionary["message"], lazy) if "message" in dictionary else None
+            self.edited_message = Message(dictionary["edited_message"], lazy) if "edited_message" in dictionary else None
+            self.channel_post = Message(dictionary["channel_post"], lazy) if "channel_post" in dictionary else None
+            self.edited_channel_post = Message(dictionary["edited_channel_post"], lazy) if "edited_channel_post" in dictionary else None
+            self.inline_query = InlineQuery(dictionary["inline_query"], lazy) if "inline_query" in dictionary else None
+            self.chosen_inline_result = ChosenInlineResult(dictionary["chosen_inline_result"], lazy) if "chosen_inline_result" in dictionary else None
+            self.callback_query = CallbackQuery(dictionary["callback_query"], lazy) if "callback_query" in dictionary else None
+            self.shipping_query = ShippingQuery(dictionary["shipping_query"], lazy) if "shipping_query" in dictionary else None
+            self.pre_checkout_query = PreCheckoutQuery(dictionary["pre_checkout_query"], lazy) if "pre_checkout_query" in dictionary else None
+            self.poll = Poll(dictionary["poll"], lazy) if "poll" in dictionary else None
+            self.poll_answer = PollAnswer(dictionary["poll_answer"], lazy) if "poll_answer" in dictionary else None
+            self.my_chat_member = ChatMemberUpdated(dictionary["my_chat_member"], lazy) if "my_chat_member" in dictionary else None
+            self.chat_member = ChatMemberUpdated(dictionary["chat_member"], lazy) if "chat_member" in dictionary else None
+            self.chat_join_request = ChatJoinRequest(dictionary["chat_join_request"], lazy) if "chat_join_request" in dictionary else None
+
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class WebhookInfo:
@@ -66,7 +78,11 @@ class WebhookInfo:
     - `allowed_updates`: `list` - Optional. A list of update types the bot is subscribed to. Defaults to all update types except chat_member
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "url", "has_custom_certificate", "pending_update_count", "ip_address", "last_error_date", "last_error_message", "last_synchronization_error_date", "max_connections", "allowed_updates")
+    _known = frozenset({"url", "has_custom_certificate", "pending_update_count", "ip_address", "last_error_date", "last_error_message", "last_synchronization_error_date", "max_connections", "allowed_updates"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -80,9 +96,9 @@ class WebhookInfo:
         self.max_connections = dictionary["max_connections"] if "max_connections" in dictionary else None
         self.allowed_updates = list(dictionary["allowed_updates"]) if "allowed_updates" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class User(objects.User):
@@ -104,7 +120,11 @@ class User(objects.User):
     - `supports_inline_queries`: `bool` - Optional. True, if the bot supports inline queries. Returned only in getMe.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "id", "is_bot", "first_name", "last_name", "username", "language_code", "is_premium", "added_to_attachment_menu", "can_join_groups", "can_read_all_group_messages", "supports_inline_queries")
+    _known = frozenset({"id", "is_bot", "first_name", "last_name", "username", "language_code", "is_premium", "added_to_attachment_menu", "can_join_groups", "can_read_all_group_messages", "supports_inline_queries"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -120,9 +140,9 @@ class User(objects.User):
         self.can_read_all_group_messages = dictionary["can_read_all_group_messages"] if "can_read_all_group_messages" in dictionary else None
         self.supports_inline_queries = dictionary["supports_inline_queries"] if "supports_inline_queries" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Chat(objects.Chat):
@@ -159,10 +179,18 @@ class Chat(objects.Chat):
     - `location`: `ChatLocation` - Optional. For supergroups, the location to which the supergroup is connected. Returned only in getChat.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "id", "type", "title", "username", "first_name", "last_name", "is_forum", "active_usernames", "emoji_status_custom_emoji_id", "bio", "has_private_forwards", "has_restricted_voice_and_video_messages", "join_to_send_messages", "join_by_request", "description", "invite_link", "slow_mode_delay", "message_auto_delete_time", "has_protected_content", "sticker_set_name", "can_set_sticker_set", "linked_chat_id", "photo", "pinned_message", "permissions", "location")
+    _known = frozenset({"id", "type", "title", "username", "first_name", "last_name", "is_forum", "active_usernames", "emoji_status_custom_emoji_id", "bio", "has_private_forwards", "has_restricted_voice_and_video_messages", "join_to_send_messages", "join_by_request", "description", "invite_link", "slow_mode_delay", "message_auto_delete_time", "has_protected_content", "sticker_set_name", "can_set_sticker_set", "linked_chat_id", "photo", "pinned_message", "permissions", "location"})
+    _nested = {"photo": ("photo", "ChatPhoto"), "pinned_message": ("pinned_message", "Message"), "permissions": ("permissions", "ChatPermissions"), "location": ("location", "ChatLocation")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.id = dictionary["id"] if "id" in dictionary else None
         self.type = dictionary["type"] if "type" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
@@ -170,7 +198,6 @@ class Chat(objects.Chat):
         self.first_name = dictionary["first_name"] if "first_name" in dictionary else None
         self.last_name = dictionary["last_name"] if "last_name" in dictionary else None
         self.is_forum = dictionary["is_forum"] if "is_forum" in dictionary else None
-        self.photo = ChatPhoto(dictionary["photo"]) if "photo" in dictionary else None
         self.active_usernames = list(dictionary["active_usernames"]) if "active_usernames" in dictionary else None
         self.emoji_status_custom_emoji_id = dictionary["emoji_status_custom_emoji_id"] if "emoji_status_custom_emoji_id" in dictionary else None
         self.bio = dictionary["bio"] if "bio" in dictionary else None
@@ -180,19 +207,21 @@ class Chat(objects.Chat):
         self.join_by_request = dictionary["join_by_request"] if "join_by_request" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
         self.invite_link = dictionary["invite_link"] if "invite_link" in dictionary else None
-        self.pinned_message = Message(dictionary["pinned_message"]) if "pinned_message" in dictionary else None
-        self.permissions = ChatPermissions(dictionary["permissions"]) if "permissions" in dictionary else None
         self.slow_mode_delay = dictionary["slow_mode_delay"] if "slow_mode_delay" in dictionary else None
         self.message_auto_delete_time = dictionary["message_auto_delete_time"] if "message_auto_delete_time" in dictionary else None
         self.has_protected_content = dictionary["has_protected_content"] if "has_protected_content" in dictionary else None
         self.sticker_set_name = dictionary["sticker_set_name"] if "sticker_set_name" in dictionary else None
         self.can_set_sticker_set = dictionary["can_set_sticker_set"] if "can_set_sticker_set" in dictionary else None
         self.linked_chat_id = dictionary["linked_chat_id"] if "linked_chat_id" in dictionary else None
-        self.location = ChatLocation(dictionary["location"]) if "location" in dictionary else None
+        if not lazy:
+            self.photo = ChatPhoto(dictionary["photo"], lazy) if "photo" in dictionary else None
+            self.pinned_message = Message(dictionary["pinned_message"], lazy) if "pinned_message" in dictionary else None
+            self.permissions = ChatPermissions(dictionary["permissions"], lazy) if "permissions" in dictionary else None
+            self.location = ChatLocation(dictionary["location"], lazy) if "location" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Message:
@@ -267,78 +296,87 @@ class Message:
     - `reply_markup`: `InlineKeyboardMarkup` - Optional. Inline keyboard attached to the message. login_url buttons are represented as ordinary url buttons.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "message_id", "message_thread_id", "date", "forward_from_message_id", "forward_signature", "forward_sender_name", "forward_date", "is_topic_message", "is_automatic_forward", "edit_date", "has_protected_content", "media_group_id", "author_signature", "text", "entities", "photo", "caption", "caption_entities", "new_chat_members", "new_chat_title", "new_chat_photo", "delete_chat_photo", "group_chat_created", "supergroup_chat_created", "channel_chat_created", "migrate_to_chat_id", "migrate_from_chat_id", "connected_website", "user", "sender_chat", "chat", "forward_from", "forward_from_chat", "reply_to_message", "via_bot", "animation", "audio", "document", "sticker", "video", "video_note", "voice", "contact", "dice", "game", "poll", "venue", "location", "left_chat_member", "message_auto_delete_timer_changed", "pinned_message", "invoice", "successful_payment", "passport_data", "proximity_alert_triggered", "forum_topic_created", "forum_topic_closed", "forum_topic_reopened", "video_chat_scheduled", "video_chat_started", "video_chat_ended", "video_chat_participants_invited", "web_app_data", "reply_markup")
+    _known = frozenset({"message_id", "message_thread_id", "date", "forward_from_message_id", "forward_signature", "forward_sender_name", "forward_date", "is_topic_message", "is_automatic_forward", "edit_date", "has_protected_content", "media_group_id", "author_signature", "text", "entities", "photo", "caption", "caption_entities", "new_chat_members", "new_chat_title", "new_chat_photo", "delete_chat_photo", "group_chat_created", "supergroup_chat_created", "channel_chat_created", "migrate_to_chat_id", "migrate_from_chat_id", "connected_website", "from", "sender_chat", "chat", "forward_from", "forward_from_chat", "reply_to_message", "via_bot", "animation", "audio", "document", "sticker", "video", "video_note", "voice", "contact", "dice", "game", "poll", "venue", "location", "left_chat_member", "message_auto_delete_timer_changed", "pinned_message", "invoice", "successful_payment", "passport_data", "proximity_alert_triggered", "forum_topic_created", "forum_topic_closed", "forum_topic_reopened", "video_chat_scheduled", "video_chat_started", "video_chat_ended", "video_chat_participants_invited", "web_app_data", "reply_markup"})
+    _nested = {"user": ("from", "User"), "sender_chat": ("sender_chat", "Chat"), "chat": ("chat", "Chat"), "forward_from": ("forward_from", "User"), "forward_from_chat": ("forward_from_chat", "Chat"), "reply_to_message": ("reply_to_message", "Message"), "via_bot": ("via_bot", "User"), "animation": ("animation", "Animation"), "audio": ("audio", "Audio"), "document": ("document", "Document"), "sticker": ("sticker", "Sticker"), "video": ("video", "Video"), "video_note": ("video_note", "VideoNote"), "voice": ("voice", "Voice"), "contact": ("contact", "Contact"), "dice": ("dice", "Dice"), "game": ("game", "Game"), "poll": ("poll", "Poll"), "venue": ("venue", "Venue"), "location": ("location", "Location"), "left_chat_member": ("left_chat_member", "User"), "message_auto_delete_timer_changed": ("message_auto_delete_timer_changed", "MessageAutoDeleteTimerChanged"), "pinned_message": ("pinned_message", "Message"), "invoice": ("invoice", "Invoice"), "successful_payment": ("successful_payment", "SuccessfulPayment"), "passport_data": ("passport_data", "PassportData"), "proximity_alert_triggered": ("proximity_alert_triggered", "ProximityAlertTriggered"), "forum_topic_created": ("forum_topic_created", "ForumTopicCreated"), "forum_topic_closed": ("forum_topic_closed", "ForumTopicClosed"), "forum_topic_reopened": ("forum_topic_reopened", "ForumTopicReopened"), "video_chat_scheduled": ("video_chat_scheduled", "VideoChatScheduled"), "video_chat_started": ("video_chat_started", "VideoChatStarted"), "video_chat_ended": ("video_chat_ended", "VideoChatEnded"), "video_chat_participants_invited": ("video_chat_participants_invited", "VideoChatParticipantsInvited"), "web_app_data": ("web_app_data", "WebAppData"), "reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.message_id = dictionary["message_id"] if "message_id" in dictionary else None
         self.message_thread_id = dictionary["message_thread_id"] if "message_thread_id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
-        self.sender_chat = Chat(dictionary["sender_chat"]) if "sender_chat" in dictionary else None
         self.date = dictionary["date"] if "date" in dictionary else None
-        self.chat = Chat(dictionary["chat"]) if "chat" in dictionary else None
-        self.forward_from = User(dictionary["forward_from"]) if "forward_from" in dictionary else None
-        self.forward_from_chat = Chat(dictionary["forward_from_chat"]) if "forward_from_chat" in dictionary else None
         self.forward_from_message_id = dictionary["forward_from_message_id"] if "forward_from_message_id" in dictionary else None
         self.forward_signature = dictionary["forward_signature"] if "forward_signature" in dictionary else None
         self.forward_sender_name = dictionary["forward_sender_name"] if "forward_sender_name" in dictionary else None
         self.forward_date = dictionary["forward_date"] if "forward_date" in dictionary else None
         self.is_topic_message = dictionary["is_topic_message"] if "is_topic_message" in dictionary else None
         self.is_automatic_forward = dictionary["is_automatic_forward"] if "is_automatic_forward" in dictionary else None
-        self.reply_to_message = Message(dictionary["reply_to_message"]) if "reply_to_message" in dictionary else None
-        self.via_bot = User(dictionary["via_bot"]) if "via_bot" in dictionary else None
         self.edit_date = dictionary["edit_date"] if "edit_date" in dictionary else None
         self.has_protected_content = dictionary["has_protected_content"] if "has_protected_content" in dictionary else None
         self.media_group_id = dictionary["media_group_id"] if "media_group_id" in dictionary else None
         self.author_signature = dictionary["author_signature"] if "author_signature" in dictionary else None
         self.text = dictionary["text"] if "text" in dictionary else None
         self.entities = list(dictionary["entities"]) if "entities" in dictionary else None
-        self.animation = Animation(dictionary["animation"]) if "animation" in dictionary else None
-        self.audio = Audio(dictionary["audio"]) if "audio" in dictionary else None
-        self.document = Document(dictionary["document"]) if "document" in dictionary else None
         self.photo = list(dictionary["photo"]) if "photo" in dictionary else None
-        self.sticker = Sticker(dictionary["sticker"]) if "sticker" in dictionary else None
-        self.video = Video(dictionary["video"]) if "video" in dictionary else None
-        self.video_note = VideoNote(dictionary["video_note"]) if "video_note" in dictionary else None
-        self.voice = Voice(dictionary["voice"]) if "voice" in dictionary else None
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.contact = Contact(dictionary["contact"]) if "contact" in dictionary else None
-        self.dice = Dice(dictionary["dice"]) if "dice" in dictionary else None
-        self.game = Game(dictionary["game"]) if "game" in dictionary else None
-        self.poll = Poll(dictionary["poll"]) if "poll" in dictionary else None
-        self.venue = Venue(dictionary["venue"]) if "venue" in dictionary else None
-        self.location = Location(dictionary["location"]) if "location" in dictionary else None
         self.new_chat_members = list(dictionary["new_chat_members"]) if "new_chat_members" in dictionary else None
-        self.left_chat_member = User(dictionary["left_chat_member"]) if "left_chat_member" in dictionary else None
         self.new_chat_title = dictionary["new_chat_title"] if "new_chat_title" in dictionary else None
         self.new_chat_photo = list(dictionary["new_chat_photo"]) if "new_chat_photo" in dictionary else None
         self.delete_chat_photo = dictionary["delete_chat_photo"] if "delete_chat_photo" in dictionary else None
         self.group_chat_created = dictionary["group_chat_created"] if "group_chat_created" in dictionary else None
         self.supergroup_chat_created = dictionary["supergroup_chat_created"] if "supergroup_chat_created" in dictionary else None
         self.channel_chat_created = dictionary["channel_chat_created"] if "channel_chat_created" in dictionary else None
-        self.message_auto_delete_timer_changed = MessageAutoDeleteTimerChanged(dictionary["message_auto_delete_timer_changed"]) if "message_auto_delete_timer_changed" in dictionary else None
         self.migrate_to_chat_id = dictionary["migrate_to_chat_id"] if "migrate_to_chat_id" in dictionary else None
         self.migrate_from_chat_id = dictionary["migrate_from_chat_id"] if "migrate_from_chat_id" in dictionary else None
-        self.pinned_message = Message(dictionary["pinned_message"]) if "pinned_message" in dictionary else None
-        self.invoice = Invoice(dictionary["invoice"]) if "invoice" in dictionary else None
-        self.successful_payment = SuccessfulPayment(dictionary["successful_payment"]) if "successful_payment" in dictionary else None
         self.connected_website = dictionary["connected_website"] if "connected_website" in dictionary else None
-        self.passport_data = PassportData(dictionary["passport_data"]) if "passport_data" in dictionary else None
-        self.proximity_alert_triggered = ProximityAlertTriggered(dictionary["proximity_alert_triggered"]) if "proximity_alert_triggered" in dictionary else None
-        self.forum_topic_created = ForumTopicCreated(dictionary["forum_topic_created"]) if "forum_topic_created" in dictionary else None
-        self.forum_topic_closed = ForumTopicClosed(dictionary["forum_topic_closed"]) if "forum_topic_closed" in dictionary else None
-        self.forum_topic_reopened = ForumTopicReopened(dictionary["forum_topic_reopened"]) if "forum_topic_reopened" in dictionary else None
-        self.video_chat_scheduled = VideoChatScheduled(dictionary["video_chat_scheduled"]) if "video_chat_scheduled" in dictionary else None
-        self.video_chat_started = VideoChatStarted(dictionary["video_chat_started"]) if "video_chat_started" in dictionary else None
-        self.video_chat_ended = VideoChatEnded(dictionary["video_chat_ended"]) if "video_chat_ended" in dictionary else None
-        self.video_chat_participants_invited = VideoChatParticipantsInvited(dictionary["video_chat_participants_invited"]) if "video_chat_participants_invited" in dictionary else None
-        self.web_app_data = WebAppData(dictionary["web_app_data"]) if "web_app_data" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.sender_chat = Chat(dictionary["sender_chat"], lazy) if "sender_chat" in dictionary else None
+            self.chat = Chat(dictionary["chat"], lazy) if "chat" in dictionary else None
+            self.forward_from = User(dictionary["forward_from"], lazy) if "forward_from" in dictionary else None
+            self.forward_from_chat = Chat(dictionary["forward_from_chat"], lazy) if "forward_from_chat" in dictionary else None
+            self.reply_to_message = Message(dictionary["reply_to_message"], lazy) if "reply_to_message" in dictionary else None
+            self.via_bot = User(dictionary["via_bot"], lazy) if "via_bot" in dictionary else None
+            self.animation = Animation(dictionary["animation"], lazy) if "animation" in dictionary else None
+            self.audio = Audio(dictionary["audio"], lazy) if "audio" in dictionary else None
+            self.document = Document(dictionary["document"], lazy) if "document" in dictionary else None
+            self.sticker = Sticker(dictionary["sticker"], lazy) if "sticker" in dictionary else None
+            self.video = Video(dictionary["video"], lazy) if "video" in dictionary else None
+            self.video_note = VideoNote(dictionary["video_note"], lazy) if "video_note" in dictionary else None
+            self.voice = Voice(dictionary["voice"], lazy) if "voice" in dictionary else None
+            self.contact = Contact(dictionary["contact"], lazy) if "contact" in dictionary else None
+            self.dice = Dice(dictionary["dice"], lazy) if "dice" in dictionary else None
+            self.game = Game(dictionary["game"], lazy) if "game" in dictionary else None
+            self.poll = Poll(dictionary["poll"], lazy) if "poll" in dictionary else None
+            self.venue = Venue(dictionary["venue"], lazy) if "venue" in dictionary else None
+            self.location = Location(dictionary["location"], lazy) if "location" in dictionary else None
+            self.left_chat_member = User(dictionary["left_chat_member"], lazy) if "left_chat_member" in dictionary else None
+            self.message_auto_delete_timer_changed = MessageAutoDeleteTimerChanged(dictionary["message_auto_delete_timer_changed"], lazy) if "message_auto_delete_timer_changed" in dictionary else None
+            self.pinned_message = Message(dictionary["pinned_message"], lazy) if "pinned_message" in dictionary else None
+            self.invoice = Invoice(dictionary["invoice"], lazy) if "invoice" in dictionary else None
+            self.successful_payment = SuccessfulPayment(dictionary["successful_payment"], lazy) if "successful_payment" in dictionary else None
+            self.passport_data = PassportData(dictionary["passport_data"], lazy) if "passport_data" in dictionary else None
+            self.proximity_alert_triggered = ProximityAlertTriggered(dictionary["proximity_alert_triggered"], lazy) if "proximity_alert_triggered" in dictionary else None
+            self.forum_topic_created = ForumTopicCreated(dictionary["forum_topic_created"], lazy) if "forum_topic_created" in dictionary else None
+            self.forum_topic_closed = ForumTopicClosed(dictionary["forum_topic_closed"], lazy) if "forum_topic_closed" in dictionary else None
+            self.forum_topic_reopened = ForumTopicReopened(dictionary["forum_topic_reopened"], lazy) if "forum_topic_reopened" in dictionary else None
+            self.video_chat_scheduled = VideoChatScheduled(dictionary["video_chat_scheduled"], lazy) if "video_chat_scheduled" in dictionary else None
+            self.video_chat_started = VideoChatStarted(dictionary["video_chat_started"], lazy) if "video_chat_started" in dictionary else None
+            self.video_chat_ended = VideoChatEnded(dictionary["video_chat_ended"], lazy) if "video_chat_ended" in dictionary else None
+            self.video_chat_participants_invited = VideoChatParticipantsInvited(dictionary["video_chat_participants_invited"], lazy) if "video_chat_participants_invited" in dictionary else None
+            self.web_app_data = WebAppData(dictionary["web_app_data"], lazy) if "web_app_data" in dictionary else None
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MessageId:
@@ -350,15 +388,19 @@ class MessageId:
     - `message_id`: `int` - Unique message identifier
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "message_id")
+    _known = frozenset({"message_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.message_id = dictionary["message_id"] if "message_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MessageEntity:
@@ -376,21 +418,30 @@ class MessageEntity:
     - `custom_emoji_id`: `string` - Optional. For “custom_emoji” only, unique identifier of the custom emoji. Use getCustomEmojiStickers to get full information about the sticker
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "offset", "length", "url", "language", "custom_emoji_id", "user")
+    _known = frozenset({"type", "offset", "length", "url", "language", "custom_emoji_id", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.offset = dictionary["offset"] if "offset" in dictionary else None
         self.length = dictionary["length"] if "length" in dictionary else None
         self.url = dictionary["url"] if "url" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.language = dictionary["language"] if "language" in dictionary else None
         self.custom_emoji_id = dictionary["custom_emoji_id"] if "custom_emoji_id" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PhotoSize:
@@ -406,7 +457,11 @@ class PhotoSize:
     - `file_size`: `int` - Optional. File size in bytes
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "file_id", "file_unique_id", "width", "height", "file_size")
+    _known = frozenset({"file_id", "file_unique_id", "width", "height", "file_size"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -416,9 +471,9 @@ class PhotoSize:
         self.height = dictionary["height"] if "height" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Animation:
@@ -438,23 +493,32 @@ class Animation:
     - `file_size`: `int` - Optional. File size in bytes. It can be bigger than 2^31 and some programming languages may have difficulty/silent defects in interpreting it. But it has at most 52 significant bits, so a signed 64-bit integer or double-precision float type are safe for storing this value.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "width", "height", "duration", "file_name", "mime_type", "file_size", "thumb")
+    _known = frozenset({"file_id", "file_unique_id", "width", "height", "duration", "file_name", "mime_type", "file_size", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
         self.width = dictionary["width"] if "width" in dictionary else None
         self.height = dictionary["height"] if "height" in dictionary else None
         self.duration = dictionary["duration"] if "duration" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
         self.file_name = dictionary["file_name"] if "file_name" in dictionary else None
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Audio:
@@ -474,10 +538,18 @@ class Audio:
     - `thumb`: `PhotoSize` - Optional. Thumbnail of the album cover to which the music file belongs
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "duration", "performer", "title", "file_name", "mime_type", "file_size", "thumb")
+    _known = frozenset({"file_id", "file_unique_id", "duration", "performer", "title", "file_name", "mime_type", "file_size", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
         self.duration = dictionary["duration"] if "duration" in dictionary else None
@@ -486,11 +558,12 @@ class Audio:
         self.file_name = dictionary["file_name"] if "file_name" in dictionary else None
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Document:
@@ -507,20 +580,29 @@ class Document:
     - `file_size`: `int` - Optional. File size in bytes. It can be bigger than 2^31 and some programming languages may have difficulty/silent defects in interpreting it. But it has at most 52 significant bits, so a signed 64-bit integer or double-precision float type are safe for storing this value.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "file_name", "mime_type", "file_size", "thumb")
+    _known = frozenset({"file_id", "file_unique_id", "file_name", "mime_type", "file_size", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
         self.file_name = dictionary["file_name"] if "file_name" in dictionary else None
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Video:
@@ -540,23 +622,32 @@ class Video:
     - `file_size`: `int` - Optional. File size in bytes. It can be bigger than 2^31 and some programming languages may have difficulty/silent defects in interpreting it. But it has at most 52 significant bits, so a signed 64-bit integer or double-precision float type are safe for storing this value.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "width", "height", "duration", "file_name", "mime_type", "file_size", "thumb")
+    _known = frozenset({"file_id", "file_unique_id", "width", "height", "duration", "file_name", "mime_type", "file_size", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
         self.width = dictionary["width"] if "width" in dictionary else None
         self.height = dictionary["height"] if "height" in dictionary else None
         self.duration = dictionary["duration"] if "duration" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
         self.file_name = dictionary["file_name"] if "file_name" in dictionary else None
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class VideoNote:
@@ -573,20 +664,29 @@ class VideoNote:
     - `file_size`: `int` - Optional. File size in bytes
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "length", "duration", "file_size", "thumb")
+    _known = frozenset({"file_id", "file_unique_id", "length", "duration", "file_size", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
         self.length = dictionary["length"] if "length" in dictionary else None
         self.duration = dictionary["duration"] if "duration" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Voice:
@@ -602,7 +702,11 @@ class Voice:
     - `file_size`: `int` - Optional. File size in bytes. It can be bigger than 2^31 and some programming languages may have difficulty/silent defects in interpreting it. But it has at most 52 significant bits, so a signed 64-bit integer or double-precision float type are safe for storing this value.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "file_id", "file_unique_id", "duration", "mime_type", "file_size")
+    _known = frozenset({"file_id", "file_unique_id", "duration", "mime_type", "file_size"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -612,9 +716,9 @@ class Voice:
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Contact:
@@ -630,7 +734,11 @@ class Contact:
     - `vcard`: `string` - Optional. Additional data about the contact in the form of a vCard
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "phone_number", "first_name", "last_name", "user_id", "vcard")
+    _known = frozenset({"phone_number", "first_name", "last_name", "user_id", "vcard"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -640,9 +748,9 @@ class Contact:
         self.user_id = dictionary["user_id"] if "user_id" in dictionary else None
         self.vcard = dictionary["vcard"] if "vcard" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Dice:
@@ -655,16 +763,20 @@ class Dice:
     - `value`: `int` - ____simple_html_dom__voku__html_wrapper____>Value of the dice, 1-6 for “🎲”, “🎯” and “🎳” base emoji, 1-5 for “🏀” and “⚽” base emoji, 1-64 for “🎰” base emoji
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "emoji", "value")
+    _known = frozenset({"emoji", "value"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.emoji = dictionary["emoji"] if "emoji" in dictionary else None
         self.value = dictionary["value"] if "value" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PollOption:
@@ -677,16 +789,20 @@ class PollOption:
     - `voter_count`: `int` - Number of users that voted for this option
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "text", "voter_count")
+    _known = frozenset({"text", "voter_count"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.text = dictionary["text"] if "text" in dictionary else None
         self.voter_count = dictionary["voter_count"] if "voter_count" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PollAnswer:
@@ -700,17 +816,26 @@ class PollAnswer:
     - `option_ids`: `list` - 0-based identifiers of answer options, chosen by the user. May be empty if the user retracted their vote.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "poll_id", "option_ids", "user")
+    _known = frozenset({"poll_id", "option_ids", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.poll_id = dictionary["poll_id"] if "poll_id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.option_ids = list(dictionary["option_ids"]) if "option_ids" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Poll:
@@ -734,7 +859,11 @@ class Poll:
     - `close_date`: `int` - Optional. Point in time (Unix timestamp) when the poll will be automatically closed
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "id", "question", "options", "total_voter_count", "is_closed", "is_anonymous", "type", "allows_multiple_answers", "correct_option_id", "explanation", "explanation_entities", "open_period", "close_date")
+    _known = frozenset({"id", "question", "options", "total_voter_count", "is_closed", "is_anonymous", "type", "allows_multiple_answers", "correct_option_id", "explanation", "explanation_entities", "open_period", "close_date"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -752,9 +881,9 @@ class Poll:
         self.open_period = dictionary["open_period"] if "open_period" in dictionary else None
         self.close_date = dictionary["close_date"] if "close_date" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Location:
@@ -771,7 +900,11 @@ class Location:
     - `proximity_alert_radius`: `int` - Optional. The maximum distance for proximity alerts about approaching another chat member, in meters. For sent live locations only.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "longitude", "latitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius")
+    _known = frozenset({"longitude", "latitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -782,9 +915,9 @@ class Location:
         self.heading = dictionary["heading"] if "heading" in dictionary else None
         self.proximity_alert_radius = dictionary["proximity_alert_radius"] if "proximity_alert_radius" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Venue:
@@ -802,21 +935,30 @@ class Venue:
     - `google_place_type`: `string` - Optional. Google Places type of the venue. (See supported types.)
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type", "location")
+    _known = frozenset({"title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type", "location"})
+    _nested = {"location": ("location", "Location")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
-        self.location = Location(dictionary["location"]) if "location" in dictionary else None
+        self._lazy = lazy
         self.title = dictionary["title"] if "title" in dictionary else None
         self.address = dictionary["address"] if "address" in dictionary else None
         self.foursquare_id = dictionary["foursquare_id"] if "foursquare_id" in dictionary else None
         self.foursquare_type = dictionary["foursquare_type"] if "foursquare_type" in dictionary else None
         self.google_place_id = dictionary["google_place_id"] if "google_place_id" in dictionary else None
         self.google_place_type = dictionary["google_place_type"] if "google_place_type" in dictionary else None
+        if not lazy:
+            self.location = Location(dictionary["location"], lazy) if "location" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class WebAppData:
@@ -829,16 +971,20 @@ class WebAppData:
     - `button_text`: `string` - Text of the web_app keyboard button from which the Web App was opened. Be aware that a bad client can send arbitrary data in this field.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "data", "button_text")
+    _known = frozenset({"data", "button_text"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.data = dictionary["data"] if "data" in dictionary else None
         self.button_text = dictionary["button_text"] if "button_text" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ProximityAlertTriggered:
@@ -852,17 +998,26 @@ class ProximityAlertTriggered:
     - `distance`: `int` - The distance between the users
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "distance", "traveler", "watcher")
+    _known = frozenset({"distance", "traveler", "watcher"})
+    _nested = {"traveler": ("traveler", "User"), "watcher": ("watcher", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
-        self.traveler = User(dictionary["traveler"]) if "traveler" in dictionary else None
-        self.watcher = User(dictionary["watcher"]) if "watcher" in dictionary else None
+        self._lazy = lazy
         self.distance = dictionary["distance"] if "distance" in dictionary else None
+        if not lazy:
+            self.traveler = User(dictionary["traveler"], lazy) if "traveler" in dictionary else None
+            self.watcher = User(dictionary["watcher"], lazy) if "watcher" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MessageAutoDeleteTimerChanged:
@@ -874,15 +1029,19 @@ class MessageAutoDeleteTimerChanged:
     - `message_auto_delete_time`: `int` - New auto-delete time for messages in the chat; in seconds
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "message_auto_delete_time")
+    _known = frozenset({"message_auto_delete_time"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.message_auto_delete_time = dictionary["message_auto_delete_time"] if "message_auto_delete_time" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ForumTopicCreated:
@@ -896,7 +1055,11 @@ class ForumTopicCreated:
     - `icon_custom_emoji_id`: `string` - Optional. Unique identifier of the custom emoji shown as the topic icon
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "name", "icon_color", "icon_custom_emoji_id")
+    _known = frozenset({"name", "icon_color", "icon_custom_emoji_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -904,9 +1067,9 @@ class ForumTopicCreated:
         self.icon_color = dictionary["icon_color"] if "icon_color" in dictionary else None
         self.icon_custom_emoji_id = dictionary["icon_custom_emoji_id"] if "icon_custom_emoji_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ForumTopicClosed:
@@ -917,14 +1080,18 @@ class ForumTopicClosed:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ForumTopicReopened:
@@ -935,14 +1102,18 @@ class ForumTopicReopened:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class VideoChatScheduled:
@@ -954,15 +1125,19 @@ class VideoChatScheduled:
     - `start_date`: `int` - Point in time (Unix timestamp) when the video chat is supposed to be started by a chat administrator
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "start_date")
+    _known = frozenset({"start_date"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.start_date = dictionary["start_date"] if "start_date" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class VideoChatStarted:
@@ -973,14 +1148,18 @@ class VideoChatStarted:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class VideoChatEnded:
@@ -992,15 +1171,19 @@ class VideoChatEnded:
     - `duration`: `int` - Video chat duration in seconds
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "duration")
+    _known = frozenset({"duration"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.duration = dictionary["duration"] if "duration" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class VideoChatParticipantsInvited:
@@ -1012,15 +1195,19 @@ class VideoChatParticipantsInvited:
     - `users`: `list` - New members that were invited to the video chat
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "users")
+    _known = frozenset({"users"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.users = list(dictionary["users"]) if "users" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class UserProfilePhotos:
@@ -1033,16 +1220,20 @@ class UserProfilePhotos:
     - `photos`: `list` - Requested profile pictures (in up to 4 sizes each)
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "total_count", "photos")
+    _known = frozenset({"total_count", "photos"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.total_count = dictionary["total_count"] if "total_count" in dictionary else None
         self.photos = list(dictionary["photos"]) if "photos" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class File:
@@ -1057,7 +1248,11 @@ class File:
     - `file_path`: `string` - Optional. File path. Use https://api.telegram.org/file/bot<token>/<file_path> to get the file.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "file_id", "file_unique_id", "file_size", "file_path")
+    _known = frozenset({"file_id", "file_unique_id", "file_size", "file_path"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1066,9 +1261,9 @@ class File:
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
         self.file_path = dictionary["file_path"] if "file_path" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class WebAppInfo:
@@ -1080,15 +1275,19 @@ class WebAppInfo:
     - `url`: `string` - An HTTPS URL of a Web App to be opened with additional data as specified in Initializing Web Apps
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "url")
+    _known = frozenset({"url"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.url = dictionary["url"] if "url" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ReplyKeyboardMarkup(objects.ReplyKeyboardMarkup):
@@ -1104,7 +1303,11 @@ class ReplyKeyboardMarkup(objects.ReplyKeyboardMarkup):
     - `selective`: `bool` - Optional. Use this parameter if you want to show the keyboard to specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.Example: A user requests to change the bot's language, bot replies to the request with a keyboard to select the new language. Other users in the group don't see the keyboard.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "keyboard", "resize_keyboard", "one_time_keyboard", "input_field_placeholder", "selective")
+    _known = frozenset({"keyboard", "resize_keyboard", "one_time_keyboard", "input_field_placeholder", "selective"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1114,9 +1317,9 @@ class ReplyKeyboardMarkup(objects.ReplyKeyboardMarkup):
         self.input_field_placeholder = dictionary["input_field_placeholder"] if "input_field_placeholder" in dictionary else None
         self.selective = dictionary["selective"] if "selective" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class KeyboardButton:
@@ -1132,19 +1335,28 @@ class KeyboardButton:
     - `web_app`: `WebAppInfo` - Optional. If specified, the described Web App will be launched when the button is pressed. The Web App will be able to send a “web_app_data” service message. Available in private chats only.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "text", "request_contact", "request_location", "request_poll", "web_app")
+    _known = frozenset({"text", "request_contact", "request_location", "request_poll", "web_app"})
+    _nested = {"request_poll": ("request_poll", "KeyboardButtonPollType"), "web_app": ("web_app", "WebAppInfo")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.text = dictionary["text"] if "text" in dictionary else None
         self.request_contact = dictionary["request_contact"] if "request_contact" in dictionary else None
         self.request_location = dictionary["request_location"] if "request_location" in dictionary else None
-        self.request_poll = KeyboardButtonPollType(dictionary["request_poll"]) if "request_poll" in dictionary else None
-        self.web_app = WebAppInfo(dictionary["web_app"]) if "web_app" in dictionary else None
+        if not lazy:
+            self.request_poll = KeyboardButtonPollType(dictionary["request_poll"], lazy) if "request_poll" in dictionary else None
+            self.web_app = WebAppInfo(dictionary["web_app"], lazy) if "web_app" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class KeyboardButtonPollType:
@@ -1156,15 +1368,19 @@ class KeyboardButtonPollType:
     - `type`: `string` - Optional. If quiz is passed, the user will be allowed to create only polls in the quiz mode. If regular is passed, only regular polls will be allowed. Otherwise, the user will be allowed to create a poll of any type.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ReplyKeyboardRemove:
@@ -1177,16 +1393,20 @@ class ReplyKeyboardRemove:
     - `selective`: `bool` - Optional. Use this parameter if you want to remove the keyboard for specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.Example: A user votes in a poll, bot returns confirmation message in reply to the vote and removes the keyboard for that user, while still showing the keyboard with poll options to users who haven't voted yet.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "remove_keyboard", "selective")
+    _known = frozenset({"remove_keyboard", "selective"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.remove_keyboard = dictionary["remove_keyboard"] if "remove_keyboard" in dictionary else None
         self.selective = dictionary["selective"] if "selective" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineKeyboardMarkup(objects.InlineKeyboardMarkup):
@@ -1198,15 +1418,19 @@ class InlineKeyboardMarkup(objects.InlineKeyboardMarkup):
     - `inline_keyboard`: `list` - Array of button rows, each represented by an Array of InlineKeyboardButton objects
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "inline_keyboard")
+    _known = frozenset({"inline_keyboard"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.inline_keyboard = list(dictionary["inline_keyboard"]) if "inline_keyboard" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineKeyboardButton:
@@ -1226,23 +1450,32 @@ class InlineKeyboardButton:
     - `pay`: `bool` - Optional. Specify True, to send a Pay button.NOTE: This type of button must always be the first button in the first row and can only be used in invoice messages.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "text", "url", "callback_data", "switch_inline_query", "switch_inline_query_current_chat", "pay", "web_app", "login_url", "callback_game")
+    _known = frozenset({"text", "url", "callback_data", "switch_inline_query", "switch_inline_query_current_chat", "pay", "web_app", "login_url", "callback_game"})
+    _nested = {"web_app": ("web_app", "WebAppInfo"), "login_url": ("login_url", "LoginUrl"), "callback_game": ("callback_game", "CallbackGame")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.text = dictionary["text"] if "text" in dictionary else None
         self.url = dictionary["url"] if "url" in dictionary else None
         self.callback_data = dictionary["callback_data"] if "callback_data" in dictionary else None
-        self.web_app = WebAppInfo(dictionary["web_app"]) if "web_app" in dictionary else None
-        self.login_url = LoginUrl(dictionary["login_url"]) if "login_url" in dictionary else None
         self.switch_inline_query = dictionary["switch_inline_query"] if "switch_inline_query" in dictionary else None
         self.switch_inline_query_current_chat = dictionary["switch_inline_query_current_chat"] if "switch_inline_query_current_chat" in dictionary else None
-        self.callback_game = CallbackGame(dictionary["callback_game"]) if "callback_game" in dictionary else None
         self.pay = dictionary["pay"] if "pay" in dictionary else None
+        if not lazy:
+            self.web_app = WebAppInfo(dictionary["web_app"], lazy) if "web_app" in dictionary else None
+            self.login_url = LoginUrl(dictionary["login_url"], lazy) if "login_url" in dictionary else None
+            self.callback_game = CallbackGame(dictionary["callback_game"], lazy) if "callback_game" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class LoginUrl:
@@ -1258,7 +1491,11 @@ Telegram apps support these buttons as of version 5.7.[See on Telegram API](http
     - `request_write_access`: `bool` - Optional. Pass True to request the permission for your bot to send messages to the user.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "url", "forward_text", "bot_username", "request_write_access")
+    _known = frozenset({"url", "forward_text", "bot_username", "request_write_access"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1267,9 +1504,9 @@ Telegram apps support these buttons as of version 5.7.[See on Telegram API](http
         self.bot_username = dictionary["bot_username"] if "bot_username" in dictionary else None
         self.request_write_access = dictionary["request_write_access"] if "request_write_access" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class CallbackQuery(objects.CallbackQuery):
@@ -1287,21 +1524,30 @@ class CallbackQuery(objects.CallbackQuery):
     - `game_short_name`: `string` - Optional. Short name of a Game to be returned, serves as the unique identifier for the game
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "id", "inline_message_id", "chat_instance", "data", "game_short_name", "user", "message")
+    _known = frozenset({"id", "inline_message_id", "chat_instance", "data", "game_short_name", "from", "message"})
+    _nested = {"user": ("from", "User"), "message": ("message", "Message"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.id = dictionary["id"] if "id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
-        self.message = Message(dictionary["message"]) if "message" in dictionary else None
         self.inline_message_id = dictionary["inline_message_id"] if "inline_message_id" in dictionary else None
         self.chat_instance = dictionary["chat_instance"] if "chat_instance" in dictionary else None
         self.data = dictionary["data"] if "data" in dictionary else None
         self.game_short_name = dictionary["game_short_name"] if "game_short_name" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.message = Message(dictionary["message"], lazy) if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ForceReply:
@@ -1315,7 +1561,11 @@ class ForceReply:
     - `selective`: `bool` - Optional. Use this parameter if you want to force reply from specific users only. Targets: 1) users that are @mentioned in the text of the Message object; 2) if the bot's message is a reply (has reply_to_message_id), sender of the original message.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "force_reply", "input_field_placeholder", "selective")
+    _known = frozenset({"force_reply", "input_field_placeholder", "selective"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1323,9 +1573,9 @@ class ForceReply:
         self.input_field_placeholder = dictionary["input_field_placeholder"] if "input_field_placeholder" in dictionary else None
         self.selective = dictionary["selective"] if "selective" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatPhoto:
@@ -1340,7 +1590,11 @@ class ChatPhoto:
     - `big_file_unique_id`: `string` - Unique file identifier of big (640x640) chat photo, which is supposed to be the same over time and for different bots. Can't be used to download or reuse the file.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "small_file_id", "small_file_unique_id", "big_file_id", "big_file_unique_id")
+    _known = frozenset({"small_file_id", "small_file_unique_id", "big_file_id", "big_file_unique_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1349,9 +1603,9 @@ class ChatPhoto:
         self.big_file_id = dictionary["big_file_id"] if "big_file_id" in dictionary else None
         self.big_file_unique_id = dictionary["big_file_unique_id"] if "big_file_unique_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatInviteLink:
@@ -1371,12 +1625,19 @@ class ChatInviteLink:
     - `pending_join_request_count`: `int` - Optional. Number of pending join requests created using this link
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "invite_link", "creates_join_request", "is_primary", "is_revoked", "name", "expire_date", "member_limit", "pending_join_request_count", "creator")
+    _known = frozenset({"invite_link", "creates_join_request", "is_primary", "is_revoked", "name", "expire_date", "member_limit", "pending_join_request_count", "creator"})
+    _nested = {"creator": ("creator", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.invite_link = dictionary["invite_link"] if "invite_link" in dictionary else None
-        self.creator = User(dictionary["creator"]) if "creator" in dictionary else None
         self.creates_join_request = dictionary["creates_join_request"] if "creates_join_request" in dictionary else None
         self.is_primary = dictionary["is_primary"] if "is_primary" in dictionary else None
         self.is_revoked = dictionary["is_revoked"] if "is_revoked" in dictionary else None
@@ -1384,10 +1645,12 @@ class ChatInviteLink:
         self.expire_date = dictionary["expire_date"] if "expire_date" in dictionary else None
         self.member_limit = dictionary["member_limit"] if "member_limit" in dictionary else None
         self.pending_join_request_count = dictionary["pending_join_request_count"] if "pending_join_request_count" in dictionary else None
+        if not lazy:
+            self.creator = User(dictionary["creator"], lazy) if "creator" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatAdministratorRights:
@@ -1410,7 +1673,11 @@ class ChatAdministratorRights:
     - `can_manage_topics`: `bool` - Optional. True, if the user is allowed to create, rename, close, and reopen forum topics; supergroups only
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_messages", "can_edit_messages", "can_pin_messages", "can_manage_topics")
+    _known = frozenset({"is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_messages", "can_edit_messages", "can_pin_messages", "can_manage_topics"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1427,9 +1694,9 @@ class ChatAdministratorRights:
         self.can_pin_messages = dictionary["can_pin_messages"] if "can_pin_messages" in dictionary else None
         self.can_manage_topics = dictionary["can_manage_topics"] if "can_manage_topics" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMember:
@@ -1440,14 +1707,18 @@ class ChatMember:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberOwner:
@@ -1462,18 +1733,27 @@ class ChatMemberOwner:
     - `custom_title`: `string` - Optional. Custom title for this user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "is_anonymous", "custom_title", "user")
+    _known = frozenset({"status", "is_anonymous", "custom_title", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.is_anonymous = dictionary["is_anonymous"] if "is_anonymous" in dictionary else None
         self.custom_title = dictionary["custom_title"] if "custom_title" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberAdministrator:
@@ -1500,12 +1780,19 @@ class ChatMemberAdministrator:
     - `custom_title`: `string` - Optional. Custom title for this user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "can_be_edited", "is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_messages", "can_edit_messages", "can_pin_messages", "can_manage_topics", "custom_title", "user")
+    _known = frozenset({"status", "can_be_edited", "is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_messages", "can_edit_messages", "can_pin_messages", "can_manage_topics", "custom_title", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.can_be_edited = dictionary["can_be_edited"] if "can_be_edited" in dictionary else None
         self.is_anonymous = dictionary["is_anonymous"] if "is_anonymous" in dictionary else None
         self.can_manage_chat = dictionary["can_manage_chat"] if "can_manage_chat" in dictionary else None
@@ -1520,10 +1807,12 @@ class ChatMemberAdministrator:
         self.can_pin_messages = dictionary["can_pin_messages"] if "can_pin_messages" in dictionary else None
         self.can_manage_topics = dictionary["can_manage_topics"] if "can_manage_topics" in dictionary else None
         self.custom_title = dictionary["custom_title"] if "custom_title" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberMember:
@@ -1536,16 +1825,25 @@ class ChatMemberMember:
     - `user`: `User` - Information about the user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "user")
+    _known = frozenset({"status", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberRestricted:
@@ -1569,12 +1867,19 @@ class ChatMemberRestricted:
     - `until_date`: `int` - Date when restrictions will be lifted for this user; unix time. If 0, then the user is restricted forever
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "is_member", "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics", "can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "until_date", "user")
+    _known = frozenset({"status", "is_member", "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics", "can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "until_date", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.is_member = dictionary["is_member"] if "is_member" in dictionary else None
         self.can_change_info = dictionary["can_change_info"] if "can_change_info" in dictionary else None
         self.can_invite_users = dictionary["can_invite_users"] if "can_invite_users" in dictionary else None
@@ -1586,10 +1891,12 @@ class ChatMemberRestricted:
         self.can_send_other_messages = dictionary["can_send_other_messages"] if "can_send_other_messages" in dictionary else None
         self.can_add_web_page_previews = dictionary["can_add_web_page_previews"] if "can_add_web_page_previews" in dictionary else None
         self.until_date = dictionary["until_date"] if "until_date" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberLeft:
@@ -1602,16 +1909,25 @@ class ChatMemberLeft:
     - `user`: `User` - Information about the user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "user")
+    _known = frozenset({"status", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberBanned:
@@ -1625,17 +1941,26 @@ class ChatMemberBanned:
     - `until_date`: `int` - Date when restrictions will be lifted for this user; unix time. If 0, then the user is banned forever
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "status", "until_date", "user")
+    _known = frozenset({"status", "until_date", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.status = dictionary["status"] if "status" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.until_date = dictionary["until_date"] if "until_date" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatMemberUpdated:
@@ -1652,20 +1977,29 @@ class ChatMemberUpdated:
     - `invite_link`: `ChatInviteLink` - Optional. Chat invite link, which was used by the user to join the chat; for joining by invite link events only.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "date", "chat", "user", "old_chat_member", "new_chat_member", "invite_link")
+    _known = frozenset({"date", "chat", "from", "old_chat_member", "new_chat_member", "invite_link"})
+    _nested = {"chat": ("chat", "Chat"), "user": ("from", "User"), "old_chat_member": ("old_chat_member", "ChatMember"), "new_chat_member": ("new_chat_member", "ChatMember"), "invite_link": ("invite_link", "ChatInviteLink"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
-        self.chat = Chat(dictionary["chat"]) if "chat" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
+        self._lazy = lazy
         self.date = dictionary["date"] if "date" in dictionary else None
-        self.old_chat_member = ChatMember(dictionary["old_chat_member"]) if "old_chat_member" in dictionary else None
-        self.new_chat_member = ChatMember(dictionary["new_chat_member"]) if "new_chat_member" in dictionary else None
-        self.invite_link = ChatInviteLink(dictionary["invite_link"]) if "invite_link" in dictionary else None
+        if not lazy:
+            self.chat = Chat(dictionary["chat"], lazy) if "chat" in dictionary else None
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.old_chat_member = ChatMember(dictionary["old_chat_member"], lazy) if "old_chat_member" in dictionary else None
+            self.new_chat_member = ChatMember(dictionary["new_chat_member"], lazy) if "new_chat_member" in dictionary else None
+            self.invite_link = ChatInviteLink(dictionary["invite_link"], lazy) if "invite_link" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatJoinRequest:
@@ -1681,19 +2015,28 @@ class ChatJoinRequest:
     - `invite_link`: `ChatInviteLink` - Optional. Chat invite link that was used by the user to send the join request
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "date", "bio", "chat", "user", "invite_link")
+    _known = frozenset({"date", "bio", "chat", "from", "invite_link"})
+    _nested = {"chat": ("chat", "Chat"), "user": ("from", "User"), "invite_link": ("invite_link", "ChatInviteLink"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
-        self.chat = Chat(dictionary["chat"]) if "chat" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
+        self._lazy = lazy
         self.date = dictionary["date"] if "date" in dictionary else None
         self.bio = dictionary["bio"] if "bio" in dictionary else None
-        self.invite_link = ChatInviteLink(dictionary["invite_link"]) if "invite_link" in dictionary else None
+        if not lazy:
+            self.chat = Chat(dictionary["chat"], lazy) if "chat" in dictionary else None
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.invite_link = ChatInviteLink(dictionary["invite_link"], lazy) if "invite_link" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatPermissions:
@@ -1713,7 +2056,11 @@ class ChatPermissions:
     - `can_manage_topics`: `bool` - Optional. True, if the user is allowed to create forum topics. If omitted defaults to the value of can_pin_messages
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics")
+    _known = frozenset({"can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1727,9 +2074,9 @@ class ChatPermissions:
         self.can_pin_messages = dictionary["can_pin_messages"] if "can_pin_messages" in dictionary else None
         self.can_manage_topics = dictionary["can_manage_topics"] if "can_manage_topics" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChatLocation:
@@ -1742,16 +2089,25 @@ class ChatLocation:
     - `address`: `string` - Location address; 1-64 characters, as defined by the chat owner
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "address", "location")
+    _known = frozenset({"address", "location"})
+    _nested = {"location": ("location", "Location")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
-        self.location = Location(dictionary["location"]) if "location" in dictionary else None
+        self._lazy = lazy
         self.address = dictionary["address"] if "address" in dictionary else None
+        if not lazy:
+            self.location = Location(dictionary["location"], lazy) if "location" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ForumTopic:
@@ -1766,7 +2122,11 @@ class ForumTopic:
     - `icon_custom_emoji_id`: `string` - Optional. Unique identifier of the custom emoji shown as the topic icon
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "message_thread_id", "name", "icon_color", "icon_custom_emoji_id")
+    _known = frozenset({"message_thread_id", "name", "icon_color", "icon_custom_emoji_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -1775,9 +2135,9 @@ class ForumTopic:
         self.icon_color = dictionary["icon_color"] if "icon_color" in dictionary else None
         self.icon_custom_emoji_id = dictionary["icon_custom_emoji_id"] if "icon_custom_emoji_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommand:
@@ -1790,16 +2150,20 @@ class BotCommand:
     - `description`: `string` - Description of the command; 1-256 characters.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "command", "description")
+    _known = frozenset({"command", "description"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.command = dictionary["command"] if "command" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScope:
@@ -1810,14 +2174,18 @@ class BotCommandScope:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeDefault:
@@ -1829,15 +2197,19 @@ class BotCommandScopeDefault:
     - `type`: `string` - Scope type, must be default
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeAllPrivateChats:
@@ -1849,15 +2221,19 @@ class BotCommandScopeAllPrivateChats:
     - `type`: `string` - Scope type, must be all_private_chats
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeAllGroupChats:
@@ -1869,15 +2245,19 @@ class BotCommandScopeAllGroupChats:
     - `type`: `string` - Scope type, must be all_group_chats
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeAllChatAdministrators:
@@ -1889,15 +2269,19 @@ class BotCommandScopeAllChatAdministrators:
     - `type`: `string` - Scope type, must be all_chat_administrators
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeChat:
@@ -1909,15 +2293,19 @@ class BotCommandScopeChat:
     - `type`: `string` - Scope type, must be chat
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeChatAdministrators:
@@ -1929,15 +2317,19 @@ class BotCommandScopeChatAdministrators:
     - `type`: `string` - Scope type, must be chat_administrators
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class BotCommandScopeChatMember:
@@ -1950,16 +2342,20 @@ class BotCommandScopeChatMember:
     - `user_id`: `int` - Unique identifier of the target user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "user_id")
+    _known = frozenset({"type", "user_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
         self.user_id = dictionary["user_id"] if "user_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MenuButton:
@@ -1970,14 +2366,18 @@ class MenuButton:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MenuButtonCommands:
@@ -1989,15 +2389,19 @@ class MenuButtonCommands:
     - `type`: `string` - Type of the button, must be commands
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MenuButtonWebApp:
@@ -2011,17 +2415,26 @@ class MenuButtonWebApp:
     - `web_app`: `WebAppInfo` - Description of the Web App that will be launched when the user presses the button. The Web App will be able to send an arbitrary message on behalf of the user using the method answerWebAppQuery.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "text", "web_app")
+    _known = frozenset({"type", "text", "web_app"})
+    _nested = {"web_app": ("web_app", "WebAppInfo")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.text = dictionary["text"] if "text" in dictionary else None
-        self.web_app = WebAppInfo(dictionary["web_app"]) if "web_app" in dictionary else None
+        if not lazy:
+            self.web_app = WebAppInfo(dictionary["web_app"], lazy) if "web_app" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MenuButtonDefault:
@@ -2033,15 +2446,19 @@ class MenuButtonDefault:
     - `type`: `string` - Type of the button, must be default
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type")
+    _known = frozenset({"type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.type = dictionary["type"] if "type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ResponseParameters:
@@ -2054,16 +2471,20 @@ class ResponseParameters:
     - `retry_after`: `int` - Optional. In case of exceeding flood control, the number of seconds left to wait before the request can be repeated
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "migrate_to_chat_id", "retry_after")
+    _known = frozenset({"migrate_to_chat_id", "retry_after"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.migrate_to_chat_id = dictionary["migrate_to_chat_id"] if "migrate_to_chat_id" in dictionary else None
         self.retry_after = dictionary["retry_after"] if "retry_after" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMedia:
@@ -2074,14 +2495,18 @@ class InputMedia:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMediaPhoto:
@@ -2097,7 +2522,11 @@ class InputMediaPhoto:
     - `caption_entities`: `list` - Optional. List of special entities that appear in the caption, which can be specified instead of parse_mode
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "media", "caption", "parse_mode", "caption_entities")
+    _known = frozenset({"type", "media", "caption", "parse_mode", "caption_entities"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2107,9 +2536,9 @@ class InputMediaPhoto:
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMediaVideo:
@@ -2129,7 +2558,11 @@ class InputMediaVideo:
     - `supports_streaming`: `bool` - Optional. Pass True if the uploaded video is suitable for streaming
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "media", "caption", "parse_mode", "caption_entities", "width", "height", "duration", "supports_streaming")
+    _known = frozenset({"type", "media", "caption", "parse_mode", "caption_entities", "width", "height", "duration", "supports_streaming"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2143,9 +2576,9 @@ class InputMediaVideo:
         self.duration = dictionary["duration"] if "duration" in dictionary else None
         self.supports_streaming = dictionary["supports_streaming"] if "supports_streaming" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMediaAnimation:
@@ -2164,7 +2597,11 @@ class InputMediaAnimation:
     - `duration`: `int` - Optional. Animation duration in seconds
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "media", "caption", "parse_mode", "caption_entities", "width", "height", "duration")
+    _known = frozenset({"type", "media", "caption", "parse_mode", "caption_entities", "width", "height", "duration"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2177,9 +2614,9 @@ class InputMediaAnimation:
         self.height = dictionary["height"] if "height" in dictionary else None
         self.duration = dictionary["duration"] if "duration" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMediaAudio:
@@ -2198,7 +2635,11 @@ class InputMediaAudio:
     - `title`: `string` - Optional. Title of the audio
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "media", "caption", "parse_mode", "caption_entities", "duration", "performer", "title")
+    _known = frozenset({"type", "media", "caption", "parse_mode", "caption_entities", "duration", "performer", "title"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2211,9 +2652,9 @@ class InputMediaAudio:
         self.performer = dictionary["performer"] if "performer" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMediaDocument:
@@ -2230,7 +2671,11 @@ class InputMediaDocument:
     - `disable_content_type_detection`: `bool` - Optional. Disables automatic server-side content type detection for files uploaded using multipart/form-data. Always True, if the document is sent as part of an album.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "type", "media", "caption", "parse_mode", "caption_entities", "disable_content_type_detection")
+    _known = frozenset({"type", "media", "caption", "parse_mode", "caption_entities", "disable_content_type_detection"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2241,12 +2686,12 @@ class InputMediaDocument:
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
         self.disable_content_type_detection = dictionary["disable_content_type_detection"] if "disable_content_type_detection" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
-class InputFile:
+class InputFile(objects.InputFile):
     """This object represents the contents of a file to be uploaded. Must be posted using multipart/form-data in the usual way that files are uploaded via the browser.[See on Telegram API](https://core.telegram.org/bots/api#inputfile)
 
     - - - - -
@@ -2254,14 +2699,18 @@ class InputFile:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Sticker:
@@ -2286,10 +2735,18 @@ class Sticker:
     - `file_size`: `int` - Optional. File size in bytes
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "file_id", "file_unique_id", "type", "width", "height", "is_animated", "is_video", "emoji", "set_name", "custom_emoji_id", "file_size", "thumb", "premium_animation", "mask_position")
+    _known = frozenset({"file_id", "file_unique_id", "type", "width", "height", "is_animated", "is_video", "emoji", "set_name", "custom_emoji_id", "file_size", "thumb", "premium_animation", "mask_position"})
+    _nested = {"thumb": ("thumb", "PhotoSize"), "premium_animation": ("premium_animation", "File"), "mask_position": ("mask_position", "MaskPosition")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.file_id = dictionary["file_id"] if "file_id" in dictionary else None
         self.file_unique_id = dictionary["file_unique_id"] if "file_unique_id" in dictionary else None
         self.type = dictionary["type"] if "type" in dictionary else None
@@ -2297,17 +2754,18 @@ class Sticker:
         self.height = dictionary["height"] if "height" in dictionary else None
         self.is_animated = dictionary["is_animated"] if "is_animated" in dictionary else None
         self.is_video = dictionary["is_video"] if "is_video" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
         self.emoji = dictionary["emoji"] if "emoji" in dictionary else None
         self.set_name = dictionary["set_name"] if "set_name" in dictionary else None
-        self.premium_animation = File(dictionary["premium_animation"]) if "premium_animation" in dictionary else None
-        self.mask_position = MaskPosition(dictionary["mask_position"]) if "mask_position" in dictionary else None
         self.custom_emoji_id = dictionary["custom_emoji_id"] if "custom_emoji_id" in dictionary else None
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
+            self.premium_animation = File(dictionary["premium_animation"], lazy) if "premium_animation" in dictionary else None
+            self.mask_position = MaskPosition(dictionary["mask_position"], lazy) if "mask_position" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class StickerSet:
@@ -2325,21 +2783,30 @@ class StickerSet:
     - `thumb`: `PhotoSize` - Optional. Sticker set thumbnail in the .WEBP, .TGS, or .WEBM format
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "name", "title", "sticker_type", "is_animated", "is_video", "stickers", "thumb")
+    _known = frozenset({"name", "title", "sticker_type", "is_animated", "is_video", "stickers", "thumb"})
+    _nested = {"thumb": ("thumb", "PhotoSize")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.name = dictionary["name"] if "name" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
         self.sticker_type = dictionary["sticker_type"] if "sticker_type" in dictionary else None
         self.is_animated = dictionary["is_animated"] if "is_animated" in dictionary else None
         self.is_video = dictionary["is_video"] if "is_video" in dictionary else None
         self.stickers = list(dictionary["stickers"]) if "stickers" in dictionary else None
-        self.thumb = PhotoSize(dictionary["thumb"]) if "thumb" in dictionary else None
+        if not lazy:
+            self.thumb = PhotoSize(dictionary["thumb"], lazy) if "thumb" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class MaskPosition:
@@ -2354,7 +2821,11 @@ class MaskPosition:
     - `scale`: `float` - Mask scaling coefficient. For example, 2.0 means double size.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "point", "x_shift", "y_shift", "scale")
+    _known = frozenset({"point", "x_shift", "y_shift", "scale"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -2363,9 +2834,9 @@ class MaskPosition:
         self.y_shift = dictionary["y_shift"] if "y_shift" in dictionary else None
         self.scale = dictionary["scale"] if "scale" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQuery:
@@ -2382,20 +2853,29 @@ class InlineQuery:
     - `location`: `Location` - Optional. Sender location, only for bots that request user location
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "id", "query", "offset", "chat_type", "user", "location")
+    _known = frozenset({"id", "query", "offset", "chat_type", "from", "location"})
+    _nested = {"user": ("from", "User"), "location": ("location", "Location"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.id = dictionary["id"] if "id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.query = dictionary["query"] if "query" in dictionary else None
         self.offset = dictionary["offset"] if "offset" in dictionary else None
         self.chat_type = dictionary["chat_type"] if "chat_type" in dictionary else None
-        self.location = Location(dictionary["location"]) if "location" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.location = Location(dictionary["location"], lazy) if "location" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResult:
@@ -2406,14 +2886,18 @@ class InlineQueryResult:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultArticle:
@@ -2435,25 +2919,34 @@ class InlineQueryResultArticle:
     - `thumb_height`: `int` - Optional. Thumbnail height
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "title", "url", "hide_url", "description", "thumb_url", "thumb_width", "thumb_height", "input_message_content", "reply_markup")
+    _known = frozenset({"type", "id", "title", "url", "hide_url", "description", "thumb_url", "thumb_width", "thumb_height", "input_message_content", "reply_markup"})
+    _nested = {"input_message_content": ("input_message_content", "InputMessageContent"), "reply_markup": ("reply_markup", "InlineKeyboardMarkup")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
         self.url = dictionary["url"] if "url" in dictionary else None
         self.hide_url = dictionary["hide_url"] if "hide_url" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
         self.thumb_url = dictionary["thumb_url"] if "thumb_url" in dictionary else None
         self.thumb_width = dictionary["thumb_width"] if "thumb_width" in dictionary else None
         self.thumb_height = dictionary["thumb_height"] if "thumb_height" in dictionary else None
+        if not lazy:
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultPhoto:
@@ -2477,10 +2970,18 @@ class InlineQueryResultPhoto:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the photo
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "photo_url", "thumb_url", "photo_width", "photo_height", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "photo_url", "thumb_url", "photo_width", "photo_height", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.photo_url = dictionary["photo_url"] if "photo_url" in dictionary else None
@@ -2492,12 +2993,13 @@ class InlineQueryResultPhoto:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultGif:
@@ -2522,10 +3024,18 @@ class InlineQueryResultGif:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the GIF animation
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "gif_url", "gif_width", "gif_height", "gif_duration", "thumb_url", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "gif_url", "gif_width", "gif_height", "gif_duration", "thumb_url", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.gif_url = dictionary["gif_url"] if "gif_url" in dictionary else None
@@ -2538,12 +3048,13 @@ class InlineQueryResultGif:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultMpeg4Gif:
@@ -2568,10 +3079,18 @@ class InlineQueryResultMpeg4Gif:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the video animation
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "mpeg4_url", "mpeg4_width", "mpeg4_height", "mpeg4_duration", "thumb_url", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "mpeg4_url", "mpeg4_width", "mpeg4_height", "mpeg4_duration", "thumb_url", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.mpeg4_url = dictionary["mpeg4_url"] if "mpeg4_url" in dictionary else None
@@ -2584,12 +3103,13 @@ class InlineQueryResultMpeg4Gif:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultVideo:
@@ -2615,10 +3135,18 @@ class InlineQueryResultVideo:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the video. This field is required if InlineQueryResultVideo is used to send an HTML-page as a result (e.g., a YouTube video).
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "video_url", "mime_type", "thumb_url", "title", "caption", "parse_mode", "caption_entities", "video_width", "video_height", "video_duration", "description", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "video_url", "mime_type", "thumb_url", "title", "caption", "parse_mode", "caption_entities", "video_width", "video_height", "video_duration", "description", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.video_url = dictionary["video_url"] if "video_url" in dictionary else None
@@ -2632,12 +3160,13 @@ class InlineQueryResultVideo:
         self.video_height = dictionary["video_height"] if "video_height" in dictionary else None
         self.video_duration = dictionary["video_duration"] if "video_duration" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultAudio:
@@ -2659,10 +3188,18 @@ class InlineQueryResultAudio:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the audio
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "audio_url", "title", "caption", "parse_mode", "caption_entities", "performer", "audio_duration", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "audio_url", "title", "caption", "parse_mode", "caption_entities", "performer", "audio_duration", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.audio_url = dictionary["audio_url"] if "audio_url" in dictionary else None
@@ -2672,12 +3209,13 @@ class InlineQueryResultAudio:
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
         self.performer = dictionary["performer"] if "performer" in dictionary else None
         self.audio_duration = dictionary["audio_duration"] if "audio_duration" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultVoice:
@@ -2698,10 +3236,18 @@ class InlineQueryResultVoice:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the voice recording
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "voice_url", "title", "caption", "parse_mode", "caption_entities", "voice_duration", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "voice_url", "title", "caption", "parse_mode", "caption_entities", "voice_duration", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.voice_url = dictionary["voice_url"] if "voice_url" in dictionary else None
@@ -2710,12 +3256,13 @@ class InlineQueryResultVoice:
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
         self.voice_duration = dictionary["voice_duration"] if "voice_duration" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultDocument:
@@ -2740,10 +3287,18 @@ class InlineQueryResultDocument:
     - `thumb_height`: `int` - Optional. Thumbnail height
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "title", "caption", "parse_mode", "caption_entities", "document_url", "mime_type", "description", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "title", "caption", "parse_mode", "caption_entities", "document_url", "mime_type", "description", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
@@ -2753,15 +3308,16 @@ class InlineQueryResultDocument:
         self.document_url = dictionary["document_url"] if "document_url" in dictionary else None
         self.mime_type = dictionary["mime_type"] if "mime_type" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
         self.thumb_url = dictionary["thumb_url"] if "thumb_url" in dictionary else None
         self.thumb_width = dictionary["thumb_width"] if "thumb_width" in dictionary else None
         self.thumb_height = dictionary["thumb_height"] if "thumb_height" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultLocation:
@@ -2786,10 +3342,18 @@ class InlineQueryResultLocation:
     - `thumb_height`: `int` - Optional. Thumbnail height
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "latitude", "longitude", "title", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "latitude", "longitude", "title", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.latitude = dictionary["latitude"] if "latitude" in dictionary else None
@@ -2799,15 +3363,16 @@ class InlineQueryResultLocation:
         self.live_period = dictionary["live_period"] if "live_period" in dictionary else None
         self.heading = dictionary["heading"] if "heading" in dictionary else None
         self.proximity_alert_radius = dictionary["proximity_alert_radius"] if "proximity_alert_radius" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
         self.thumb_url = dictionary["thumb_url"] if "thumb_url" in dictionary else None
         self.thumb_width = dictionary["thumb_width"] if "thumb_width" in dictionary else None
         self.thumb_height = dictionary["thumb_height"] if "thumb_height" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultVenue:
@@ -2833,10 +3398,18 @@ class InlineQueryResultVenue:
     - `thumb_height`: `int` - Optional. Thumbnail height
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.latitude = dictionary["latitude"] if "latitude" in dictionary else None
@@ -2847,15 +3420,16 @@ class InlineQueryResultVenue:
         self.foursquare_type = dictionary["foursquare_type"] if "foursquare_type" in dictionary else None
         self.google_place_id = dictionary["google_place_id"] if "google_place_id" in dictionary else None
         self.google_place_type = dictionary["google_place_type"] if "google_place_type" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
         self.thumb_url = dictionary["thumb_url"] if "thumb_url" in dictionary else None
         self.thumb_width = dictionary["thumb_width"] if "thumb_width" in dictionary else None
         self.thumb_height = dictionary["thumb_height"] if "thumb_height" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultContact:
@@ -2877,25 +3451,34 @@ class InlineQueryResultContact:
     - `thumb_height`: `int` - Optional. Thumbnail height
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "phone_number", "first_name", "last_name", "vcard", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "phone_number", "first_name", "last_name", "vcard", "thumb_url", "thumb_width", "thumb_height", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.phone_number = dictionary["phone_number"] if "phone_number" in dictionary else None
         self.first_name = dictionary["first_name"] if "first_name" in dictionary else None
         self.last_name = dictionary["last_name"] if "last_name" in dictionary else None
         self.vcard = dictionary["vcard"] if "vcard" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
         self.thumb_url = dictionary["thumb_url"] if "thumb_url" in dictionary else None
         self.thumb_width = dictionary["thumb_width"] if "thumb_width" in dictionary else None
         self.thumb_height = dictionary["thumb_height"] if "thumb_height" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultGame:
@@ -2910,18 +3493,27 @@ class InlineQueryResultGame:
     - `reply_markup`: `InlineKeyboardMarkup` - Optional. Inline keyboard attached to the message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "game_short_name", "reply_markup")
+    _known = frozenset({"type", "id", "game_short_name", "reply_markup"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.game_short_name = dictionary["game_short_name"] if "game_short_name" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedPhoto:
@@ -2942,10 +3534,18 @@ class InlineQueryResultCachedPhoto:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the photo
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "photo_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "photo_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.photo_file_id = dictionary["photo_file_id"] if "photo_file_id" in dictionary else None
@@ -2954,12 +3554,13 @@ class InlineQueryResultCachedPhoto:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedGif:
@@ -2979,10 +3580,18 @@ class InlineQueryResultCachedGif:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the GIF animation
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "gif_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "gif_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.gif_file_id = dictionary["gif_file_id"] if "gif_file_id" in dictionary else None
@@ -2990,12 +3599,13 @@ class InlineQueryResultCachedGif:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedMpeg4Gif:
@@ -3015,10 +3625,18 @@ class InlineQueryResultCachedMpeg4Gif:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the video animation
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "mpeg4_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "mpeg4_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.mpeg4_file_id = dictionary["mpeg4_file_id"] if "mpeg4_file_id" in dictionary else None
@@ -3026,12 +3644,13 @@ class InlineQueryResultCachedMpeg4Gif:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedSticker:
@@ -3047,19 +3666,28 @@ class InlineQueryResultCachedSticker:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the sticker
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "sticker_file_id", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "sticker_file_id", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.sticker_file_id = dictionary["sticker_file_id"] if "sticker_file_id" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedDocument:
@@ -3080,10 +3708,18 @@ class InlineQueryResultCachedDocument:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the file
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "title", "document_file_id", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "title", "document_file_id", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.title = dictionary["title"] if "title" in dictionary else None
@@ -3092,12 +3728,13 @@ class InlineQueryResultCachedDocument:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedVideo:
@@ -3118,10 +3755,18 @@ class InlineQueryResultCachedVideo:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the video
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "video_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "video_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.video_file_id = dictionary["video_file_id"] if "video_file_id" in dictionary else None
@@ -3130,12 +3775,13 @@ class InlineQueryResultCachedVideo:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedVoice:
@@ -3155,10 +3801,18 @@ class InlineQueryResultCachedVoice:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the voice message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "voice_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "voice_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.voice_file_id = dictionary["voice_file_id"] if "voice_file_id" in dictionary else None
@@ -3166,12 +3820,13 @@ class InlineQueryResultCachedVoice:
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InlineQueryResultCachedAudio:
@@ -3190,22 +3845,31 @@ class InlineQueryResultCachedAudio:
     - `input_message_content`: `InputMessageContent` - Optional. Content of the message to be sent instead of the audio
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "id", "audio_file_id", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content")
+    _known = frozenset({"type", "id", "audio_file_id", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"})
+    _nested = {"reply_markup": ("reply_markup", "InlineKeyboardMarkup"), "input_message_content": ("input_message_content", "InputMessageContent")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.id = dictionary["id"] if "id" in dictionary else None
         self.audio_file_id = dictionary["audio_file_id"] if "audio_file_id" in dictionary else None
         self.caption = dictionary["caption"] if "caption" in dictionary else None
         self.parse_mode = dictionary["parse_mode"] if "parse_mode" in dictionary else None
         self.caption_entities = list(dictionary["caption_entities"]) if "caption_entities" in dictionary else None
-        self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"]) if "reply_markup" in dictionary else None
-        self.input_message_content = InputMessageContent(dictionary["input_message_content"]) if "input_message_content" in dictionary else None
+        if not lazy:
+            self.reply_markup = InlineKeyboardMarkup(dictionary["reply_markup"], lazy) if "reply_markup" in dictionary else None
+            self.input_message_content = InputMessageContent(dictionary["input_message_content"], lazy) if "input_message_content" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputMessageContent:
@@ -3216,14 +3880,18 @@ class InputMessageContent:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputTextMessageContent:
@@ -3238,7 +3906,11 @@ class InputTextMessageContent:
     - `disable_web_page_preview`: `bool` - Optional. Disables link previews for links in the sent message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "message_text", "parse_mode", "entities", "disable_web_page_preview")
+    _known = frozenset({"message_text", "parse_mode", "entities", "disable_web_page_preview"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3247,9 +3919,9 @@ class InputTextMessageContent:
         self.entities = list(dictionary["entities"]) if "entities" in dictionary else None
         self.disable_web_page_preview = dictionary["disable_web_page_preview"] if "disable_web_page_preview" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputLocationMessageContent:
@@ -3266,7 +3938,11 @@ class InputLocationMessageContent:
     - `proximity_alert_radius`: `int` - Optional. For live locations, a maximum distance for proximity alerts about approaching another chat member, in meters. Must be between 1 and 100000 if specified.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "latitude", "longitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius")
+    _known = frozenset({"latitude", "longitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3277,9 +3953,9 @@ class InputLocationMessageContent:
         self.heading = dictionary["heading"] if "heading" in dictionary else None
         self.proximity_alert_radius = dictionary["proximity_alert_radius"] if "proximity_alert_radius" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputVenueMessageContent:
@@ -3298,7 +3974,11 @@ class InputVenueMessageContent:
     - `google_place_type`: `string` - Optional. Google Places type of the venue. (See supported types.)
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type")
+    _known = frozenset({"latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3311,9 +3991,9 @@ class InputVenueMessageContent:
         self.google_place_id = dictionary["google_place_id"] if "google_place_id" in dictionary else None
         self.google_place_type = dictionary["google_place_type"] if "google_place_type" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputContactMessageContent:
@@ -3328,7 +4008,11 @@ class InputContactMessageContent:
     - `vcard`: `string` - Optional. Additional data about the contact in the form of a vCard, 0-2048 bytes
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "phone_number", "first_name", "last_name", "vcard")
+    _known = frozenset({"phone_number", "first_name", "last_name", "vcard"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3337,9 +4021,9 @@ class InputContactMessageContent:
         self.last_name = dictionary["last_name"] if "last_name" in dictionary else None
         self.vcard = dictionary["vcard"] if "vcard" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class InputInvoiceMessageContent:
@@ -3370,7 +4054,11 @@ class InputInvoiceMessageContent:
     - `is_flexible`: `bool` - Optional. Pass True if the final price depends on the shipping method
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "title", "description", "payload", "provider_token", "currency", "prices", "max_tip_amount", "suggested_tip_amounts", "provider_data", "photo_url", "photo_size", "photo_width", "photo_height", "need_name", "need_phone_number", "need_email", "need_shipping_address", "send_phone_number_to_provider", "send_email_to_provider", "is_flexible")
+    _known = frozenset({"title", "description", "payload", "provider_token", "currency", "prices", "max_tip_amount", "suggested_tip_amounts", "provider_data", "photo_url", "photo_size", "photo_width", "photo_height", "need_name", "need_phone_number", "need_email", "need_shipping_address", "send_phone_number_to_provider", "send_email_to_provider", "is_flexible"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3395,9 +4083,9 @@ class InputInvoiceMessageContent:
         self.send_email_to_provider = dictionary["send_email_to_provider"] if "send_email_to_provider" in dictionary else None
         self.is_flexible = dictionary["is_flexible"] if "is_flexible" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ChosenInlineResult:
@@ -3413,19 +4101,28 @@ class ChosenInlineResult:
     - `query`: `string` - The query that was used to obtain the result
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "result_id", "inline_message_id", "query", "user", "location")
+    _known = frozenset({"result_id", "inline_message_id", "query", "from", "location"})
+    _nested = {"user": ("from", "User"), "location": ("location", "Location"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.result_id = dictionary["result_id"] if "result_id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
-        self.location = Location(dictionary["location"]) if "location" in dictionary else None
         self.inline_message_id = dictionary["inline_message_id"] if "inline_message_id" in dictionary else None
         self.query = dictionary["query"] if "query" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.location = Location(dictionary["location"], lazy) if "location" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class SentWebAppMessage:
@@ -3437,15 +4134,19 @@ class SentWebAppMessage:
     - `inline_message_id`: `string` - Optional. Identifier of the sent inline message. Available only if there is an inline keyboard attached to the message.
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "inline_message_id")
+    _known = frozenset({"inline_message_id"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.inline_message_id = dictionary["inline_message_id"] if "inline_message_id" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class LabeledPrice:
@@ -3458,16 +4159,20 @@ class LabeledPrice:
     - `amount`: `int` - Price of the product in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "label", "amount")
+    _known = frozenset({"label", "amount"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
         self.label = dictionary["label"] if "label" in dictionary else None
         self.amount = dictionary["amount"] if "amount" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Invoice:
@@ -3483,7 +4188,11 @@ class Invoice:
     - `total_amount`: `int` - Total price in the smallest units of the currency (integer, not float/double). For example, for a price of US$ 1.45 pass amount = 145. See the exp parameter in currencies.json, it shows the number of digits past the decimal point for each currency (2 for the majority of currencies).
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "title", "description", "start_parameter", "currency", "total_amount")
+    _known = frozenset({"title", "description", "start_parameter", "currency", "total_amount"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3493,9 +4202,9 @@ class Invoice:
         self.currency = dictionary["currency"] if "currency" in dictionary else None
         self.total_amount = dictionary["total_amount"] if "total_amount" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ShippingAddress:
@@ -3512,7 +4221,11 @@ class ShippingAddress:
     - `post_code`: `string` - Address post code
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "country_code", "state", "city", "street_line1", "street_line2", "post_code")
+    _known = frozenset({"country_code", "state", "city", "street_line1", "street_line2", "post_code"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3523,9 +4236,9 @@ class ShippingAddress:
         self.street_line2 = dictionary["street_line2"] if "street_line2" in dictionary else None
         self.post_code = dictionary["post_code"] if "post_code" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class OrderInfo:
@@ -3540,18 +4253,27 @@ class OrderInfo:
     - `shipping_address`: `ShippingAddress` - Optional. User shipping address
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "name", "phone_number", "email", "shipping_address")
+    _known = frozenset({"name", "phone_number", "email", "shipping_address"})
+    _nested = {"shipping_address": ("shipping_address", "ShippingAddress")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.name = dictionary["name"] if "name" in dictionary else None
         self.phone_number = dictionary["phone_number"] if "phone_number" in dictionary else None
         self.email = dictionary["email"] if "email" in dictionary else None
-        self.shipping_address = ShippingAddress(dictionary["shipping_address"]) if "shipping_address" in dictionary else None
+        if not lazy:
+            self.shipping_address = ShippingAddress(dictionary["shipping_address"], lazy) if "shipping_address" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ShippingOption:
@@ -3565,7 +4287,11 @@ class ShippingOption:
     - `prices`: `list` - List of price portions
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "id", "title", "prices")
+    _known = frozenset({"id", "title", "prices"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3573,9 +4299,9 @@ class ShippingOption:
         self.title = dictionary["title"] if "title" in dictionary else None
         self.prices = list(dictionary["prices"]) if "prices" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class SuccessfulPayment:
@@ -3593,21 +4319,30 @@ class SuccessfulPayment:
     - `provider_payment_charge_id`: `string` - Provider payment identifier
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "currency", "total_amount", "invoice_payload", "shipping_option_id", "telegram_payment_charge_id", "provider_payment_charge_id", "order_info")
+    _known = frozenset({"currency", "total_amount", "invoice_payload", "shipping_option_id", "telegram_payment_charge_id", "provider_payment_charge_id", "order_info"})
+    _nested = {"order_info": ("order_info", "OrderInfo")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.currency = dictionary["currency"] if "currency" in dictionary else None
         self.total_amount = dictionary["total_amount"] if "total_amount" in dictionary else None
         self.invoice_payload = dictionary["invoice_payload"] if "invoice_payload" in dictionary else None
         self.shipping_option_id = dictionary["shipping_option_id"] if "shipping_option_id" in dictionary else None
-        self.order_info = OrderInfo(dictionary["order_info"]) if "order_info" in dictionary else None
         self.telegram_payment_charge_id = dictionary["telegram_payment_charge_id"] if "telegram_payment_charge_id" in dictionary else None
         self.provider_payment_charge_id = dictionary["provider_payment_charge_id"] if "provider_payment_charge_id" in dictionary else None
+        if not lazy:
+            self.order_info = OrderInfo(dictionary["order_info"], lazy) if "order_info" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class ShippingQuery:
@@ -3622,18 +4357,27 @@ class ShippingQuery:
     - `shipping_address`: `ShippingAddress` - User specified shipping address
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "id", "invoice_payload", "user", "shipping_address")
+    _known = frozenset({"id", "invoice_payload", "from", "shipping_address"})
+    _nested = {"user": ("from", "User"), "shipping_address": ("shipping_address", "ShippingAddress"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.id = dictionary["id"] if "id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.invoice_payload = dictionary["invoice_payload"] if "invoice_payload" in dictionary else None
-        self.shipping_address = ShippingAddress(dictionary["shipping_address"]) if "shipping_address" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.shipping_address = ShippingAddress(dictionary["shipping_address"], lazy) if "shipping_address" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PreCheckoutQuery:
@@ -3651,21 +4395,30 @@ class PreCheckoutQuery:
     - `order_info`: `OrderInfo` - Optional. Order information provided by the user
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "id", "currency", "total_amount", "invoice_payload", "shipping_option_id", "user", "order_info")
+    _known = frozenset({"id", "currency", "total_amount", "invoice_payload", "shipping_option_id", "from", "order_info"})
+    _nested = {"user": ("from", "User"), "order_info": ("order_info", "OrderInfo"), "from": ("from", None)}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.id = dictionary["id"] if "id" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.currency = dictionary["currency"] if "currency" in dictionary else None
         self.total_amount = dictionary["total_amount"] if "total_amount" in dictionary else None
         self.invoice_payload = dictionary["invoice_payload"] if "invoice_payload" in dictionary else None
         self.shipping_option_id = dictionary["shipping_option_id"] if "shipping_option_id" in dictionary else None
-        self.order_info = OrderInfo(dictionary["order_info"]) if "order_info" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["from"], lazy) if "from" in dictionary else None
+            self.order_info = OrderInfo(dictionary["order_info"], lazy) if "order_info" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportData:
@@ -3678,16 +4431,25 @@ class PassportData:
     - `credentials`: `EncryptedCredentials` - Encrypted credentials required to decrypt the data
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "data", "credentials")
+    _known = frozenset({"data", "credentials"})
+    _nested = {"credentials": ("credentials", "EncryptedCredentials")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.data = list(dictionary["data"]) if "data" in dictionary else None
-        self.credentials = EncryptedCredentials(dictionary["credentials"]) if "credentials" in dictionary else None
+        if not lazy:
+            self.credentials = EncryptedCredentials(dictionary["credentials"], lazy) if "credentials" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportFile:
@@ -3702,7 +4464,11 @@ class PassportFile:
     - `file_date`: `int` - Unix time when the file was uploaded
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "file_id", "file_unique_id", "file_size", "file_date")
+    _known = frozenset({"file_id", "file_unique_id", "file_size", "file_date"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3711,9 +4477,9 @@ class PassportFile:
         self.file_size = dictionary["file_size"] if "file_size" in dictionary else None
         self.file_date = dictionary["file_date"] if "file_date" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class EncryptedPassportElement:
@@ -3734,24 +4500,33 @@ class EncryptedPassportElement:
     - `hash`: `string` - Base64-encoded element hash for using in PassportElementErrorUnspecified
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "type", "data", "phone_number", "email", "files", "translation", "hash", "front_side", "reverse_side", "selfie")
+    _known = frozenset({"type", "data", "phone_number", "email", "files", "translation", "hash", "front_side", "reverse_side", "selfie"})
+    _nested = {"front_side": ("front_side", "PassportFile"), "reverse_side": ("reverse_side", "PassportFile"), "selfie": ("selfie", "PassportFile")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.type = dictionary["type"] if "type" in dictionary else None
         self.data = dictionary["data"] if "data" in dictionary else None
         self.phone_number = dictionary["phone_number"] if "phone_number" in dictionary else None
         self.email = dictionary["email"] if "email" in dictionary else None
         self.files = list(dictionary["files"]) if "files" in dictionary else None
-        self.front_side = PassportFile(dictionary["front_side"]) if "front_side" in dictionary else None
-        self.reverse_side = PassportFile(dictionary["reverse_side"]) if "reverse_side" in dictionary else None
-        self.selfie = PassportFile(dictionary["selfie"]) if "selfie" in dictionary else None
         self.translation = list(dictionary["translation"]) if "translation" in dictionary else None
         self.hash = dictionary["hash"] if "hash" in dictionary else None
+        if not lazy:
+            self.front_side = PassportFile(dictionary["front_side"], lazy) if "front_side" in dictionary else None
+            self.reverse_side = PassportFile(dictionary["reverse_side"], lazy) if "reverse_side" in dictionary else None
+            self.selfie = PassportFile(dictionary["selfie"], lazy) if "selfie" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class EncryptedCredentials:
@@ -3765,7 +4540,11 @@ class EncryptedCredentials:
     - `secret`: `string` - Base64-encoded secret, encrypted with the bot's public RSA key, required for data decryption
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "data", "hash", "secret")
+    _known = frozenset({"data", "hash", "secret"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3773,9 +4552,9 @@ class EncryptedCredentials:
         self.hash = dictionary["hash"] if "hash" in dictionary else None
         self.secret = dictionary["secret"] if "secret" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementError:
@@ -3786,14 +4565,18 @@ class PassportElementError:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorDataField:
@@ -3809,7 +4592,11 @@ class PassportElementErrorDataField:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "field_name", "data_hash", "message")
+    _known = frozenset({"source", "type", "field_name", "data_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3819,9 +4606,9 @@ class PassportElementErrorDataField:
         self.data_hash = dictionary["data_hash"] if "data_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorFrontSide:
@@ -3836,7 +4623,11 @@ class PassportElementErrorFrontSide:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hash", "message")
+    _known = frozenset({"source", "type", "file_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3845,9 +4636,9 @@ class PassportElementErrorFrontSide:
         self.file_hash = dictionary["file_hash"] if "file_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorReverseSide:
@@ -3862,7 +4653,11 @@ class PassportElementErrorReverseSide:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hash", "message")
+    _known = frozenset({"source", "type", "file_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3871,9 +4666,9 @@ class PassportElementErrorReverseSide:
         self.file_hash = dictionary["file_hash"] if "file_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorSelfie:
@@ -3888,7 +4683,11 @@ class PassportElementErrorSelfie:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hash", "message")
+    _known = frozenset({"source", "type", "file_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3897,9 +4696,9 @@ class PassportElementErrorSelfie:
         self.file_hash = dictionary["file_hash"] if "file_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorFile:
@@ -3914,7 +4713,11 @@ class PassportElementErrorFile:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hash", "message")
+    _known = frozenset({"source", "type", "file_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3923,9 +4726,9 @@ class PassportElementErrorFile:
         self.file_hash = dictionary["file_hash"] if "file_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorFiles:
@@ -3940,7 +4743,11 @@ class PassportElementErrorFiles:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hashes", "message")
+    _known = frozenset({"source", "type", "file_hashes", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3949,9 +4756,9 @@ class PassportElementErrorFiles:
         self.file_hashes = list(dictionary["file_hashes"]) if "file_hashes" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorTranslationFile:
@@ -3966,7 +4773,11 @@ class PassportElementErrorTranslationFile:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hash", "message")
+    _known = frozenset({"source", "type", "file_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -3975,9 +4786,9 @@ class PassportElementErrorTranslationFile:
         self.file_hash = dictionary["file_hash"] if "file_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorTranslationFiles:
@@ -3992,7 +4803,11 @@ class PassportElementErrorTranslationFiles:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "file_hashes", "message")
+    _known = frozenset({"source", "type", "file_hashes", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -4001,9 +4816,9 @@ class PassportElementErrorTranslationFiles:
         self.file_hashes = list(dictionary["file_hashes"]) if "file_hashes" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class PassportElementErrorUnspecified:
@@ -4018,7 +4833,11 @@ class PassportElementErrorUnspecified:
     - `message`: `string` - Error message
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__", "source", "type", "element_hash", "message")
+    _known = frozenset({"source", "type", "element_hash", "message"})
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
@@ -4027,9 +4846,9 @@ class PassportElementErrorUnspecified:
         self.element_hash = dictionary["element_hash"] if "element_hash" in dictionary else None
         self.message = dictionary["message"] if "message" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class Game:
@@ -4046,20 +4865,29 @@ class Game:
     - `animation`: `Animation` - Optional. Animation that will be displayed in the game message in chats. Upload via BotFather
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "title", "description", "photo", "text", "text_entities", "animation")
+    _known = frozenset({"title", "description", "photo", "text", "text_entities", "animation"})
+    _nested = {"animation": ("animation", "Animation")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.title = dictionary["title"] if "title" in dictionary else None
         self.description = dictionary["description"] if "description" in dictionary else None
         self.photo = list(dictionary["photo"]) if "photo" in dictionary else None
         self.text = dictionary["text"] if "text" in dictionary else None
         self.text_entities = list(dictionary["text_entities"]) if "text_entities" in dictionary else None
-        self.animation = Animation(dictionary["animation"]) if "animation" in dictionary else None
+        if not lazy:
+            self.animation = Animation(dictionary["animation"], lazy) if "animation" in dictionary else None
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class CallbackGame:
@@ -4070,14 +4898,18 @@ class CallbackGame:
 
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "__dict__")
+    _known = frozenset()
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
         self.dict = dictionary
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
 
 class GameHighScore:
@@ -4091,15 +4923,29 @@ class GameHighScore:
     - `score`: `int` - Score
     """
 
-    def __init__(self, dictionary=None):
+    __slots__ = ("dict", "_lazy", "__dict__", "position", "score", "user")
+    _known = frozenset({"position", "score", "user"})
+    _nested = {"user": ("user", "User")}
+    __getattr__ = helper.getAttribute
+
+    def __init__(self, dictionary=None, lazy=None):
         if dictionary is None:
             dictionary = {}
+        if lazy is None:
+            lazy = lazy_parsing
         self.dict = dictionary
+        self._lazy = lazy
         self.position = dictionary["position"] if "position" in dictionary else None
-        self.user = User(dictionary["from"]) if "from" in dictionary else None
         self.score = dictionary["score"] if "score" in dictionary else None
+        if not lazy:
+            self.user = User(dictionary["user"], lazy) if "user" in dictionary else None
+
+        if not self._known.issuperset(dictionary):
+            for index in dictionary.keys() - self._known:
+                helper.setExtra(self, index, helper.setBvar(dictionary[index]))
 
-        for index, value in self.dict.items():
-            if not hasattr(self, index):
-                setattr(self, index, helper.setBvar(value))
 
+for _class in list(globals().values()):
+    if isinstance(_class, type) and _class.__module__ == __name__:
+        _class._serialize = helper.compileSerializer(_class)
+del _class
@@ -1,7 +1,8 @@
 """
-## This module's purpose is to handle botApi updates with multithreading
+## This module's purpose is to handle botApi updates with multithreading or with asyncio
 """
 
+import traceback
 from threading import Thread
 
 from silbot import botapi, types
@@ -32,3 +33,20 @@ class update(Thread):
         This is callen when the thread starts, parses the update and calls the given function
         """
         self.function(self.parsed, self.bot)
+
+
+async def asyncUpdate(update, bot, function):
+    """
+    Parses the update and awaits the given coroutine function, this is the asyncio version of `update`
+
+    Exceptions raised by the function are printed, like it happens with threads
+
+    **Args:**
+    - update (`dict`): json_decoded update
+    - bot (`AsyncBotApi`): the current bot AsyncBotApi object
+    - function (`coroutine function`): coroutine function to call to elaborate the update
+    """
+    try:
+        await function(types.Update(update), bot)
+    except Exception:
+        traceback.print_exc()
@@ -0,0 +1,193 @@
+"""
+## This module's purpose is to upload files to botAPI with multipart/form-data
+
+When the arguments of a request contain a `types.InputFile`, the request is sent as a `MultipartStream`:
+the body is generated while it is sent, reading the files in chunks, so they are never loaded entirely in memory.
+Files inside other objects, like the `media` of `InputMedia` objects, are attached with `attach://` references.
+"""
+
+import asyncio
+import binascii
+import os
+
+from silbot import types, helper
+
+
+def extractFiles(body):
+    """Replaces the files inside the arguments of a request, the main utility of this function is internal
+
+    - - - - -
+    **Args**:
+
+    - `body` (`dict`): arguments converted by `helper.toBody`
+
+    **Returns**
+    - `tuple` with the arguments without files as first member and a `list` of (`field name`, `types.InputFile`) as second member.
+    Files that are not top level arguments are replaced by `attach://<field name>`
+    """
+    files = []
+
+    def replace(value, top_level_name=None):
+        if isinstance(value, types.InputFile):
+            name = top_level_name if top_level_name is not None else "file" + str(len(files))
+            files.append((name, value))
+            return None if top_level_name is not None else "attach://" + name
+        if type(value) == dict:
+            return {key: replace(item) for key, item in value.items()}
+        if type(value) == list:
+            return [replace(item) for item in value]
+        return value
+
+    fields = {}
+    for key, value in body.items():
+        value = replace(value, key)
+        if value is not None:
+            fields[key] = value
+    return fields, files
+
+
+def localFiles(arguments):
+    """Replaces the files given by path with `file://` URIs, that a local Bot API server started with `--local` reads from the disk
+
+    - - - - -
+    **Args**:
+
+    - `arguments` (`dict`): arguments of the request, they are not modified
+
+    **Returns**
+    - `dict` arguments without files given by path
+    """
+    replaced = arguments
+    for key, value in arguments.items():
+        if isinstance(value, types.InputFile) and isinstance(value.dict.get("file"), (str, os.PathLike)):
+            if replaced is arguments:
+                replaced = dict(arguments)
+            replaced[key] = "file://" + os.path.abspath(value.dict["file"])
+    return replaced
+
+
+def multipart(arguments, chunk_size=65536):
+    """Returns a `MultipartStream` for the arguments of a request if they contain files
+
+    - - - - -
+    **Args**:
+
+    - `arguments` (`dict`): arguments of the request
+    - `chunk_size` (`int`): maximum size in bytes of the chunks read from the files
+
+    **Returns**
+    - `MultipartStream`, or `None` if there are no files
+    """
+    fields, files = extractFiles(helper.toBody(arguments))
+    if not files:
+        return None
+    return MultipartStream(helper.toParams(fields), files, chunk_size)
+
+
+class MultipartStream:
+    """
+    multipart/form-data body that is generated while it is read
+    """
+
+    def __init__(self, fields, files, chunk_size=65536):
+        """Creates the body
+
+        - - - - -
+        **Args**:
+
+        - `fields` (`dict`): text fields, values are converted to `str`
+        - `files` (`list`): list of (`field name`, `types.InputFile`)
+        - `chunk_size` (`int`): maximum size in bytes of the chunks read from the files
+        """
+        self.boundary = binascii.hexlify(os.urandom(16)).decode()
+        self.content_type = "multipart/form-data; boundary=" + self.boundary
+        """Value of the Content-Type header"""
+        self.chunk_size = chunk_size
+        self.parts = []
+        for name, value in fields.items():
+            head = self._head(name) + b"\r\n"
+            self.parts.append((head + str(value).encode() + b"\r\n", None))
+        for name, file in files:
+            content_type = file.dict.get("content_type") or "application/octet-stream"
+            head = self._head(name, file.getName()) + b"Content-Type: " + content_type.encode() + b"\r\n\r\n"
+            self.parts.append((head, file))
+        self.end = b"--" + self.boundary.encode() + b"--\r\n"
+        self.len = self._length()
+        """Size of the body in bytes, `None` if the size of a file is unknown"""
+        self._chunks = None
+        self._buffer = memoryview(b"")
+
+    def _head(self, name, filename=None):
+        """Returns the headers of a part"""
+        disposition = 'form-data; name="' + name.replace('"', '%22') + '"'
+        if filename is not None:
+            disposition += '; filename="' + filename.replace('"', '%22') + '"'
+        return b"--" + self.boundary.encode() + b"\r\nContent-Disposition: " + disposition.encode("utf-8") + b"\r\n"
+
+    def _length(self):
+        """Returns the size of the body, `None` if it can't be known"""
+        length = len(self.end)
+        for head, file in self.parts:
+            length += len(head)
+            if file is not None:
+                size = file.getSize()
+                if size is None:
+                    return None
+                length += size + 2
+        return length
+
+    def __iter__(self):
+        for head, file in self.parts:
+            yield head
+            if file is not None:
+                yield from file.iterChunks(self.chunk_size)
+                yield b"\r\n"
+        yield self.end
+
+    def read(self, size=-1):
+        """Reads the next bytes of the body, like a file object
+
+        - - - - -
+        **Args**:
+
+        - `size` (`int`): maximum number of bytes to read, `-1` to read everything
+
+        **Returns**
+        - `bytes`, empty when the whole body has been read
+        """
+        if self._chunks is None:
+            self._chunks = iter(self)
+        if size < 0:
+            return bytes(self._buffer) + b"".join(self._chunks)
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer = memoryview(chunk)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return bytes(data)
+
+    async def aiter(self):
+        """Asynchronous generator of the chunks of the body, files are read in a thread so the event loop is not blocked
+
+        **Returns**
+        - `async generator` of `bytes`
+        """
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def headers(self):
+        """Returns the HTTP headers of the body
+
+        **Returns**
+        - `dict` with `Content-Type` and, if the size is known, `Content-Length`
+        """
+        headers = {"Content-Type": self.content_type}
+        if self.len is not None:
+            headers["Content-Length"] = str(self.len)
+        return headers
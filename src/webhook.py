@@ -0,0 +1,158 @@
+"""
+## This module's purpose is to receive botApi updates with a webhook
+
+`WebhookServer` is an asyncio HTTP server that receives the updates sent by botAPI after `setWebhook`.
+Updates can be given to an `UpdateDispatcher` like `silbot.GetUpdatesLoop` does, or elaborated directly by the
+server: in that case the handler can answer with a botApi method that is sent back in the body of the webhook
+response, saving a request, ex. `bot.inline().sendMessage(chat_id, "Hi")`.
+It requires [aiohttp](https://pypi.org/project/aiohttp/), install it with `pip install aiohttp`
+"""
+
+import asyncio
+import contextvars
+import hmac
+import traceback
+
+from silbot import botapi, codec, types, dispatcher
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+class WebhookServer:
+    """
+    Receives updates from botAPI with a webhook
+    """
+
+    def __init__(self, bot: botapi.BotApi, handlefunc, path: str = "/", secret_token: str = None,
+                 dispatcher: dispatcher.UpdateDispatcher = None, host: str = "0.0.0.0", port: int = 8080):
+        """Creates the webhook server, use `run` or `start` to start it
+
+        **Args:**
+
+        - bot (`botApi` or `AsyncBotApi`): bot object given to the handler
+        - handlefunc (`function` or `coroutine function`): function **defined by the user**, it is called with the `types.Update` and the bot like in `silbot.GetUpdatesLoop`.
+        If it is not elaborated by a dispatcher it can answer a method in the webhook response with `bot.inline()`, or by
+        returning a `dict` with a `method` key and the method parameters, ex. `{"method": "sendMessage", "chat_id": 1, "text": "Hi"}`
+        - path (`str`, optional): path where the updates are received. Defaults to `/`
+        - secret_token (`str`, optional): the `secret_token` given to `setWebhook`, requests without the same `X-Telegram-Bot-Api-Secret-Token` header are refused. Defaults to `None`
+        - dispatcher (`silbot.dispatcher.UpdateDispatcher`, optional): if given, updates are submitted to it and the webhook is answered as soon as they are queued. With the `block` overflow, a full queue delays the answer without blocking the server. Defaults to `None`
+        - host (`str`, optional): address where the server listens. Defaults to `0.0.0.0`
+        - port (`int`, optional): port where the server listens. Defaults to `8080`
+        """
+        if web is None:
+            raise ImportError("WebhookServer requires aiohttp, install it with pip install aiohttp")
+        self.bot = bot
+        self.handlefunc = handlefunc
+        self.path = path
+        self.secret_token = secret_token
+        self.dispatcher = dispatcher
+        if dispatcher is not None:
+            bot.growPool(dispatcher.workers)
+        self.host = host
+        self.port = port
+        self.runner = None
+
+    def setWebhook(self, url: str, **arguments):
+        """Sends a setWebhook request for this server, with its `secret_token`
+
+        **Args:**
+
+        - url (`str`): public HTTPS URL that reaches this server
+        - **arguments: other setWebhook parameters, like `max_connections` or `allowed_updates`
+
+        **Returns:**
+
+        - A `tuple`, on success a `bool` as first member and a botApiResponse object as second member
+        """
+        return self.bot.setWebhook(url, secret_token=self.secret_token, **arguments)
+
+    def makeApp(self):
+        """Returns the `aiohttp.web.Application` of the server, useful to add it to an existing aiohttp server
+
+        **Returns:**
+
+        - `aiohttp.web.Application`
+        """
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+        return app
+
+    async def start(self):
+        """Starts the server in the running event loop"""
+        self.runner = web.AppRunner(self.makeApp())
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+
+    async def stop(self):
+        """Stops the server"""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def run(self):
+        """Starts the server and blocks until it is stopped"""
+        web.run_app(self.makeApp(), host=self.host, port=self.port)
+
+    async def handle(self, request):
+        """Elaborates a webhook request sent by botAPI
+
+        **Args:**
+
+        - request (`aiohttp.web.Request`): the webhook request
+
+        **Returns:**
+
+        - `aiohttp.web.Response`: empty, or with the method returned by the handler
+        """
+        if self.secret_token is not None:
+            token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+            if not hmac.compare_digest(token.encode("utf-8", "surrogateescape"), self.secret_token.encode()):
+                return web.Response(status=403)
+        try:
+            update = codec.loads(await request.read())
+        except ValueError:
+            return web.Response(status=400)
+        if type(update) != dict:
+            return web.Response(status=400)
+        if self.dispatcher is not None:
+            if self.dispatcher.overflow == self.dispatcher.BLOCK:
+                # A full queue would block the event loop, and with it every other webhook request
+                await asyncio.get_running_loop().run_in_executor(None, self.dispatcher.submit, update, self.bot, self.handlefunc)
+            else:
+                self.dispatcher.submit(update, self.bot, self.handlefunc)
+            return web.Response()
+        reply = botapi.WebhookReply()
+        botapi.webhook_reply.set(reply)
+        answer = await self.runHandler(update)
+        reply.closed = True
+        if reply.answer is not None:
+            return web.json_response(reply.answer, dumps=codec.dumps)
+        if type(answer) == dict and "method" in answer:
+            return web.json_response(answer, dumps=codec.dumps)
+        return web.Response()
+
+    async def runHandler(self, update):
+        """Calls the handler with the parsed update, functions that are not coroutines are called in a thread
+
+        Exceptions raised by the handler are printed
+
+        **Args:**
+
+        - update (`dict`): json_decoded update
+
+        **Returns:**
+
+        - The value returned by the handler, `None` if it raised an exception
+        """
+        try:
+            parsed = types.Update(update)
+            if asyncio.iscoroutinefunction(self.handlefunc):
+                return await self.handlefunc(parsed, self.bot)
+            context = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(None, context.run, self.handlefunc, parsed, self.bot)
+        except Exception:
+            traceback.print_exc()
+            return None
@@ -0,0 +1,81 @@
+"""
+## This module's purpose is to check that `silbot.dispatcher` keeps the order of every chat without idling workers
+"""
+
+import threading
+import time
+import unittest
+
+from silbot import dispatcher
+
+
+def message(update_id, chat_id, delay):
+    return {"update_id": update_id, "message": {"message_id": update_id, "chat": {"id": chat_id, "type": "private"},
+                                                "date": 0, "text": str(delay)}}
+
+
+class OrderedDispatcherTest(unittest.TestCase):
+
+    def test_order_and_parallelism(self):
+        lock = threading.Lock()
+        handled = {}
+        running = set()
+        overlaps = []
+        started = time.monotonic()
+
+        def handle(update, bot):
+            chat_id = update.message.chat.id
+            with lock:
+                if chat_id in running:
+                    overlaps.append(chat_id)
+                running.add(chat_id)
+            time.sleep(float(update.message.text))
+            with lock:
+                running.discard(chat_id)
+                handled.setdefault(chat_id, []).append((update.update_id, time.monotonic() - started))
+
+        pool = dispatcher.UpdateDispatcher(workers=4, ordered=True)
+        update_id = 0
+        for _ in range(4):
+            update_id += 1
+            pool.submit(message(update_id, 0, 0.2), None, handle)
+        # Chats are not tied to a worker, so none of them waits for the updates of chat 0
+        for chat_id in range(1, 9):
+            update_id += 1
+            pool.submit(message(update_id, chat_id, 0.05), None, handle)
+        pool.stop()
+
+        self.assertEqual(overlaps, [])
+        self.assertEqual([update for update, _ in handled[0]], [1, 2, 3, 4])
+        self.assertGreaterEqual(handled[0][-1][1], 0.8)
+        for chat_id in range(1, 9):
+            self.assertLess(handled[chat_id][0][1], 0.5)
+        self.assertEqual(pool.stats()["processed"], 12)
+
+    def test_drop_oldest(self):
+        release = threading.Event()
+        taken = threading.Event()
+        handled = []
+
+        def handle(update, bot):
+            taken.set()
+            release.wait(5)
+            handled.append(update.update_id)
+
+        pool = dispatcher.UpdateDispatcher(workers=1, queue_size=2, overflow=dispatcher.UpdateDispatcher.DROP_OLDEST,
+                                           ordered=True)
+        pool.submit(message(1, 1, 0), None, handle)
+        taken.wait(5)
+        pool.submit(message(2, 1, 0), None, handle)
+        pool.submit(message(3, 2, 0), None, handle)
+        pool.submit(message(4, 2, 0), None, handle)
+        pool.submit(message(5, 3, 0), None, handle)
+        release.set()
+        pool.stop()
+        self.assertEqual(sorted(handled), [1, 2, 5])
+        self.assertEqual(pool.stats()["dropped"], 2)
+        self.assertEqual(pool.queueDepth(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+## This module's purpose is to check the errors of `BotApi.downloadFile`
+"""
+
+import asyncio
+import unittest
+
+from silbot import asyncbotapi, botapi, codec, types
+from silbot.response import BotAPIError, BotAPIResponse
+
+BIG_FILE = {"file_id": "BIGFILE", "file_unique_id": "BIG", "file_size": 30000000}
+
+
+def getFileResponse():
+    return types.File(BIG_FILE), BotAPIResponse(codec.dumps({"ok": True, "result": BIG_FILE}))
+
+
+class BigFileBot(botapi.BotApi):
+
+    def getFile(self, file_id):
+        return getFileResponse()
+
+
+class AsyncBigFileBot(asyncbotapi.AsyncBotApi):
+
+    async def getFile(self, file_id):
+        return getFileResponse()
+
+
+class MissingPathTest(unittest.TestCase):
+
+    def test_file_without_path(self):
+        with self.assertRaises(BotAPIError) as error:
+            BigFileBot("123:TOKEN").downloadFile("BIGFILE")
+        self.assertIn("too big", str(error.exception))
+        self.assertEqual(error.exception.response.error_code, 400)
+
+    def test_file_without_path_async(self):
+        async def run():
+            bot = AsyncBigFileBot("123:TOKEN")
+            try:
+                await bot.downloadFile("BIGFILE")
+            finally:
+                await bot.closeSession()
+
+        with self.assertRaises(BotAPIError) as error:
+            asyncio.run(run())
+        self.assertIn("too big", str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+## This module's purpose is to check which requests `silbot.flood` sends again and how long it holds them
+"""
+
+import io
+import unittest
+
+from silbot import flood, helper, types
+
+
+def photo(media):
+    return types.InputMediaPhoto({"type": "photo", "media": media})
+
+
+class ReplayableTest(unittest.TestCase):
+
+    def test_top_level_files(self):
+        self.assertTrue(flood.replayable({"chat_id": 1, "photo": helper.inputFile(b"data")}))
+        self.assertFalse(flood.replayable({"chat_id": 1, "photo": helper.inputFile(io.BytesIO(b"data"))}))
+
+    def test_files_inside_media(self):
+        self.assertTrue(flood.replayable({"chat_id": 1, "media": [photo("FILEID"), photo(helper.inputFile(b"data"))]}))
+        self.assertFalse(flood.replayable({"chat_id": 1, "media": [photo("FILEID"), photo(io.BytesIO(b"data"))]}))
+        self.assertFalse(flood.replayable({"chat_id": 1, "message_id": 2, "media": photo(io.BytesIO(b"data"))}))
+
+
+class FloodControlTest(unittest.TestCase):
+
+    def test_long_wait_is_not_parked(self):
+        control = flood.FloodControl(max_wait=1)
+        self.assertFalse(control.park("1", 5, 0, b'{"ok":false,"error_code":429}'))
+        self.assertEqual(control.delay("1"), 0)
+
+    def test_exhausted_retries_are_not_parked(self):
+        control = flood.FloodControl(max_retries=1)
+        self.assertFalse(control.park("1", 5, 1))
+        self.assertEqual(control.delay("1"), 0)
+
+    def test_parked_chat(self):
+        control = flood.FloodControl(max_wait=10)
+        error = b'{"ok":false,"error_code":429,"parameters":{"retry_after":5}}'
+        self.assertTrue(control.park("1", 5, 0, error))
+        self.assertGreater(control.delay("1"), 4)
+        self.assertEqual(control.delay("2"), 0)
+        control.max_wait = 1
+        self.assertEqual(control.refusal("1"), error)
+        self.assertEqual(flood.retryAfter(control.refusal("2")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
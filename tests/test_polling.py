@@ -0,0 +1,62 @@
+"""
+## This module's purpose is to check that `silbot.polling` survives the failures of botAPI
+"""
+
+import http.server
+import threading
+import unittest
+
+from silbot import botapi, codec, polling, retry
+
+UPDATE = {"update_id": 10, "message": {"message_id": 1, "chat": {"id": 1, "type": "private"}, "date": 0, "text": "Hi"}}
+
+
+class FlakyProxy(http.server.BaseHTTPRequestHandler):
+    """Answers the first getUpdates with the HTML page of a proxy, then with an update"""
+
+    answers = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status, content_type, body = self.answers.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PollingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyProxy)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.bot = botapi.BotApi("1:token", base_url="http://127.0.0.1:" + str(self.server.server_port),
+                                 retry_policy=retry.RetryPolicy(retries=0))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def poll(self, answers):
+        FlakyProxy.answers = answers + [(200, "application/json", codec.dumpBytes({"ok": True, "result": [UPDATE]}))]
+        errors = []
+        batches = polling.pollUpdates(self.bot, timeout=0, backoff=polling.Backoff(base=0.01),
+                                      on_error=lambda state, response, delay: errors.append(state))
+        self.assertEqual(next(batches), [UPDATE])
+        return errors
+
+    def test_html_502(self):
+        html = b"<html><body><h1>502 Bad Gateway</h1></body></html>"
+        self.assertEqual(self.poll([(502, "text/html", html)]), [polling.SERVER_ERROR])
+
+    def test_html_200(self):
+        html = b"<html><body>Maintenance</body></html>"
+        self.assertEqual(self.poll([(200, "text/html", html)]), [polling.SERVER_ERROR])
+
+
+if __name__ == "__main__":
+    unittest.main()
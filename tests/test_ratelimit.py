@@ -0,0 +1,66 @@
+"""
+## This module's purpose is to check how `silbot.ratelimit` spreads messages between chats
+"""
+
+import unittest
+
+from silbot import ratelimit
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def backlog(self, limiter, chat_id, count):
+        return [limiter.reserve("sendMessage", {"chat_id": chat_id, "text": "Hi"}) for _ in range(count)]
+
+    def test_chat_backlog_keeps_order(self):
+        limiter = ratelimit.RateLimiter()
+        delays = [delay for delay, _ in self.backlog(limiter, 5, 10)]
+        self.assertAlmostEqual(delays[0], 0, places=2)
+        for previous, delay in zip(delays, delays[1:]):
+            self.assertAlmostEqual(delay - previous, 1, places=2)
+
+    def test_chat_backlog_doesnt_delay_other_chats(self):
+        limiter = ratelimit.RateLimiter()
+        self.backlog(limiter, 5, 10)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Hi"})
+        self.assertTrue(reserved)
+        self.assertLess(delay, 0.01)
+
+    def test_booked_request_takes_global_token_when_due(self):
+        limiter = ratelimit.RateLimiter(global_burst=1)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 5, "text": "Hi"})
+        self.assertTrue(reserved)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Hi"})
+        self.assertFalse(reserved)
+        self.assertAlmostEqual(delay, 1 / 30, places=2)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Hi"}, booked=True)
+        self.assertFalse(reserved)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Again"})
+        self.assertAlmostEqual(delay, 1, places=2)
+
+    def test_bulk_ignores_backlog_of_other_chats(self):
+        limiter = ratelimit.RateLimiter()
+        self.backlog(limiter, 5, 10)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Hi"}, ratelimit.BULK)
+        self.assertTrue(reserved)
+        self.assertLess(delay, 0.01)
+
+    def test_bulk_yields_to_sent_interactive_requests(self):
+        limiter = ratelimit.RateLimiter(global_burst=5, bulk_headroom=1)
+        for chat_id in range(1, 5):
+            self.assertTrue(limiter.reserve("sendMessage", {"chat_id": chat_id, "text": "Hi"})[1])
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 6, "text": "Hi"}, ratelimit.BULK)
+        self.assertFalse(reserved)
+        self.assertGreater(delay, 0)
+        self.assertTrue(limiter.reserve("sendMessage", {"chat_id": 7, "text": "Hi"})[1])
+
+    def test_bulk_yields_to_interactive_backlog_of_its_chat(self):
+        limiter = ratelimit.RateLimiter()
+        self.backlog(limiter, 5, 3)
+        delay, reserved = limiter.reserve("sendMessage", {"chat_id": 5, "text": "Hi"}, ratelimit.BULK)
+        self.assertFalse(reserved)
+        self.assertAlmostEqual(delay, 3, places=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
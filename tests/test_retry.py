@@ -0,0 +1,39 @@
+"""
+## This module's purpose is to check how `silbot.retry` handles the failures of botAPI
+"""
+
+import unittest
+
+from silbot import codec, retry
+from silbot.response import BotAPIResponse
+
+HTML = b"<html><head><title>502 Bad Gateway</title></head><body><center><h1>502 Bad Gateway</h1></center></body></html>"
+
+
+class ServerErrorTest(unittest.TestCase):
+
+    def test_html_body(self):
+        response = BotAPIResponse(retry.serverError(502, HTML))
+        self.assertFalse(response.ok)
+        self.assertEqual(response.error_code, 502)
+        self.assertEqual(response.description, "Bad Gateway")
+
+    def test_unknown_status(self):
+        self.assertEqual(BotAPIResponse(retry.serverError(599, b"")).error_code, 599)
+
+    def test_botapi_body(self):
+        body = codec.dumpBytes({"ok": False, "error_code": 500, "description": "Internal Server Error: restart"})
+        self.assertIs(retry.serverError(500, body), body)
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def test_unpin_is_not_repeated_after_read_errors(self):
+        policy = retry.RetryPolicy()
+        self.assertFalse(policy.shouldRetry("unpinChatMessage", retry.READ, 0))
+        self.assertTrue(policy.shouldRetry("unpinChatMessage", retry.CONNECT, 0))
+        self.assertTrue(policy.shouldRetry("unpinAllChatMessages", retry.READ, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+## This module's purpose is to check that silbot.types objects are serialized with their botAPI field names
+"""
+
+import unittest
+
+from silbot import helper, types
+
+USER = {"id": 123456789, "is_bot": False, "first_name": "Mario", "username": "mariorossi"}
+
+
+class RoundTripTest(unittest.TestCase):
+
+    def roundTrip(self, cls, dictionary, lazy=False):
+        return helper.toDict(cls(dictionary, lazy))
+
+    def test_message_entity_user(self):
+        entity = {"type": "text_mention", "offset": 0, "length": 5, "user": USER}
+        for lazy in (False, True):
+            parsed = types.MessageEntity(entity, lazy)
+            self.assertEqual(parsed.user.id, USER["id"])
+            self.assertEqual(self.roundTrip(types.MessageEntity, entity, lazy), entity)
+
+    def test_chat_member_user(self):
+        member = {"status": "member", "user": USER}
+        for lazy in (False, True):
+            parsed = types.ChatMemberMember(member, lazy)
+            self.assertEqual(parsed.user.first_name, "Mario")
+            self.assertEqual(self.roundTrip(types.ChatMemberMember, member, lazy), member)
+        administrator = {"status": "administrator", "user": USER, "can_be_edited": False, "is_anonymous": False,
+                         "can_manage_chat": True, "can_delete_messages": True}
+        self.assertEqual(self.roundTrip(types.ChatMemberAdministrator, administrator), administrator)
+
+    def test_message_from(self):
+        message = {"message_id": 1, "from": USER, "chat": {"id": 1, "type": "private"}, "date": 0, "text": "Hi"}
+        for lazy in (False, True):
+            parsed = types.Message(message, lazy)
+            self.assertEqual(parsed.user.id, USER["id"])
+            self.assertEqual(self.roundTrip(types.Message, message, lazy), message)
+
+    def test_custom_attributes(self):
+        message = {"message_id": 1, "chat": {"id": 1, "type": "private"}, "date": 0, "new_field": 5}
+        for lazy in (False, True):
+            parsed = types.Message(message, lazy)
+            parsed.handled = True
+            self.assertTrue(parsed.handled)
+            self.assertEqual(parsed.new_field, 5)
+            self.assertEqual(vars(parsed), {"new_field": 5, "handled": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
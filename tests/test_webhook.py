@@ -0,0 +1,81 @@
+"""
+## This module's purpose is to check which requests are answered in the webhook response
+"""
+
+import asyncio
+import io
+import threading
+import unittest
+
+from silbot import botapi, dispatcher, helper, webhook
+
+
+class WebhookReplyTest(unittest.TestCase):
+
+    def test_takes_json_requests(self):
+        reply = botapi.WebhookReply()
+        self.assertTrue(reply.take("sendMessage", {"chat_id": 1, "text": "Hi", "parse_mode": None}))
+        self.assertEqual(reply.answer, {"chat_id": 1, "text": "Hi", "method": "sendMessage"})
+        self.assertFalse(reply.take("sendMessage", {"chat_id": 1, "text": "Again"}))
+
+    def test_refuses_uploads(self):
+        reply = botapi.WebhookReply()
+        self.assertFalse(reply.take("sendPhoto", {"chat_id": 1, "photo": helper.inputFile(b"data")}))
+        self.assertFalse(reply.take("sendDocument", {"chat_id": 1, "document": helper.toDict(io.BytesIO(b"data"))}))
+        self.assertIsNone(reply.answer)
+        self.assertTrue(reply.take("sendPhoto", {"chat_id": 1, "photo": "FILEID"}))
+
+
+class FakeRequest:
+
+    def __init__(self, body, headers=None):
+        self.body = body
+        self.headers = headers if headers is not None else {}
+
+    async def read(self):
+        return self.body
+
+
+class WebhookServerTest(unittest.TestCase):
+
+    def test_full_queue_does_not_block_the_server(self):
+        release = threading.Event()
+        queue = dispatcher.UpdateDispatcher(workers=1, queue_size=1)
+        server = webhook.WebhookServer(botapi.BotApi("123:TOKEN"), lambda update, bot: release.wait(5), dispatcher=queue)
+
+        async def run():
+            requests = []
+            for update_id in range(3):
+                body = ('{"update_id": %d}' % update_id).encode()
+                requests.append(asyncio.ensure_future(server.handle(FakeRequest(body))))
+                await asyncio.sleep(0.05)
+            # The third update waits for space in the queue, the event loop keeps running meanwhile
+            self.assertFalse(requests[2].done())
+            release.set()
+            return await asyncio.wait_for(asyncio.gather(*requests), 5)
+
+        responses = asyncio.run(run())
+        queue.stop()
+        self.assertEqual([response.status for response in responses], [200, 200, 200])
+        self.assertEqual(queue.submitted, 3)
+
+    def test_refuses_invalid_requests(self):
+        handled = []
+        server = webhook.WebhookServer(botapi.BotApi("123:TOKEN"), lambda update, bot: handled.append(update),
+                                       secret_token="s3cret")
+
+        async def status(body, token):
+            headers = {"X-Telegram-Bot-Api-Secret-Token": token}
+            return (await server.handle(FakeRequest(body, headers))).status
+
+        self.assertEqual(asyncio.run(status(b'{"update_id": 1}', "s\u00e8cret")), 403)
+        self.assertEqual(asyncio.run(status(b'{"update_id": 1}', "s\udce8cret")), 403)
+        self.assertEqual(asyncio.run(status(b"[1, 2]", "s3cret")), 400)
+        self.assertEqual(asyncio.run(status(b'"update"', "s3cret")), 400)
+        self.assertEqual(handled, [])
+        self.assertEqual(asyncio.run(status(b'{"update_id": 1}', "s3cret")), 200)
+        self.assertEqual(len(handled), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()